@@ -0,0 +1,40 @@
+import hashlib
+from django.conf import settings
+from django.db import transaction
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from caching.tiered import TieredCache, bump_generation
+
+
+# Önbellekteki kullanıcı satırı parola özetini de içerir; paylaşılan katmana yazmak ayara bağlıdır.
+token_cache = TieredCache(shared_alias='default' if settings.AUTH_TOKEN_SHARED_CACHE else None)
+
+
+def _token_digest(key):
+    # Anahtarın kendisi önbellek anahtarlarında (ör. dosya adlarında) görünmez.
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:40]
+
+
+def invalidate_token(key):
+    digest = _token_digest(key)
+    transaction.on_commit(lambda: bump_generation('token', digest))
+
+
+def invalidate_user_tokens(user):
+    for key in Token.objects.filter(user_id=user.pk).values_list('key', flat=True):
+        invalidate_token(key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    # Token + kullanıcı satırı kısa TTL ile önbellekten okunur. Her token'ın bir nesli vardır;
+    # çıkış, parola sıfırlama ve kullanıcı güncellemesi nesli artırır, böylece tüm süreçlerde hemen geçersiz olur.
+
+    def authenticate_credentials(self, key):
+        digest = _token_digest(key)
+        return token_cache.fetch(
+            'auth',
+            (digest,),
+            lambda: super(CachedTokenAuthentication, self).authenticate_credentials(key),
+            settings.AUTH_TOKEN_CACHE_TTL,
+            [('token', digest)],
+        )
@@ -0,0 +1,224 @@
+import logging
+import math
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from content.models import Book, Movie, Genre
+from users.models import CustomUser
+
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class EndpointScenarios:
+    # Her senaryo, verilen rastgele üreteçle tekrarlanabilir bir URL üretir.
+    def __init__(self, rng, user_ids):
+        self.rng = rng
+        self.user_ids = user_ids
+        self.book_ids = list(Book.objects.values_list('pk', flat=True)[:5000])
+        self.movie_ids = list(Movie.objects.values_list('pk', flat=True)[:5000])
+        self.titles = list(Book.objects.values_list('title', flat=True)[:1000]) + list(Movie.objects.values_list('title', flat=True)[:1000])
+        self.genres = list(Genre.objects.values_list('name', flat=True)[:100])
+        self.years = list(Book.objects.exclude(publication_year__isnull=True).values_list('publication_year', flat=True).distinct()[:100])
+
+    def available(self):
+        return {
+            'feed': self.feed,
+            'search': self.search,
+            'discover': self.discover,
+            'filter': self.filter,
+            'content_detail': self.content_detail,
+            'profile': self.profile,
+        }
+
+    def feed(self):
+        return '/api/feed/'
+
+    def search(self):
+        words = self.rng.choice(self.titles).split() if self.titles else ['a']
+        return f"/api/search/?q={self.rng.choice(words)[:10]}"
+
+    def discover(self):
+        return f"/api/discover/?type={self.rng.choice(('popular', 'top_rated', 'trending'))}"
+
+    def filter(self):
+        params = []
+        if self.genres and self.rng.random() < 0.7:
+            params.append(f"genre={self.rng.choice(self.genres)}")
+        if self.years and self.rng.random() < 0.5:
+            params.append(f"year={self.rng.choice(self.years)}")
+        if self.rng.random() < 0.3:
+            params.append(f"min_score={self.rng.randint(1, 9)}")
+        return '/api/filter/?' + '&'.join(params)
+
+    def content_detail(self):
+        if self.movie_ids and (not self.book_ids or self.rng.random() < 0.5):
+            return f"/api/content/movie/{self.rng.choice(self.movie_ids)}/"
+        return f"/api/content/book/{self.rng.choice(self.book_ids)}/"
+
+    def profile(self):
+        return f"/api/profile/user/{self.rng.choice(self.user_ids)}/"
+
+
+class TestClientTransport:
+    # İstekler süreç içinde Django test istemcisiyle yapılır; sorgu sayıları da ölçülür.
+    name = 'test_client'
+
+    def __init__(self, host):
+        self.host = host
+        self._local = threading.local()
+
+    def request(self, user, url):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = self._local.client = APIClient(SERVER_NAME=self.host)
+        client.force_authenticate(user)
+
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            response = client.get(url)
+            elapsed = time.perf_counter() - started
+        return response.status_code, elapsed, len(context.captured_queries)
+
+
+class HttpTransport:
+    # Çalışan bir sunucuya gerçek HTTP istekleri; sorgu sayısı bu modda ölçülemez.
+    name = 'http'
+
+    def __init__(self, base_url):
+        import requests
+
+        self.base_url = base_url.rstrip('/')
+        self.session = requests.Session()
+        self.tokens = {}
+
+    def request(self, user, url):
+        token = self.tokens.get(user.pk)
+        if token is None:
+            token = self.tokens[user.pk] = Token.objects.get_or_create(user=user)[0].key
+
+        started = time.perf_counter()
+        response = self.session.get(self.base_url + url, headers={'Authorization': f"Token {token}"})
+        elapsed = time.perf_counter() - started
+        return response.status_code, elapsed, None
+
+
+def run_benchmark(transport, endpoints, requests_per_endpoint=200, warmup=20, concurrency=1, users=50, seed=1, log=logger.info):
+    rng = random.Random(seed)
+    candidates = list(
+        CustomUser.objects.filter(following_count__gt=0).order_by('-following_count', 'pk').values_list('pk', flat=True)[:users * 10]
+    ) or list(CustomUser.objects.order_by('pk').values_list('pk', flat=True)[:users * 10])
+    if not candidates:
+        raise ValueError("Benchmark için kullanıcı bulunamadı.")
+    sampled_users = CustomUser.objects.in_bulk(rng.sample(candidates, min(users, len(candidates))))
+    user_list = [sampled_users[pk] for pk in sorted(sampled_users)]
+
+    scenarios = EndpointScenarios(rng, [user.pk for user in user_list]).available()
+    unknown = set(endpoints) - set(scenarios)
+    if unknown:
+        raise ValueError(f"Bilinmeyen uç nokta: {', '.join(sorted(unknown))}")
+
+    results = {}
+    for endpoint in endpoints:
+        # İstek listesi önceden üretilir; böylece eşzamanlılıktan bağımsız olarak aynı istekler yapılır.
+        plan = [(rng.choice(user_list), scenarios[endpoint]()) for _ in range(warmup + requests_per_endpoint)]
+        for user, url in plan[:warmup]:
+            transport.request(user, url)
+
+        def execute(item):
+            try:
+                return transport.request(*item)
+            finally:
+                close_old_connections()
+
+        log(f"{endpoint}: {requests_per_endpoint} istek...")
+        started = time.perf_counter()
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                samples = list(executor.map(execute, plan[warmup:]))
+        else:
+            samples = [transport.request(user, url) for user, url in plan[warmup:]]
+        wall_time = time.perf_counter() - started
+
+        results[endpoint] = summarize(samples, wall_time)
+
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': timezone.now().isoformat(),
+            'transport': transport.name,
+            'database': connection.vendor,
+            'requests_per_endpoint': requests_per_endpoint,
+            'warmup': warmup,
+            'concurrency': concurrency,
+            'users': len(user_list),
+            'seed': seed,
+        },
+        'endpoints': results,
+    }
+
+
+def summarize(samples, wall_time):
+    latencies = [elapsed * 1000 for _, elapsed, _ in samples]
+    query_counts = [queries for _, _, queries in samples if queries is not None]
+    errors = sum(1 for status_code, _, _ in samples if status_code >= 400)
+
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput_rps': round(len(samples) / wall_time, 2) if wall_time else None,
+        'latency_ms': {
+            'mean': round(sum(latencies) / len(latencies), 2) if latencies else None,
+            'p50': round(percentile(latencies, 0.50), 2) if latencies else None,
+            'p95': round(percentile(latencies, 0.95), 2) if latencies else None,
+            'p99': round(percentile(latencies, 0.99), 2) if latencies else None,
+            'max': round(max(latencies), 2) if latencies else None,
+        },
+        'queries': {
+            'mean': round(sum(query_counts) / len(query_counts), 2),
+            'p50': percentile(query_counts, 0.50),
+            'max': max(query_counts),
+        } if query_counts else None,
+    }
+
+
+def compare(current, baseline):
+    # İki benchmark çıktısı arasındaki p50/p95 gecikme ve ortalama sorgu farkları.
+    rows = []
+    for endpoint, stats in current['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(endpoint)
+        if not previous:
+            continue
+        row = {'endpoint': endpoint}
+        for key in ('p50', 'p95'):
+            before, after = previous['latency_ms'][key], stats['latency_ms'][key]
+            row[key] = (before, after, round((after - before) / before * 100, 1) if before else None)
+        if stats['queries'] and previous.get('queries'):
+            row['queries'] = (previous['queries']['mean'], stats['queries']['mean'])
+        rows.append(row)
+    return rows
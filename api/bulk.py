@@ -0,0 +1,267 @@
+from collections import Counter, defaultdict
+from operator import itemgetter
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+from caching.tiered import bump_generation, bump_generations
+from content.aggregates import refresh_rating_aggregates
+from content.models import Rating, UserList, ListItem
+from feed.activities import record_activities
+from feed.counters import recount_follow_counts
+from feed.models import Follow
+from jobs.dispatch import enqueue
+from social_media_project.db import upsert_options
+from users.models import CustomUser
+from .serializers import BulkRatingItemSerializer, BulkListItemSerializer, BulkFollowItemSerializer
+
+
+BATCH_SIZE = 1000
+
+
+class BulkResult:
+    # Her satır için ya bir sonuç (id, durum) ya da hata kaydı tutulur; satırlar istekteki sırasıyla (index) raporlanır.
+    def __init__(self):
+        self.items = []
+        self.errors = []
+
+    def add(self, index, pk, status):
+        self.items.append({'index': index, 'id': pk, 'status': status})
+
+    def reject(self, index, errors):
+        self.errors.append({'index': index, 'errors': errors})
+
+    def as_dict(self):
+        counts = Counter(item['status'] for item in self.items)
+        return {
+            'created': counts['created'],
+            'updated': counts['updated'],
+            'unchanged': counts['unchanged'],
+            'failed': len(self.errors),
+            'items': sorted(self.items, key=itemgetter('index')),
+            'errors': sorted(self.errors, key=itemgetter('index')),
+        }
+
+
+def validate_rows(serializer_class, rows, result):
+    # Tek bir serializer örneği tüm satırlar için kullanılır; hatalı satır işlemi durdurmaz, hata olarak raporlanır.
+    serializer = serializer_class()
+    valid = []
+    for index, row in enumerate(rows):
+        try:
+            valid.append((index, serializer.run_validation(row)))
+        except ValidationError as exc:
+            result.reject(index, exc.detail)
+    return valid
+
+
+def _unique_rows(valid, key, result):
+    # Aynı kayıt istekte birden fazla kez geçiyorsa ilk satır kullanılır.
+    seen = {}
+    unique = []
+    for index, data in valid:
+        row_key = key(data)
+        if row_key in seen:
+            result.reject(index, {'non_field_errors': [f"Aynı kayıt {seen[row_key]}. satırda zaten gönderildi."]})
+            continue
+        seen[row_key] = index
+        unique.append((index, data))
+    return unique
+
+
+def _content_key(data):
+    return data['content_type'].pk, data['object_id']
+
+
+def _ids_by_type(valid):
+    ids = defaultdict(set)
+    for _, data in valid:
+        ids[data['content_type']].add(data['object_id'])
+    return ids
+
+
+def _existing_targets(valid, result):
+    # Hedef içerikler tip başına tek sorguyla doğrulanır.
+    found = {
+        content_type.pk: set(content_type.model_class().objects.filter(pk__in=ids).values_list('pk', flat=True))
+        for content_type, ids in _ids_by_type(valid).items()
+    }
+
+    kept = []
+    for index, data in valid:
+        if data['object_id'] in found[data['content_type'].pk]:
+            kept.append((index, data))
+        else:
+            result.reject(index, {'object_id': ["İçerik bulunamadı."]})
+    return kept
+
+
+def _user_ratings(user, ids_by_type):
+    ratings = {}
+    for content_type, ids in ids_by_type.items():
+        for rating in Rating.objects.filter(user=user, content_type=content_type, object_id__in=ids):
+            ratings[(rating.content_type_id, rating.object_id)] = rating
+    return ratings
+
+
+def bulk_rate(user, rows):
+    result = BulkResult()
+    valid = validate_rows(BulkRatingItemSerializer, rows, result)
+    valid = _unique_rows(valid, _content_key, result)
+    valid = _existing_targets(valid, result)
+    ids_by_type = _ids_by_type(valid)
+
+    with transaction.atomic():
+        previous = {key: rating.score for key, rating in _user_ratings(user, ids_by_type).items()}
+        changed = [(index, data) for index, data in valid if previous.get(_content_key(data)) != data['score']]
+
+        # Önceden okunan durum yalnızca raporlama içindir; eşzamanlı eklemeler upsert ile çakışmadan güncellenir.
+        Rating.objects.bulk_create(
+            [
+                Rating(user=user, content_type=data['content_type'], object_id=data['object_id'], score=data['score'])
+                for _, data in changed
+            ],
+            batch_size=BATCH_SIZE,
+            **upsert_options(['user', 'content_type', 'object_id'], ['score']),
+        )
+
+        saved = _user_ratings(user, ids_by_type)
+        created = []
+        for index, data in valid:
+            key = _content_key(data)
+            rating = saved[key]
+            if key not in previous:
+                created.append(rating)
+                result.add(index, rating.pk, 'created')
+            else:
+                result.add(index, rating.pk, 'updated' if previous[key] != data['score'] else 'unchanged')
+
+        # bulk_create post_save tetiklemez; sinyallerin yan etkileri burada toplu olarak yapılır.
+        record_activities(created, batch_size=BATCH_SIZE)
+
+        # Puan özetleri aynı transaction içinde Rating tablosundan yeniden hesaplanır (içerik tipi başına bir UPDATE);
+        # yanıt döndüğünde özetler günceldir, worker beklenmez.
+        targets = defaultdict(set)
+        for _, data in changed:
+            targets[data['content_type'].pk].add(data['object_id'])
+        for content_type_id, object_ids in targets.items():
+            refresh_rating_aggregates(content_type_id, sorted(object_ids))
+
+        if changed:
+            def invalidate():
+                bump_generation('interactions', user.pk)
+                bump_generations(
+                    ('content', content_type_id, object_id)
+                    for content_type_id, object_ids in targets.items() for object_id in object_ids
+                )
+
+            transaction.on_commit(invalidate)
+
+    return result.as_dict()
+
+
+def _list_items(list_ids, ids_by_type):
+    items = {}
+    for content_type, ids in ids_by_type.items():
+        for item in ListItem.objects.filter(list_id__in=list_ids, content_type=content_type, object_id__in=ids):
+            items[(item.list_id, item.content_type_id, item.object_id)] = item
+    return items
+
+
+def bulk_add_list_items(user, rows):
+    result = BulkResult()
+    valid = validate_rows(BulkListItemSerializer, rows, result)
+    valid = _unique_rows(valid, lambda data: (data['list'],) + _content_key(data), result)
+
+    # Yalnızca isteği yapan kullanıcının listelerine eklenebilir.
+    lists = UserList.objects.filter(user=user).in_bulk({data['list'] for _, data in valid})
+    owned = []
+    for index, data in valid:
+        if data['list'] in lists:
+            owned.append((index, data))
+        else:
+            result.reject(index, {'list': ["Liste bulunamadı."]})
+    valid = _existing_targets(owned, result)
+    ids_by_type = _ids_by_type(valid)
+
+    with transaction.atomic():
+        previous = set(_list_items(list(lists), ids_by_type))
+        ListItem.objects.bulk_create(
+            [
+                ListItem(list=lists[data['list']], content_type=data['content_type'], object_id=data['object_id'])
+                for _, data in valid
+                if (data['list'],) + _content_key(data) not in previous
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+        saved = _list_items(list(lists), ids_by_type)
+        created = []
+        for index, data in valid:
+            key = (data['list'],) + _content_key(data)
+            item = saved[key]
+            if key in previous:
+                result.add(index, item.pk, 'unchanged')
+            else:
+                # Aktivitenin sahibi liste üzerinden bulunur; liste her satır için yeniden sorgulanmasın.
+                item.list = lists[item.list_id]
+                created.append(item)
+                result.add(index, item.pk, 'created')
+
+        record_activities(created, batch_size=BATCH_SIZE)
+
+        changed_lists = {item.list_id for item in created}
+        if changed_lists:
+            transaction.on_commit(lambda: bump_generations(('list', list_id) for list_id in changed_lists))
+
+    return result.as_dict()
+
+
+def bulk_follow(user, rows):
+    result = BulkResult()
+    valid = validate_rows(BulkFollowItemSerializer, rows, result)
+    valid = _unique_rows(valid, itemgetter('following'), result)
+
+    existing_users = set(
+        CustomUser.objects.filter(pk__in={data['following'] for _, data in valid}).values_list('pk', flat=True)
+    )
+    kept = []
+    for index, data in valid:
+        if data['following'] == user.pk:
+            result.reject(index, {'following': ["Kendinizi takip edemezsiniz."]})
+        elif data['following'] not in existing_users:
+            result.reject(index, {'following': ["Kullanıcı bulunamadı."]})
+        else:
+            kept.append((index, data))
+    following_ids = [data['following'] for _, data in kept]
+
+    with transaction.atomic():
+        previous = set(Follow.objects.filter(follower=user, following_id__in=following_ids).values_list('following_id', flat=True))
+        Follow.objects.bulk_create(
+            [Follow(follower=user, following_id=following_id) for following_id in following_ids if following_id not in previous],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+        follows = {follow.following_id: follow for follow in Follow.objects.filter(follower=user, following_id__in=following_ids)}
+        created = []
+        for index, data in kept:
+            follow = follows[data['following']]
+            if data['following'] in previous:
+                result.add(index, follow.pk, 'unchanged')
+            else:
+                created.append(follow)
+                result.add(index, follow.pk, 'created')
+
+        if created:
+            # "created" önceden okunan duruma göredir; arada eşzamanlı bir istek aynı takibi eklemiş (ve sayacı
+            # artırmış) olabilir. Sayaçlar bu yüzden delta ile değil, satırlardan yeniden sayılarak yazılır.
+            followed_ids = [follow.following_id for follow in created]
+            recount_follow_counts([user.pk] + followed_ids)
+
+            record_activities(created, batch_size=BATCH_SIZE)
+            enqueue('feed.backfill_follows', follow_ids=[follow.pk for follow in created])
+            transaction.on_commit(
+                lambda: bump_generations([('user', user.pk)] + [('user', following_id) for following_id in followed_ids])
+            )
+
+    return result.as_dict()
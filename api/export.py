@@ -0,0 +1,128 @@
+import csv
+import io
+from collections import defaultdict
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F
+from content.models import Rating, Review, Reply, UserList, ListItem
+from content.types import content_types
+from feed.models import Follow
+from social_media_project.db import keyset_chunks
+
+
+EXPORT_TYPES = ('rating', 'review', 'reply', 'list', 'list_item', 'follow')
+
+CSV_FIELDS = (
+    'type', 'id', 'content_type', 'object_id', 'title', 'score', 'text', 'name', 'is_predefined',
+    'list_id', 'following_id', 'following_username', 'created_at', 'updated_at',
+)
+
+
+def _resolve_targets(rows, with_titles=True):
+    # GFK hedefleri parça başına, tip başına tek sorguyla çözülür.
+    titles = {}
+    if with_titles:
+        ids_by_type = defaultdict(set)
+        for row in rows:
+            ids_by_type[row['content_type_id']].add(row['object_id'])
+        for content_type_id, object_ids in ids_by_type.items():
+            model = content_types.model_for_id(content_type_id)
+            if model is None:
+                continue
+            for pk, title in model.objects.filter(pk__in=object_ids).values_list('pk', 'title'):
+                titles[(content_type_id, pk)] = title
+
+    for row in rows:
+        content_type_id = row.pop('content_type_id')
+        row['content_type'] = content_types.name_for_id(content_type_id)
+        if with_titles:
+            row['title'] = titles.get((content_type_id, row['object_id']))
+    return rows
+
+
+def _export_ratings(user, chunk_size):
+    for rows in keyset_chunks(Rating.objects.filter(user=user), chunk_size, 'content_type_id', 'object_id', 'score', 'created_at'):
+        yield _resolve_targets(rows)
+
+
+def _export_reviews(user, chunk_size):
+    fields = ('content_type_id', 'object_id', 'text', 'created_at', 'updated_at')
+    for rows in keyset_chunks(Review.objects.filter(user=user), chunk_size, *fields):
+        yield _resolve_targets(rows)
+
+
+def _export_replies(user, chunk_size):
+    for rows in keyset_chunks(Reply.objects.filter(user=user), chunk_size, 'content_type_id', 'object_id', 'text', 'created_at'):
+        yield _resolve_targets(rows, with_titles=False)
+
+
+def _export_lists(user, chunk_size):
+    yield from keyset_chunks(UserList.objects.filter(user=user), chunk_size, 'name', 'is_predefined', 'created_at')
+
+
+def _export_list_items(user, chunk_size):
+    items = ListItem.objects.filter(list__user=user)
+    for rows in keyset_chunks(items, chunk_size, 'list_id', 'content_type_id', 'object_id', created_at=F('added_at')):
+        yield _resolve_targets(rows)
+
+
+def _export_follows(user, chunk_size):
+    yield from keyset_chunks(
+        Follow.objects.filter(follower=user), chunk_size, 'following_id', 'created_at',
+        following_username=F('following__username'),
+    )
+
+
+EXPORTERS = {
+    'rating': _export_ratings,
+    'review': _export_reviews,
+    'reply': _export_replies,
+    'list': _export_lists,
+    'list_item': _export_list_items,
+    'follow': _export_follows,
+}
+
+
+def export_user_data(user, types=EXPORT_TYPES, chunk_size=1000):
+    # Kayıtlar chunk_size büyüklüğünde parçalar halinde üretilir; bellekte aynı anda tek parça tutulur.
+    for record_type in types:
+        for rows in EXPORTERS[record_type](user, chunk_size):
+            yield [{'type': record_type, **row} for row in rows]
+
+
+def render_ndjson(chunks):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for rows in chunks:
+        yield ''.join(encoder.encode(row) + '\n' for row in rows)
+
+
+def render_csv(chunks):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS)
+
+    def flush():
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return value
+
+    writer.writeheader()
+    yield flush()
+    for rows in chunks:
+        writer.writerows(rows)
+        yield flush()
+
+
+EXPORT_FORMATS = {
+    'ndjson': (render_ndjson, 'application/x-ndjson; charset=utf-8'),
+    'csv': (render_csv, 'text/csv; charset=utf-8'),
+}
+
+
+def parse_export_types(value):
+    if not value:
+        return EXPORT_TYPES
+    types = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = sorted(set(types) - set(EXPORT_TYPES))
+    if unknown:
+        raise ValueError(f"Bilinmeyen dışa aktarma türü: {', '.join(unknown)}. Geçerli türler: {', '.join(EXPORT_TYPES)}.")
+    return tuple(name for name in EXPORT_TYPES if name in types)
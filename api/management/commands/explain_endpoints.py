@@ -0,0 +1,112 @@
+import re
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from content.models import Book, Movie
+from users.models import CustomUser
+
+
+SQLITE_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?"?(\w+)"?(?: AS \w+)?$')
+
+
+def endpoint_urls(user):
+    urls = [
+        '/api/feed/',
+        f'/api/profile/user/{user.pk}/',
+        f'/api/profile/user/{user.pk}/activities/',
+        '/api/ratings/',
+        '/api/reviews/',
+        '/api/follows/',
+        '/api/lists/',
+        '/api/listitems/',
+        '/api/library/',
+        '/api/discover/?type=popular',
+        '/api/discover/?type=top_rated',
+        '/api/discover/?type=trending',
+    ]
+
+    book = Book.objects.order_by('pk').first()
+    if book is not None:
+        urls.append(f'/api/content/book/{book.pk}/')
+        urls.append(f'/api/search/?q={book.title.split()[0]}')
+    movie = Movie.objects.order_by('pk').first()
+    if movie is not None:
+        urls.append(f'/api/content/movie/{movie.pk}/')
+        if movie.release_date:
+            urls.append(f'/api/filter/?year={movie.release_date.year}&min_score=1')
+    return urls
+
+
+def explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+        columns = [column[0] for column in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def full_scans(plan, table_names):
+    # Her veritabanının plan çıktısında tam tablo taraması farklı görünür.
+    # Türetilmiş tablolar (alt sorgular) gerçek tablo olmadığı için sayılmaz.
+    tables = []
+    for row in plan:
+        if connection.vendor == 'sqlite':
+            match = SQLITE_FULL_SCAN.match(row.get('detail', ''))
+            if match:
+                tables.append(match.group(1))
+        elif connection.vendor == 'mysql':
+            if row.get('type') == 'ALL':
+                tables.append(row.get('table'))
+        elif connection.vendor == 'postgresql':
+            for line in row.values():
+                match = re.search(r'Seq Scan on (\w+)', str(line))
+                if match:
+                    tables.append(match.group(1))
+    return [table for table in tables if table in table_names]
+
+
+class Command(BaseCommand):
+    help = "API uç noktalarının ürettiği sorguları EXPLAIN ile inceler ve tam tablo taramalarını raporlar."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help="İstekleri bu ID'ye sahip kullanıcı adına yap (varsayılan: en çok takip eden kullanıcı).")
+        parser.add_argument('--allow', action='append', default=[], help="Tam taraması kabul edilen tablo (birden fazla verilebilir).")
+        parser.add_argument('--host', default='localhost', help="İsteklerde kullanılacak Host başlığı.")
+
+    def handle(self, *args, **options):
+        if options['user']:
+            user = CustomUser.objects.filter(pk=options['user']).first()
+        else:
+            user = CustomUser.objects.order_by('-following_count', 'pk').first()
+        if user is None:
+            raise CommandError("Kullanıcı bulunamadı; önce veritabanını örnek verilerle doldurun.")
+
+        client = APIClient(SERVER_NAME=options['host'])
+        client.force_authenticate(user)
+        allowed = set(options['allow'])
+        table_names = set(connection.introspection.table_names())
+        problems = 0
+
+        for url in endpoint_urls(user):
+            with CaptureQueriesContext(connection) as context:
+                response = client.get(url)
+
+            flagged = []
+            for query in context.captured_queries:
+                sql = query['sql']
+                if not sql.lstrip().upper().startswith('SELECT'):
+                    continue
+                tables = [table for table in full_scans(explain(sql), table_names) if table not in allowed]
+                if tables:
+                    flagged.append((tables, sql))
+
+            self.stdout.write(f"{url} -> {response.status_code}, {len(context.captured_queries)} sorgu")
+            for tables, sql in flagged:
+                self.stdout.write(self.style.WARNING(f"  tam tarama: {', '.join(sorted(set(tables)))}"))
+                self.stdout.write(f"    {sql[:300]}")
+            problems += len(flagged)
+
+        if problems:
+            raise CommandError(f"{problems} sorguda tam tablo taraması bulundu.")
+
+        self.stdout.write(self.style.SUCCESS("Tam tablo taraması bulunmadı."))
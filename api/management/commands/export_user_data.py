@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from api.export import EXPORT_FORMATS, EXPORT_TYPES, export_user_data, parse_export_types
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "Bir kullanıcının puan, yorum, yanıt, liste ve takiplerini sabit bellekle NDJSON ya da CSV olarak dışa aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('user', help="Kullanıcı adı ya da kimliği.")
+        parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='ndjson')
+        parser.add_argument('--types', help=f"Virgülle ayrılmış kayıt türleri ({', '.join(EXPORT_TYPES)}).")
+        parser.add_argument('--output', help="Yazılacak dosya; verilmezse standart çıktıya yazılır.")
+        parser.add_argument('--chunk-size', type=int, default=settings.EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        lookup = {'pk': int(options['user'])} if options['user'].isdigit() else {'username': options['user']}
+        user = CustomUser.objects.filter(**lookup).first()
+        if user is None:
+            raise CommandError(f"Kullanıcı bulunamadı: {options['user']}")
+
+        try:
+            types = parse_export_types(options['types'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        render, _ = EXPORT_FORMATS[options['format']]
+        chunks = render(export_user_data(user, types, chunk_size=options['chunk_size']))
+
+        if not options['output']:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+
+        with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+            for chunk in chunks:
+                output.write(chunk)
+        self.stderr.write(self.style.SUCCESS(f"{user.username} için dışa aktarma {options['output']} dosyasına yazıldı."))
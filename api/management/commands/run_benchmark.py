@@ -0,0 +1,69 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from api.benchmark import HttpTransport, TestClientTransport, compare, run_benchmark
+
+
+DEFAULT_ENDPOINTS = ['feed', 'search', 'discover', 'filter', 'content_detail', 'profile']
+
+
+class Command(BaseCommand):
+    help = "API uç noktalarını tekrarlanabilir bir iş yüküyle çalıştırır; gecikme yüzdelikleri, throughput ve sorgu sayılarını JSON olarak raporlar."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--endpoints', nargs='+', default=DEFAULT_ENDPOINTS, help=f"Çalıştırılacak senaryolar ({', '.join(DEFAULT_ENDPOINTS)}).")
+        parser.add_argument('--requests', type=int, default=200, help="Uç nokta başına ölçülen istek sayısı.")
+        parser.add_argument('--warmup', type=int, default=20, help="Ölçüme dahil edilmeyen ısınma isteği sayısı.")
+        parser.add_argument('--concurrency', type=int, default=1)
+        parser.add_argument('--users', type=int, default=50, help="İstek yapacak örnek kullanıcı sayısı.")
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--base-url', help="Verilirse istekler bu adreste çalışan sunucuya HTTP ile yapılır.")
+        parser.add_argument('--host', default='localhost', help="Test istemcisi modunda kullanılacak Host başlığı.")
+        parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası.")
+        parser.add_argument('--compare', help="Karşılaştırılacak önceki benchmark JSON dosyası.")
+
+    def handle(self, *args, **options):
+        if options['base_url']:
+            transport = HttpTransport(options['base_url'])
+        else:
+            transport = TestClientTransport(options['host'])
+
+        try:
+            report = run_benchmark(
+                transport,
+                options['endpoints'],
+                requests_per_endpoint=options['requests'],
+                warmup=options['warmup'],
+                concurrency=options['concurrency'],
+                users=options['users'],
+                seed=options['seed'],
+                log=self.stdout.write,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        for endpoint, stats in report['endpoints'].items():
+            latency = stats['latency_ms']
+            queries = f", sorgu ort. {stats['queries']['mean']}" if stats['queries'] else ""
+            self.stdout.write(
+                f"{endpoint:16} p50 {latency['p50']} ms, p95 {latency['p95']} ms, p99 {latency['p99']} ms, "
+                f"{stats['throughput_rps']} istek/sn, {stats['errors']} hata{queries}"
+            )
+
+        if options['compare']:
+            with open(options['compare'], encoding='utf-8') as baseline_file:
+                baseline = json.load(baseline_file)
+            self.stdout.write(f"Karşılaştırma ({baseline['meta'].get('revision')} -> {report['meta']['revision']}):")
+            for row in compare(report, baseline):
+                p50_before, p50_after, p50_change = row['p50']
+                p95_before, p95_after, p95_change = row['p95']
+                line = f"  {row['endpoint']:16} p50 {p50_before} -> {p50_after} ms ({p50_change}%), p95 {p95_before} -> {p95_after} ms ({p95_change}%)"
+                if 'queries' in row:
+                    line += f", sorgu {row['queries'][0]} -> {row['queries'][1]}"
+                self.stdout.write(line)
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as output_file:
+                json.dump(report, output_file, indent=2, ensure_ascii=False)
+            self.stdout.write(self.style.SUCCESS(f"Sonuçlar {options['output']} dosyasına yazıldı."))
+        else:
+            self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
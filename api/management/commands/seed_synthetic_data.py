@@ -0,0 +1,55 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from api.synthetic import SyntheticDataGenerator
+
+
+class Command(BaseCommand):
+    help = "Yük testi ve benchmark için tekrarlanabilir sentetik veri (kullanıcı, takip grafı, içerik, etkileşim) üretir."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=1000)
+        parser.add_argument('--books', type=int, default=500)
+        parser.add_argument('--movies', type=int, default=500)
+        parser.add_argument('--follows-per-user', type=int, default=20, help="Kullanıcı başına ortalama takip sayısı.")
+        parser.add_argument('--ratings-per-user', type=int, default=30, help="Kullanıcı başına ortalama puan sayısı.")
+        parser.add_argument('--review-ratio', type=float, default=0.3, help="Yorum da yazılan puanların oranı.")
+        parser.add_argument('--likes-per-item', type=int, default=3, help="Puan/yorum başına ortalama beğeni sayısı.")
+        parser.add_argument('--replies-per-review', type=float, default=0.5, help="Yorum başına ortalama yanıt sayısı.")
+        parser.add_argument('--list-items-per-user', type=int, default=5)
+        parser.add_argument('--days', type=int, default=90, help="Etkileşimlerin yayılacağı geçmiş gün sayısı.")
+        parser.add_argument('--alpha', type=float, default=1.1, help="Popülerlik dağılımının (power-law) üssü.")
+        parser.add_argument('--prefix', default='bench_', help="Üretilen kullanıcı adları ve kitap ID'leri için önek.")
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--skip-timelines', action='store_true', help="Materyalize akışları oluşturma.")
+        parser.add_argument('--flush', action='store_true', help="Aynı önekle daha önce üretilmiş verileri önce sil.")
+
+    def handle(self, *args, **options):
+        generator = SyntheticDataGenerator(
+            users=options['users'],
+            books=options['books'],
+            movies=options['movies'],
+            follows_per_user=options['follows_per_user'],
+            ratings_per_user=options['ratings_per_user'],
+            review_ratio=options['review_ratio'],
+            likes_per_item=options['likes_per_item'],
+            replies_per_review=options['replies_per_review'],
+            list_items_per_user=options['list_items_per_user'],
+            days=options['days'],
+            alpha=options['alpha'],
+            prefix=options['prefix'],
+            seed=options['seed'],
+            batch_size=options['batch_size'],
+            build_timelines=not options['skip_timelines'],
+            log=self.stdout.write,
+        )
+
+        if generator.exists():
+            if not options['flush']:
+                raise CommandError(f"'{options['prefix']}' önekli veriler zaten var; silmek için --flush kullanın.")
+            self.stdout.write("Önceki sentetik veriler siliniyor...")
+            generator.flush()
+
+        summary = generator.run()
+        self.stdout.write(json.dumps(summary, indent=2))
+        self.stdout.write(self.style.SUCCESS("Sentetik veri üretildi."))
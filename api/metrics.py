@@ -0,0 +1,91 @@
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+from django.db import connections
+
+
+class QueryRecorder:
+    # connection.execute_wrapper ile DEBUG kapalıyken de sorgu sayısı ve süresi toplanır.
+    def __init__(self):
+        self.signatures = Counter()
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.signatures[sql] += 1
+
+    def duplicates(self):
+        # Aynı SQL kalıbı birden fazla çalıştıysa (N+1 belirtisi) fazlalık sayılır.
+        return {sql: total for sql, total in self.signatures.items() if total > 1}
+
+    def record(self):
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+        return stack
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def add(self, view_name, sample):
+        with self._lock:
+            stats = self._views.setdefault(view_name, {
+                'requests': 0,
+                'over_budget': 0,
+                'queries': 0,
+                'max_queries': 0,
+                'duplicate_queries': 0,
+                'db_ms': 0.0,
+                'view_ms': 0.0,
+                'renderer_ms': 0.0,
+                'total_ms': 0.0,
+                'max_ms': 0.0,
+            })
+            stats['requests'] += 1
+            stats['over_budget'] += int(sample['over_budget'])
+            stats['queries'] += sample['queries']
+            stats['max_queries'] = max(stats['max_queries'], sample['queries'])
+            stats['duplicate_queries'] += sample['duplicate_queries']
+            stats['db_ms'] += sample['db_ms']
+            stats['view_ms'] += sample['view_ms']
+            stats['renderer_ms'] += sample['renderer_ms']
+            stats['total_ms'] += sample['total_ms']
+            stats['max_ms'] = max(stats['max_ms'], sample['total_ms'])
+
+    def snapshot(self):
+        with self._lock:
+            views = {name: dict(stats) for name, stats in self._views.items()}
+
+        for stats in views.values():
+            requests = stats['requests']
+            stats['avg_queries'] = round(stats['queries'] / requests, 2)
+            stats['avg_db_ms'] = round(stats['db_ms'] / requests, 2)
+            stats['avg_view_ms'] = round(stats['view_ms'] / requests, 2)
+            stats['avg_renderer_ms'] = round(stats['renderer_ms'] / requests, 2)
+            stats['avg_ms'] = round(stats['total_ms'] / requests, 2)
+            for key in ('db_ms', 'view_ms', 'renderer_ms', 'total_ms', 'max_ms'):
+                stats[key] = round(stats[key], 2)
+        return views
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = MetricsRegistry()
+
+
+def query_budget(view_func):
+    # DRF as_view() sınıfı view_class/cls olarak saklar; bütçe view sınıfında query_budget ile tanımlanır.
+    view_class = getattr(view_func, 'view_class', None) or getattr(view_func, 'cls', None)
+    return getattr(view_class, 'query_budget', None)
@@ -0,0 +1,73 @@
+import json
+import logging
+import time
+from django.conf import settings
+from .metrics import QueryRecorder, query_budget, registry
+
+
+logger = logging.getLogger('api.metrics')
+
+
+class QueryMetricsMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.API_METRICS_ENABLED or not request.path.startswith(settings.API_METRICS_PATH_PREFIX):
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with recorder.record():
+            response = self.get_response(request)
+        total_ms = (time.perf_counter() - started) * 1000
+
+        match = request.resolver_match
+        view_name = match.view_name if match else 'unresolved'
+        budget = query_budget(match.func) if match else None
+        duplicates = recorder.duplicates()
+        view_ms = renderer_ms = 0.0
+        if hasattr(request, '_metrics_render_started'):
+            view_ms = (request._metrics_render_started - request._metrics_view_started) * 1000
+        if hasattr(request, '_metrics_render_finished'):
+            renderer_ms = (request._metrics_render_finished - request._metrics_render_started) * 1000
+
+        sample = {
+            'queries': recorder.count,
+            'duplicate_queries': sum(total - 1 for total in duplicates.values()),
+            'db_ms': recorder.duration * 1000,
+            'view_ms': view_ms,
+            'renderer_ms': renderer_ms,
+            'total_ms': total_ms,
+            'over_budget': budget is not None and recorder.count > budget,
+        }
+        registry.add(view_name, sample)
+
+        log_record = {
+            'view': view_name,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'query_budget': budget,
+            **{key: round(value, 2) if isinstance(value, float) else value for key, value in sample.items()},
+        }
+        if sample['over_budget'] or duplicates:
+            log_record['duplicates'] = [
+                {'sql': sql[:200], 'count': total}
+                for sql, total in sorted(duplicates.items(), key=lambda item: -item[1])[:5]
+            ]
+        logger.log(logging.WARNING if sample['over_budget'] else logging.INFO, json.dumps(log_record))
+
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._metrics_view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # view_ms: view'in kendisi; serializer.data (alan dönüşümleri, ilişkili nesne erişimleri) bu sürededir.
+        # renderer_ms: DRF Response'ları middleware zincirinde render edilir; yalnızca JSON renderer süresidir.
+        request._metrics_render_started = time.perf_counter()
+        response.add_post_render_callback(
+            lambda rendered: setattr(request, '_metrics_render_finished', time.perf_counter())
+        )
+        return response
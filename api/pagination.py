@@ -0,0 +1,193 @@
+from base64 import b64encode
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from urllib.parse import urlencode
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+from content.facets import merged_page
+from content.search import match_key
+
+
+class KeysetCursorPagination(CursorPagination):
+    # (zaman damgası, id) çifti üzerinde keyset sayfalama: COUNT(*) ve OFFSET yok,
+    # her sayfa indeks üzerinde tek bir aralık taramasıdır.
+    timestamp_field = 'created_at'
+    invalid_cursor_message = 'Geçersiz imleç.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self._start(request)
+        return self._finish(list(self._seek(queryset)))
+
+    def _start(self, request):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.cursor = self.decode_cursor(request)
+        self.reverse = bool(self.cursor and self.cursor.reverse)
+
+    def _seek(self, queryset, id_field='id'):
+        # Sıralama ve imleç koşulu (zaman damgası, id_field) çifti üzerindedir; sorgu bir fazlasıyla sınırlanır.
+        field = self.timestamp_field
+        if self.reverse:
+            queryset = queryset.order_by(field, id_field)
+        else:
+            queryset = queryset.order_by(f'-{field}', f'-{id_field}')
+
+        if self.cursor is not None:
+            timestamp, pk = self._parse_position(self.cursor.position)
+            lookup = 'gt' if self.reverse else 'lt'
+            queryset = queryset.filter(
+                Q(**{f'{field}__{lookup}': timestamp}) | Q(**{field: timestamp, f'{id_field}__{lookup}': pk})
+            )
+        return queryset[:self.page_size + 1]
+
+    def _finish(self, results):
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if self.reverse:
+            self.page.reverse()
+
+        if self.reverse:
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, self.cursor is not None
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=self._get_position(self.page[-1])))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=self._get_position(self.page[0])))
+
+    @classmethod
+    def _get_position(cls, instance):
+        return f"{getattr(instance, cls.timestamp_field).isoformat()}|{instance.pk}"
+
+    @classmethod
+    def next_cursor(cls, page, page_size):
+        # İstek olmadan (ör. önbelleğe alınan ilk sayfa için) bir sonraki sayfanın imleç değeri.
+        if len(page) <= page_size:
+            return None
+        querystring = urlencode({'p': cls._get_position(page[page_size - 1])})
+        return b64encode(querystring.encode('ascii')).decode('ascii')
+
+    def _parse_position(self, position):
+        try:
+            timestamp, pk = position.rsplit('|', 1)
+            return datetime.fromisoformat(timestamp), int(pk)
+        except (AttributeError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+
+class ActivityCursorPagination(KeysetCursorPagination):
+    page_size = 15
+
+
+class TimelineCursorPagination(ActivityCursorPagination):
+    # Ana akış TimelineEntry üzerinden (created_at, activity_id) ile sayfalanır; çekilen (pull) yazarların
+    # aktiviteleri ayrı bir sorguyla aynı anahtara göre okunup birleştirilir. Activity'nin kendi created_at'i
+    # zaman akışı girişine kopyalandığı için imleç değerleri iki kaynakta da aynıdır.
+
+    def paginate_timeline(self, sources, request, load):
+        # sources: (queryset, id_field) çiftleri. load: sayfadaki aktivite id'lerini aynı sırayla nesneye çevirir.
+        self._start(request)
+        keys = {}
+        for queryset, id_field in sources:
+            rows = self._seek(queryset.values_list(self.timestamp_field, id_field), id_field)
+            for timestamp, activity_id in rows:
+                keys[activity_id] = timestamp
+
+        ordered = sorted(keys, key=lambda activity_id: (keys[activity_id], activity_id), reverse=not self.reverse)
+        activity_ids = self._finish(ordered[:self.page_size + 1])
+        self.page = load(activity_ids)
+        return self.page
+
+
+class SearchCursorPagination(KeysetCursorPagination):
+    # Arama sonuçları ranked_matches'in sıraladığı sınırlı aday listesi üzerinde match_key ile sayfalanır;
+    # COUNT sorgusu yoktur, imleç son görülen sonucun sıralama anahtarıdır.
+    page_size = 15
+
+    def paginate_queryset(self, matches, request, view=None):
+        self._start(request)
+        if self.cursor is None:
+            return self._finish(matches[:self.page_size + 1])
+
+        keys = [match_key(match) for match in matches]
+        position = self._parse_position(self.cursor.position)
+        if self.reverse:
+            end = bisect_left(keys, position)
+            return self._finish(matches[max(end - self.page_size - 1, 0):end][::-1])
+        start = bisect_right(keys, position)
+        return self._finish(matches[start:start + self.page_size + 1])
+
+    @classmethod
+    def _get_position(cls, match):
+        return '|'.join(str(value) for value in match_key(match))
+
+    def _parse_position(self, position):
+        try:
+            key = tuple(int(value) for value in position.split('|'))
+        except (AttributeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if len(key) != 4:
+            raise NotFound(self.invalid_cursor_message)
+        return key
+
+
+class ReviewCursorPagination(KeysetCursorPagination):
+    page_size = 10
+
+
+class ListItemCursorPagination(KeysetCursorPagination):
+    timestamp_field = 'added_at'
+    page_size = 50
+
+
+class MergedContentPagination(PageNumberPagination):
+    # Birden fazla içerik tipinin sıralı sorgularını tek bir sayfalı liste olarak döndürür.
+
+    def paginate_querysets(self, querysets, request):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        try:
+            self.page_number = int(request.query_params.get(self.page_query_param, 1))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_page_message)
+
+        self.count = sum(queryset.count() for queryset in querysets)
+        offset = (self.page_number - 1) * self.page_size
+        if self.page_number < 1 or (offset and offset >= self.count):
+            raise NotFound(self.invalid_page_message)
+
+        return merged_page(querysets, offset, self.page_size)
+
+    def get_next_link(self):
+        if self.page_number * self.page_size >= self.count:
+            return None
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, self.page_number + 1)
+
+    def get_previous_link(self):
+        if self.page_number <= 1:
+            return None
+        url = self.request.build_absolute_uri()
+        if self.page_number == 2:
+            return remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.page_query_param, self.page_number - 1)
+
+    def get_paginated_response(self, data, facets=None):
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+            'facets': facets,
+        })
@@ -0,0 +1,47 @@
+from django.contrib.contenttypes.prefetch import GenericPrefetch
+from django.db.models import BooleanField, Exists, F, OuterRef, Prefetch, Value, Window
+from django.db.models.functions import RowNumber
+from content.models import Rating, Review, ListItem, Reply
+from feed.models import Follow
+
+
+def liked_by_viewer(model, user):
+    if user is None or not user.is_authenticated:
+        return Value(False, output_field=BooleanField())
+
+    field = model._meta.get_field('likes')
+    likes = field.remote_field.through.objects.filter(**{
+        field.m2m_column_name(): OuterRef('pk'),
+        field.m2m_reverse_name(): user.pk,
+    })
+    return Exists(likes)
+
+
+def with_like_stats(queryset, user):
+    return queryset.annotate(liked_by_viewer=liked_by_viewer(queryset.model, user))
+
+
+def activity_content_prefetch(user):
+    # Activity sayfası değerlendirilirken content_object'ler tip bazında toplu yüklenir:
+    # her tip için tek sorgu, hedef Book/Movie'ler için de tip başına tek sorgu.
+    replies = Prefetch('replies', queryset=Reply.objects.select_related('user'))
+
+    return GenericPrefetch('content_object', [
+        with_like_stats(Rating.objects.all(), user).prefetch_related('content_object', replies),
+        with_like_stats(Review.objects.select_related('user'), user).prefetch_related('content_object', replies),
+        ListItem.objects.select_related('list').prefetch_related('content_object'),
+        Follow.objects.select_related('following'),
+    ])
+
+
+def with_list_item_content(queryset):
+    # content_type JOIN ile gelir; hedef Book/Movie'ler tip başına tek sorguyla yüklenir.
+    return queryset.select_related('content_type').prefetch_related('content_object')
+
+
+def first_items_per_list(list_ids, per_list):
+    # Her listenin en yeni per_list öğesi (sonraki sayfa var mı diye bir fazlası) tek sorguda: ROW_NUMBER penceresi.
+    queryset = ListItem.objects.filter(list_id__in=list_ids).annotate(
+        position=Window(RowNumber(), partition_by=F('list_id'), order_by=(F('added_at').desc(), F('id').desc()))
+    ).filter(position__lte=per_list + 1).order_by('list_id', 'position')
+    return with_list_item_content(queryset)
@@ -1,39 +1,58 @@
 from rest_framework import serializers
 from content.models import Rating, Review, Book, Movie, UserList, ListItem, Reply   
+from content.types import content_types
 from users.models import CustomUser
 from feed.models import Follow, Activity 
-from django.contrib.contenttypes.models import ContentType
 from django.contrib.auth.forms import PasswordResetForm, SetPasswordForm
 from django.core.exceptions import ValidationError 
 from django.contrib.auth import get_user_model
 from django.utils.encoding import force_str
 from django.utils.http import urlsafe_base64_decode
 from django.contrib.auth.tokens import default_token_generator as token_generator
-from django.db.models import Avg
 
 User = get_user_model() 
 
 
+TARGET_TYPES = ('book', 'movie')
+
+
 class ContentTypeField(serializers.Field):
+    # Tip adı kayıt defterinden sorgusuz çözülür; yalnızca types içindeki adlar kabul edilir.
+    def __init__(self, types=TARGET_TYPES, **kwargs):
+        self.types = tuple(types)
+        super().__init__(**kwargs)
+
     def to_internal_value(self, data):
         if data is None or not isinstance(data, str) or data.strip() == '':
             raise serializers.ValidationError("İçerik tipi ('book', 'movie' vb.) zorunludur ve metin olmalıdır.")
-            
-        try:
-            return ContentType.objects.get(model=data.lower())
-        except ContentType.DoesNotExist:
+
+        name = data.strip().lower()
+        if name not in self.types:
+            allowed = ', '.join(f"'{type_name}'" for type_name in self.types)
             raise serializers.ValidationError(
-                f"ContentType '{data}' bulunamadı. Lütfen 'book' veya 'movie' gibi geçerli bir model adı kullanın."
+                f"ContentType '{data}' bulunamadı. Lütfen şu model adlarından birini kullanın: {allowed}."
             )
+        return content_types.get(name)
 
     def to_representation(self, value):
         return value.model
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
-    followers_count = serializers.SerializerMethodField()
-    following_count = serializers.SerializerMethodField()
+def _get_likes_count(obj):
+    return obj.likes_count
+
 
+def _get_is_liked(obj, request):
+    if not (request and request.user.is_authenticated):
+        return False
+
+    liked_by_viewer = getattr(obj, 'liked_by_viewer', None)
+    if liked_by_viewer is not None:
+        return liked_by_viewer
+    return obj.likes.filter(pk=request.user.pk).exists()
+
+
+class UserProfileSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = [
@@ -49,12 +68,6 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['followers_count', 'following_count']
 
-    def get_followers_count(self, obj):
-        return Follow.objects.filter(following=obj).count()
-
-    def get_following_count(self, obj):
-        return Follow.objects.filter(follower=obj).count() 
-
 
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
@@ -114,13 +127,10 @@ class ReviewSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'created_at', 'updated_at']
 
     def get_likes_count(self, obj):
-        return obj.likes.count()
+        return _get_likes_count(obj)
 
     def get_is_liked(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            return obj.likes.filter(pk=request.user.pk).exists()
-        return False
+        return _get_is_liked(obj, self.context.get('request'))
 
     def create(self, validated_data):
         user = self.context['request'].user
@@ -262,9 +272,6 @@ class MovieSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'release_date', 'poster_path', 'overview', 'director_name', 'actors_list', 'genres_list']
 
 
-def _get_content_type_filter(obj):
-    return ContentType.objects.get_for_model(obj.__class__)
-    
 class NestedReviewSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
     class Meta:
@@ -272,96 +279,36 @@ class NestedReviewSerializer(serializers.ModelSerializer):
         fields = ['id', 'user', 'text', 'created_at']
 
 
-class BookDetailSerializer(serializers.ModelSerializer):
-    average_score = serializers.SerializerMethodField()
-    reviews = serializers.SerializerMethodField() 
-    user_score = serializers.SerializerMethodField()
-    
-    class Meta:
-        model = Book
-        fields = '__all__' 
+class ContentReviewSerializer(NestedReviewSerializer):
+    is_liked = serializers.SerializerMethodField()
 
+    class Meta(NestedReviewSerializer.Meta):
+        fields = NestedReviewSerializer.Meta.fields + ['is_liked']
 
-    def get_reviews(self, obj):
-        from content.models import Review
-        content_type = _get_content_type_filter(obj)
-        
-        reviews_queryset = Review.objects.filter(
-            content_type=content_type, 
-            object_id=obj.id
-        ).order_by('-created_at')
-        
-        return NestedReviewSerializer(reviews_queryset, many=True, context=self.context).data
+    def get_is_liked(self, obj):
+        return _get_is_liked(obj, self.context.get('request'))
 
 
-    def get_average_score(self, obj):
-        content_type = _get_content_type_filter(obj)
-        result = Rating.objects.filter(
-            content_type=content_type, 
-            object_id=obj.id
-        ).aggregate(score__avg=Avg('score'))
-        
-        return result.get('score__avg')
-        
-    def get_user_score(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            try:
-                content_type = _get_content_type_filter(obj)
-                user_rating = Rating.objects.get(
-                    user=request.user,
-                    content_type=content_type,
-                    object_id=obj.id
-                )
-                return user_rating.score
-            except Rating.DoesNotExist:
-                return None
-        return None
-        
+# Detay serializer'ları yalnızca herkese açık (önbelleğe alınabilir) alanları üretir;
+# user_score ve yorumların beğeni durumu view'da izleyiciye göre eklenir.
+# Denormalize puan sütunları dışarı açılmaz; ortalama average_score olarak döner.
+AGGREGATE_FIELDS = ('rating_count', 'rating_sum', 'avg_score')
+
+
+class BookDetailSerializer(serializers.ModelSerializer):
+    average_score = serializers.FloatField(source='avg_score', read_only=True)
 
-class MovieDetailSerializer(serializers.ModelSerializer):
-    average_score = serializers.SerializerMethodField()
-    reviews = serializers.SerializerMethodField() 
-    user_score = serializers.SerializerMethodField()
-    
     class Meta:
-        model = Movie
-        fields = '__all__' 
+        model = Book
+        exclude = AGGREGATE_FIELDS
 
-    def get_reviews(self, obj):
-        from content.models import Review
-        content_type = _get_content_type_filter(obj)
 
-        reviews_queryset = Review.objects.filter(
-            content_type=content_type, 
-            object_id=obj.id
-        ).order_by('-created_at')
-        
-        return NestedReviewSerializer(reviews_queryset, many=True, context=self.context).data
-
-    def get_average_score(self, obj):
-        content_type = _get_content_type_filter(obj)
-        result = Rating.objects.filter(
-            content_type=content_type, 
-            object_id=obj.id
-        ).aggregate(score__avg=Avg('score'))
-        
-        return result.get('score__avg')
-        
-    def get_user_score(self, obj):
-        request = self.context.get('request')
-        if request and request.user.is_authenticated:
-            try:
-                content_type = _get_content_type_filter(obj)
-                user_rating = Rating.objects.get(
-                    user=request.user,
-                    content_type=content_type,
-                    object_id=obj.id
-                )
-                return user_rating.score
-            except Rating.DoesNotExist:
-                return None
-        return None
+class MovieDetailSerializer(serializers.ModelSerializer):
+    average_score = serializers.FloatField(source='avg_score', read_only=True)
+
+    class Meta:
+        model = Movie
+        exclude = AGGREGATE_FIELDS
 
 
 class ListItemSerializer(serializers.ModelSerializer): 
@@ -398,7 +345,7 @@ class ListItemSerializer(serializers.ModelSerializer):
             
     def to_representation(self, instance):
         ret = super().to_representation(instance) 
-        ret['list'] = instance.list.pk 
+        ret['list'] = instance.list_id
         ret['content_details'] = self.get_content_details(instance)
         return ret
     
@@ -421,6 +368,23 @@ class ListItemSerializer(serializers.ModelSerializer):
         return content_data
 
 
+class BulkContentItemSerializer(serializers.Serializer):
+    content_type = ContentTypeField()
+    object_id = serializers.IntegerField(min_value=1)
+
+
+class BulkRatingItemSerializer(BulkContentItemSerializer):
+    score = serializers.IntegerField(min_value=1, max_value=10)
+
+
+class BulkListItemSerializer(BulkContentItemSerializer):
+    list = serializers.IntegerField(min_value=1)
+
+
+class BulkFollowItemSerializer(serializers.Serializer):
+    following = serializers.IntegerField(min_value=1)
+
+
 class UserListDetailSerializer(serializers.ModelSerializer):
     items = ListItemSerializer(many=True, read_only=True) 
     
@@ -429,6 +393,14 @@ class UserListDetailSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'is_predefined', 'items']
 
 
+class LibraryListSerializer(serializers.ModelSerializer):
+    items_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = UserList
+        fields = ['id', 'name', 'is_predefined', 'items_count']
+
+
 class ActivitySerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True) 
     activity_type_display = serializers.CharField(source='get_activity_type_display', read_only=True)
@@ -460,11 +432,7 @@ class ActivitySerializer(serializers.ModelSerializer):
 
             content_data = BookSerializer(target_content).data if content_type_name == 'Book' else MovieSerializer(target_content).data
             
-            request = self.context.get('request')
-            is_liked = False
-            if request and request.user.is_authenticated:
-                if hasattr(source_object, 'likes'):
-                    is_liked = source_object.likes.filter(pk=request.user.pk).exists()
+            is_liked = _get_is_liked(source_object, self.context.get('request'))
 
             rating_replies = NestedReplySerializer(source_object.replies.all(), many=True, context=self.context).data
 
@@ -473,7 +441,7 @@ class ActivitySerializer(serializers.ModelSerializer):
                 'content_data': content_data,
                 'score': source_object.score,
                 'rating_id': source_object.pk,
-                'likes_count': source_object.likes.count() if hasattr(source_object, 'likes') else 0,
+                'likes_count': _get_likes_count(source_object),
                 'is_liked': is_liked,
                 'replies': rating_replies, 
             }
@@ -523,7 +491,7 @@ class ActivitySerializer(serializers.ModelSerializer):
     
 
 class ReplySerializer(serializers.ModelSerializer):
-    content_type = ContentTypeField(write_only=True) 
+    content_type = ContentTypeField(types=('rating', 'review'), write_only=True) 
     object_id = serializers.IntegerField(write_only=True)
     
     class Meta:
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+from users.models import CustomUser
+from .authentication import invalidate_token, invalidate_user_tokens
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_token_cache(sender, instance, created, **kwargs):
+    # is_active, parola ya da profil alanları değişince önbellekteki kullanıcı satırı eskir.
+    if not created:
+        invalidate_user_tokens(instance)
@@ -0,0 +1,336 @@
+import logging
+import random
+from datetime import date, timedelta
+from itertools import accumulate
+from django.contrib.auth.hashers import make_password
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from content.aggregates import RATED_MODELS, rebuild_aggregates
+from content.ingest import save_records
+from content.likes import LIKEABLE_MODELS, rebuild_likes_counts
+from content.models import Book, Movie, Rating, Review, Reply, UserList, ListItem
+from content.rankings import invalidate_rankings
+from content.types import content_types
+from feed.counters import rebuild_follow_counts
+from feed.models import Activity, Follow
+from feed.timeline import rebuild_timeline
+from social_media_project.db import keyset_chunks
+from users.models import CustomUser
+
+
+logger = logging.getLogger(__name__)
+
+
+WORDS = (
+    'shadow', 'river', 'empire', 'silent', 'winter', 'garden', 'signal', 'glass', 'ember', 'harbor',
+    'atlas', 'echo', 'crimson', 'orbit', 'hollow', 'iron', 'lantern', 'meridian', 'north', 'paper',
+    'quiet', 'relic', 'salt', 'tide', 'velvet', 'wild', 'zenith', 'ash', 'dune', 'storm',
+)
+GENRES = (
+    'Fiction', 'Drama', 'Science Fiction', 'Fantasy', 'Mystery', 'Thriller', 'Romance', 'History',
+    'Biography', 'Comedy', 'Action', 'Adventure', 'Horror', 'Animation', 'Documentary', 'Poetry',
+)
+LIST_NAMES = ("İzleyeceklerim", "Okuduklarım", "Favorilerim")
+MOVIE_ID_OFFSET = 900_000_000
+
+
+class PowerLaw:
+    # Sıra numarası küçük olan öğe daha sık seçilir (Zipf benzeri dağılım).
+    def __init__(self, size, alpha):
+        self.population = range(size)
+        self.cum_weights = list(accumulate(1 / (rank + 1) ** alpha for rank in range(size)))
+
+    def sample(self, rng, k):
+        return rng.choices(self.population, cum_weights=self.cum_weights, k=k)
+
+
+class SyntheticDataGenerator:
+    def __init__(self, users=1000, books=500, movies=500, follows_per_user=20, ratings_per_user=30,
+                 review_ratio=0.3, likes_per_item=3, replies_per_review=0.5, list_items_per_user=5,
+                 days=90, alpha=1.1, prefix='bench_', seed=1, batch_size=5000, build_timelines=True, log=logger.info):
+        self.config = {
+            'users': users, 'books': books, 'movies': movies, 'follows_per_user': follows_per_user,
+            'ratings_per_user': ratings_per_user, 'review_ratio': review_ratio, 'likes_per_item': likes_per_item,
+            'replies_per_review': replies_per_review, 'list_items_per_user': list_items_per_user,
+            'days': days, 'alpha': alpha, 'seed': seed,
+        }
+        self.prefix = prefix
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.build_timelines = build_timelines
+        self.log = log
+        self.now = timezone.now()
+
+    def _timestamp(self):
+        return self.now - timedelta(seconds=self.rng.randrange(self.config['days'] * 24 * 60 * 60))
+
+    def _count(self, mean):
+        # Ortalama etrafında ağır kuyruklu bir dağılım: çoğu kullanıcı az, birkaçı çok işlem yapar.
+        if mean <= 0:
+            return 0
+        value = min(self.rng.paretovariate(2.0) * mean / 2, mean * 50)
+        # Kesirli ortalamalar (ör. yorum başına 0.5 yanıt) olasılıksal yuvarlamayla korunur.
+        return int(value) + (self.rng.random() < value - int(value))
+
+    def _flush(self, model, objects, **kwargs):
+        model.objects.bulk_create(objects, batch_size=self.batch_size, **kwargs)
+        objects.clear()
+
+    def _backdate(self, queryset, field_name, timestamp, *fields, **expressions):
+        # auto_now_add alanları eklemede şimdiki zamanla dolar; geçmişe yayılan zamanlar ardından
+        # birincil anahtar sırasıyla parça parça bulk_update ile yazılır (save/pre_save çağrılmaz).
+        model = queryset.model
+        for rows in keyset_chunks(queryset, self.batch_size, *fields, **expressions):
+            model.objects.bulk_update(
+                [model(pk=row['id'], **{field_name: timestamp(row)}) for row in rows], [field_name],
+            )
+
+    def _random_timestamp(self, row):
+        return self._timestamp()
+
+    def exists(self):
+        return CustomUser.objects.filter(username__startswith=self.prefix).exists()
+
+    def flush(self):
+        # Önekli kullanıcılar silinince puan, yorum, liste, takip ve aktiviteleri de cascade ile silinir.
+        CustomUser.objects.filter(username__startswith=self.prefix).delete()
+        Book.objects.filter(google_books_id__startswith=self.prefix).delete()
+        Movie.objects.filter(tmdb_id__gte=MOVIE_ID_OFFSET).delete()
+        invalidate_rankings()
+
+    def run(self):
+        user_ids = self.create_users()
+        self.create_follows(user_ids)
+        content = self.create_content()
+        self.create_ratings_and_reviews(user_ids, content)
+        self.create_likes(user_ids)
+        self.create_replies(user_ids)
+        self.create_list_items(user_ids, content)
+        self.create_activities()
+
+        if self.build_timelines:
+            self.log("Akışlar oluşturuluyor...")
+            for user in CustomUser.objects.filter(pk__in=user_ids).iterator():
+                rebuild_timeline(user)
+        invalidate_rankings()
+
+        return self.summary()
+
+    def create_users(self):
+        self.log(f"{self.config['users']} kullanıcı oluşturuluyor...")
+        password = make_password('benchmark')
+        users = []
+        for index in range(self.config['users']):
+            users.append(CustomUser(
+                username=f"{self.prefix}{index}",
+                email=f"{self.prefix}{index}@example.com",
+                password=password,
+            ))
+            if len(users) >= self.batch_size:
+                self._flush(CustomUser, users)
+        self._flush(CustomUser, users)
+
+        user_ids = list(
+            CustomUser.objects.filter(username__startswith=self.prefix).order_by('pk').values_list('pk', flat=True)
+        )
+        lists = []
+        for user_id in user_ids:
+            lists.extend(UserList(user_id=user_id, name=name, is_predefined=True) for name in LIST_NAMES)
+            if len(lists) >= self.batch_size:
+                self._flush(UserList, lists)
+        self._flush(UserList, lists)
+        return user_ids
+
+    def create_follows(self, user_ids):
+        self.log("Takip grafı oluşturuluyor...")
+        # Popülerlik sırası karıştırılır; böylece ünlü hesaplar ID sırasına bağlı olmaz.
+        ranked = list(user_ids)
+        self.rng.shuffle(ranked)
+        popularity = PowerLaw(len(ranked), self.config['alpha'])
+
+        follows = []
+        for follower_id in user_ids:
+            targets = {ranked[index] for index in popularity.sample(self.rng, self._count(self.config['follows_per_user']))}
+            targets.discard(follower_id)
+            follows.extend(Follow(follower_id=follower_id, following_id=following_id) for following_id in targets)
+            if len(follows) >= self.batch_size:
+                self._flush(Follow, follows, ignore_conflicts=True)
+        self._flush(Follow, follows, ignore_conflicts=True)
+        self._backdate(Follow.objects.filter(follower__username__startswith=self.prefix), 'created_at', self._random_timestamp)
+        rebuild_follow_counts()
+
+    def create_content(self):
+        self.log(f"{self.config['books']} kitap ve {self.config['movies']} film oluşturuluyor...")
+
+        def title():
+            return ' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(1, 4))).title()
+
+        def genres():
+            return ', '.join(self.rng.sample(GENRES, self.rng.randint(1, 3)))
+
+        save_records(Book, 'google_books_id', [
+            {
+                'google_books_id': f"{self.prefix}book-{index}",
+                'title': title(),
+                'authors': f"{self.rng.choice(WORDS).title()} {self.rng.choice(WORDS).title()}",
+                'description': ' '.join(self.rng.choice(WORDS) for _ in range(30)),
+                'page_count': self.rng.randint(80, 900),
+                'publication_year': self.rng.randint(1900, self.now.year),
+                'genres_list': genres(),
+            }
+            for index in range(self.config['books'])
+        ], batch_size=self.batch_size)
+
+        save_records(Movie, 'tmdb_id', [
+            {
+                'tmdb_id': MOVIE_ID_OFFSET + index,
+                'title': title(),
+                'overview': ' '.join(self.rng.choice(WORDS) for _ in range(30)),
+                'release_date': date(self.rng.randint(1950, self.now.year), self.rng.randint(1, 12), self.rng.randint(1, 28)),
+                'director_name': f"{self.rng.choice(WORDS).title()} {self.rng.choice(WORDS).title()}",
+                'genres_list': genres(),
+            }
+            for index in range(self.config['movies'])
+        ], batch_size=self.batch_size)
+
+        content = [
+            (content_types.id_for(Book), pk)
+            for pk in Book.objects.filter(google_books_id__startswith=self.prefix).values_list('pk', flat=True)
+        ] + [
+            (content_types.id_for(Movie), pk)
+            for pk in Movie.objects.filter(tmdb_id__gte=MOVIE_ID_OFFSET).values_list('pk', flat=True)
+        ]
+        self.rng.shuffle(content)
+        return content
+
+    def create_ratings_and_reviews(self, user_ids, content):
+        self.log("Puanlar ve yorumlar oluşturuluyor...")
+        popularity = PowerLaw(len(content), self.config['alpha'])
+        ratings = []
+        reviews = []
+
+        for user_id in user_ids:
+            targets = {content[index] for index in popularity.sample(self.rng, self._count(self.config['ratings_per_user']))}
+            for content_type_id, object_id in targets:
+                ratings.append(Rating(
+                    user_id=user_id, content_type_id=content_type_id, object_id=object_id,
+                    score=min(10, max(1, round(self.rng.gauss(7, 2)))),
+                ))
+                if self.rng.random() < self.config['review_ratio']:
+                    reviews.append(Review(
+                        user_id=user_id, content_type_id=content_type_id, object_id=object_id,
+                        text=' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(10, 80))),
+                    ))
+            if len(ratings) >= self.batch_size:
+                self._flush(Rating, ratings, ignore_conflicts=True)
+            if len(reviews) >= self.batch_size:
+                self._flush(Review, reviews)
+        self._flush(Rating, ratings, ignore_conflicts=True)
+        self._flush(Review, reviews)
+
+        # Yorum, aynı içeriğe verilen puanla aynı anda yazılmış sayılır.
+        self._backdate(Rating.objects.filter(user__username__startswith=self.prefix), 'created_at', self._random_timestamp)
+        Review.objects.filter(user__username__startswith=self.prefix).update(created_at=Subquery(
+            Rating.objects.filter(
+                user_id=OuterRef('user_id'), content_type_id=OuterRef('content_type_id'), object_id=OuterRef('object_id'),
+            ).values('created_at')[:1]
+        ))
+
+        for model in RATED_MODELS:
+            rebuild_aggregates(model)
+
+    def create_likes(self, user_ids):
+        self.log("Beğeniler oluşturuluyor...")
+        for model in LIKEABLE_MODELS.values():
+            field = model._meta.get_field('likes')
+            through = field.remote_field.through
+            source_column, target_column = field.m2m_column_name(), field.m2m_reverse_name()
+            rows = []
+            object_ids = model.objects.filter(user__username__startswith=self.prefix).values_list('pk', flat=True)
+            for object_id in object_ids.iterator():
+                for user_id in self.rng.sample(user_ids, min(len(user_ids), self._count(self.config['likes_per_item']))):
+                    rows.append(through(**{source_column: object_id, target_column: user_id}))
+                if len(rows) >= self.batch_size:
+                    self._flush(through, rows, ignore_conflicts=True)
+            self._flush(through, rows, ignore_conflicts=True)
+            rebuild_likes_counts(model)
+
+    def create_replies(self, user_ids):
+        self.log("Yanıtlar oluşturuluyor...")
+        review_type_id = content_types.id_for(Review)
+        replies = []
+        reviews = Review.objects.filter(user__username__startswith=self.prefix).values_list('pk', flat=True)
+        for review_id in reviews.iterator():
+            for _ in range(self._count(self.config['replies_per_review'])):
+                replies.append(Reply(
+                    user_id=self.rng.choice(user_ids), content_type_id=review_type_id, object_id=review_id,
+                    text=' '.join(self.rng.choice(WORDS) for _ in range(self.rng.randint(3, 20))),
+                ))
+            if len(replies) >= self.batch_size:
+                self._flush(Reply, replies)
+        self._flush(Reply, replies)
+
+        # Yanıtlar yorumdan 1-72 saat sonra yazılmış sayılır.
+        self._backdate(
+            Reply.objects.filter(user__username__startswith=self.prefix, content_type_id=review_type_id),
+            'created_at',
+            lambda row: min(self.now, row['review_created_at'] + timedelta(hours=self.rng.randint(1, 72))),
+            review_created_at=Subquery(Review.objects.filter(pk=OuterRef('object_id')).values('created_at')[:1]),
+        )
+
+    def create_list_items(self, user_ids, content):
+        self.log("Liste öğeleri oluşturuluyor...")
+        popularity = PowerLaw(len(content), self.config['alpha'])
+        lists_by_user = {}
+        for list_id, user_id in UserList.objects.filter(user_id__in=user_ids).values_list('pk', 'user_id').iterator():
+            lists_by_user.setdefault(user_id, []).append(list_id)
+
+        items = []
+        for user_id, list_ids in lists_by_user.items():
+            for index in popularity.sample(self.rng, self._count(self.config['list_items_per_user'])):
+                content_type_id, object_id = content[index]
+                items.append(ListItem(list_id=self.rng.choice(list_ids), content_type_id=content_type_id, object_id=object_id))
+            if len(items) >= self.batch_size:
+                self._flush(ListItem, items, ignore_conflicts=True)
+        self._flush(ListItem, items, ignore_conflicts=True)
+        self._backdate(ListItem.objects.filter(list__user__username__startswith=self.prefix), 'added_at', self._random_timestamp)
+
+    def create_activities(self):
+        # bulk_create sinyal göndermediği için aktiviteler kaynak kayıtlardan toplu üretilir;
+        # zamanları ardından kaynak kaydın zamanından tek UPDATE ile kopyalanır.
+        self.log("Aktiviteler oluşturuluyor...")
+        sources = (
+            (Rating, 1, 'created_at', Rating.objects.filter(user__username__startswith=self.prefix).values_list('pk', 'user_id')),
+            (Review, 2, 'created_at', Review.objects.filter(user__username__startswith=self.prefix).values_list('pk', 'user_id')),
+            (ListItem, 3, 'added_at', ListItem.objects.filter(list__user__username__startswith=self.prefix).values_list('pk', 'list__user_id')),
+            (Follow, 4, 'created_at', Follow.objects.filter(follower__username__startswith=self.prefix).values_list('pk', 'follower_id')),
+        )
+        activities = []
+        for model, activity_type, _, rows in sources:
+            content_type_id = content_types.id_for(model)
+            for object_id, user_id in rows.order_by().iterator():
+                activities.append(Activity(
+                    user_id=user_id, activity_type=activity_type, content_type_id=content_type_id, object_id=object_id,
+                ))
+                if len(activities) >= self.batch_size:
+                    self._flush(Activity, activities, ignore_conflicts=True)
+        self._flush(Activity, activities, ignore_conflicts=True)
+
+        for model, activity_type, field_name, _ in sources:
+            Activity.objects.filter(
+                user__username__startswith=self.prefix, activity_type=activity_type, content_type_id=content_types.id_for(model),
+            ).update(created_at=Subquery(model.objects.filter(pk=OuterRef('object_id')).values(field_name)[:1]))
+
+    def summary(self):
+        users = CustomUser.objects.filter(username__startswith=self.prefix)
+        return {
+            'users': users.count(),
+            'follows': Follow.objects.filter(follower__in=users).count(),
+            'books': Book.objects.filter(google_books_id__startswith=self.prefix).count(),
+            'movies': Movie.objects.filter(tmdb_id__gte=MOVIE_ID_OFFSET).count(),
+            'ratings': Rating.objects.filter(user__in=users).count(),
+            'reviews': Review.objects.filter(user__in=users).count(),
+            'replies': Reply.objects.filter(user__in=users).count(),
+            'list_items': ListItem.objects.filter(list__user__in=users).count(),
+            'activities': Activity.objects.filter(user__in=users).count(),
+        }
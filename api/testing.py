@@ -0,0 +1,46 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from rest_framework.test import APITestCase as BaseAPITestCase
+from caching.tiered import stats
+from .metrics import query_budget
+
+
+# Testler geliştirme ortamının dosya önbelleğine yazmaz; iki katman da süreç içi önbellekle değiştirilir.
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-default'},
+    'local': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'test-local'},
+}
+
+
+def assert_query_budget(client, url, budget=None, method='get', data=None, **extra):
+    # Bütçe verilmezse view sınıfında tanımlı query_budget kullanılır.
+    if budget is None:
+        budget = query_budget(resolve(url.split('?')[0]).func)
+    if budget is None:
+        raise AssertionError(f"{url} için sorgu bütçesi tanımlı değil.")
+
+    with CaptureQueriesContext(connection) as context:
+        response = getattr(client, method)(url, data, format='json', **extra)
+
+    executed = len(context.captured_queries)
+    if executed > budget:
+        queries = '\n'.join(f"  {index}. {query['sql']}" for index, query in enumerate(context.captured_queries, 1))
+        raise AssertionError(f"{url}: {executed} sorgu çalıştı, bütçe {budget}.\n{queries}")
+    return response
+
+
+class QueryBudgetTestMixin:
+    def assertQueryBudget(self, url, budget=None, method='get', data=None, **extra):
+        return assert_query_budget(self.client, url, budget=budget, method=method, data=data, **extra)
+
+
+@override_settings(CACHES=TEST_CACHES, JOBS_BACKEND='sync')
+class APITestCase(QueryBudgetTestMixin, BaseAPITestCase):
+    def setUp(self):
+        super().setUp()
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        stats.reset()
@@ -1,3 +1,650 @@
-from django.test import TestCase
+import csv
+import io
+import json
+from unittest import mock
+from django.core.cache import caches
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from content.models import Book, Movie, Rating, Review, UserList, ListItem
+from feed.models import Activity, Follow, TimelineEntry
+from jobs.models import Job
+from users.models import CustomUser
+from .export import CSV_FIELDS, export_user_data
+from .metrics import registry
+from .testing import TEST_CACHES, APITestCase, assert_query_budget
 
-# Create your tests here.
+
+class SocialFixtureMixin:
+    # Takip edilen her yazar puan, yorum, liste ekleme ve takip aktivitesi üretir; işler (sync) commit'te çalışır.
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.viewer = CustomUser.objects.create_user('viewer', 'viewer@example.com', 'parola-123')
+            cls.books = [Book.objects.create(google_books_id=f'g{index}', title=f"Dune {index}") for index in range(3)]
+            cls.movies = [Movie.objects.create(tmdb_id=index, title=f"Matrix {index}") for index in range(3)]
+            cls.authors = []
+            for index in range(3):
+                cls.authors.append(cls.create_author(f'author{index}'))
+
+    @classmethod
+    def create_author(cls, username, follow=True):
+        with cls.captureOnCommitCallbacks(execute=True):
+            author = CustomUser.objects.create_user(username, f'{username}@example.com', 'parola-123')
+            if follow:
+                Follow.objects.create(follower=cls.viewer, following=author)
+            cls.add_activities(author)
+        return author
+
+    @classmethod
+    def add_activities(cls, author, index=0):
+        with cls.captureOnCommitCallbacks(execute=True):
+            book = cls.books[index % len(cls.books)]
+            movie = cls.movies[index % len(cls.movies)]
+            Rating.objects.create(user=author, content_object=book, score=7)
+            review = Review.objects.create(user=author, content_object=movie, text=f"{author.username} yorumu")
+            review.likes.add(cls.viewer)
+            ListItem.objects.create(list=UserList.objects.filter(user=author).first(), content_object=book)
+            if author != cls.viewer:
+                Follow.objects.get_or_create(follower=author, following=cls.viewer)
+
+
+class QueryBudgetTests(SocialFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.viewer)
+
+    def test_feed_within_budget(self):
+        response = self.assertQueryBudget(reverse('user-feed'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            {activity['activity_type_display'] for activity in response.data['results']},
+            {'Rating', 'Review', 'List_Add', 'Follow'},
+        )
+
+    def test_content_detail_within_budget(self):
+        url = reverse('content-detail', args=['movie', self.movies[0].pk])
+        response = self.assertQueryBudget(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['reviews']), len(self.authors))
+        self.assertIn('average_score', response.data)
+        self.assertFalse({'rating_count', 'rating_sum', 'avg_score'} & set(response.data))
+        self.assertTrue(all(review['is_liked'] for review in response.data['reviews']))
+
+        # Önbellekten dönen yanıtta yalnızca izleyiciye özel kısım sorgulanır.
+        self.assertQueryBudget(url, budget=2)
+
+    def test_metrics_split_view_and_renderer_time(self):
+        registry.reset()
+        self.client.get(reverse('user-feed'))
+        sample = registry.snapshot()['user-feed']
+        self.assertEqual(sample['requests'], 1)
+        self.assertGreater(sample['view_ms'], 0)
+        self.assertGreater(sample['renderer_ms'], 0)
+        self.assertGreaterEqual(sample['total_ms'], sample['view_ms'] + sample['renderer_ms'])
+
+
+class FeedTests(SocialFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.viewer)
+
+    def read_feed(self, url):
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            url = response.data['next']
+        return pages
+
+    def test_query_count_constant_as_page_grows(self):
+        # Sorgu sayısı sayfadaki aktivite sayısına değil, aktivite/içerik tiplerine bağlıdır.
+        reader = CustomUser.objects.create_user('reader', 'reader@example.com', 'parola-123')
+        self.client.force_authenticate(reader)
+        Review.objects.filter(user=self.authors[0]).get().replies.create(user=reader, text="Katılıyorum")
+        with self.captureOnCommitCallbacks(execute=True):
+            Follow.objects.create(follower=reader, following=self.authors[0])
+
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(reverse('user-feed'))
+        self.assertEqual(len(response.data['results']), 5)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for author in self.authors[1:]:
+                Follow.objects.create(follower=reader, following=author)
+
+        with self.assertNumQueries(len(small.captured_queries)):
+            response = self.client.get(reverse('user-feed'))
+        self.assertEqual(len(response.data['results']), 15)
+
+    @override_settings(FEED_FANOUT_FOLLOWER_LIMIT=1)
+    def test_merges_pulled_authors_in_keyset_order(self):
+        # İki takipçisi olan yazar sınırın üstündedir; aktiviteleri dağıtılmaz, okuma anında çekilir.
+        celebrity = self.create_author('celebrity')
+        Follow.objects.create(follower=self.authors[0], following=celebrity)
+        self.add_activities(celebrity, index=1)
+        pulled = Activity.objects.filter(user=celebrity).latest('pk')
+        self.assertFalse(TimelineEntry.objects.filter(owner=self.viewer, activity=pulled).exists())
+
+        pages = self.read_feed(reverse('user-feed'))
+        ids = [activity['id'] for page in pages for activity in page['results']]
+
+        expected = list(
+            Activity.objects.filter(user__in=[self.viewer, celebrity, *self.authors])
+            .order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertGreater(len(pages), 1)
+        self.assertEqual(ids, expected)
+
+        # Geri imleci bir önceki sayfayı aynen döndürür.
+        previous = self.client.get(pages[1]['previous'])
+        self.assertEqual(
+            [activity['id'] for activity in previous.data['results']],
+            [activity['id'] for activity in pages[0]['results']],
+        )
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('user-feed'), {'cursor': 'bozuk'})
+        self.assertEqual(response.status_code, 404)
+
+
+class SearchTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('reader', 'reader@example.com', 'parola-123')
+        cls.books = [Book.objects.create(google_books_id=f'g{index}', title=f"Dune {index}") for index in range(20)]
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.user)
+
+    def test_cursor_pages_without_count(self):
+        url = reverse('search-api')
+        with CaptureQueriesContext(connection) as context:
+            first = self.client.get(url, {'q': 'dun'})
+        self.assertFalse(any('COUNT(' in query['sql'] for query in context.captured_queries))
+        self.assertNotIn('count', first.data)
+        self.assertEqual(len(first.data['results']), 15)
+        self.assertIsNone(first.data['previous'])
+
+        second = self.client.get(first.data['next'])
+        self.assertEqual(len(second.data['results']), 5)
+        self.assertIsNone(second.data['next'])
+        titles = [item['title'] for item in first.data['results'] + second.data['results']]
+        self.assertEqual(sorted(titles), sorted(book.title for book in self.books))
+
+        previous = self.client.get(second.data['previous'])
+        self.assertEqual(previous.data['results'], first.data['results'])
+        self.assertEqual(self.client.get(url, {'q': 'dune', 'cursor': 'bozuk'}).status_code, 404)
+
+
+class CachedTokenAuthenticationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = CustomUser.objects.create_user('reader', 'reader@example.com', 'parola-123')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('user_profile_detail_update', args=[self.user.pk])
+
+    def test_token_lookup_is_cached(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.client.get(self.url).status_code, 200)
+        tables = ' '.join(query['sql'] for query in context.captured_queries)
+        self.assertNotIn(Token._meta.db_table, tables)
+
+    def test_logout_invalidates_cached_token(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.post(reverse('logout')).status_code, 204)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_user_save_invalidates_cached_user(self):
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+
+class BulkWriteTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('writer', 'writer@example.com', 'parola-123')
+        cls.other = CustomUser.objects.create_user('other', 'other@example.com', 'parola-123')
+        cls.targets = [CustomUser.objects.create_user(f'target{index}', f'target{index}@example.com', 'parola-123') for index in range(3)]
+        cls.books = [Book.objects.create(google_books_id=f'g{index}', title=f"Dune {index}") for index in range(2)]
+        cls.movie = Movie.objects.create(tmdb_id=1, title="Matrix")
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.user)
+
+    def post(self, url, items):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(url, {'items': items}, format='json')
+
+    def test_rejects_missing_or_oversized_items(self):
+        url = reverse('rating-bulk')
+        self.assertEqual(self.client.post(url, {'items': []}, format='json').status_code, 400)
+        self.assertEqual(self.client.post(url, [{'score': 5}], format='json').status_code, 400)
+        with self.settings(BULK_WRITE_MAX_ITEMS=1):
+            self.assertEqual(self.post(url, [{}, {}]).status_code, 400)
+
+    def test_bulk_rate_reports_each_row(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Rating.objects.create(user=self.user, content_object=self.books[1], score=4)
+            Rating.objects.create(user=self.other, content_object=self.books[0], score=10)
+        response = self.post(reverse('rating-bulk'), [
+            {'content_type': 'book', 'object_id': self.books[0].pk, 'score': 8},
+            {'content_type': 'book', 'object_id': self.books[1].pk, 'score': 6},
+            {'content_type': 'movie', 'object_id': self.movie.pk, 'score': 11},
+            {'content_type': 'user', 'object_id': self.other.pk, 'score': 5},
+            {'content_type': 'movie', 'object_id': 999, 'score': 5},
+            {'content_type': 'book', 'object_id': self.books[0].pk, 'score': 2},
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['created'], response.data['updated'], response.data['failed']), (1, 1, 4))
+        self.assertEqual([item['index'] for item in response.data['items']], [0, 1])
+        self.assertEqual([error['index'] for error in response.data['errors']], [2, 3, 4, 5])
+        self.assertIn('score', response.data['errors'][0]['errors'])
+        self.assertIn('object_id', response.data['errors'][2]['errors'])
+
+        self.books[0].refresh_from_db()
+        self.assertEqual((self.books[0].rating_count, self.books[0].rating_sum, self.books[0].avg_score), (2, 18, 9.0))
+        self.assertEqual(Rating.objects.get(user=self.user, object_id=self.books[1].pk).score, 6)
+        self.assertEqual(Activity.objects.filter(user=self.user).count(), 2)
+
+        repeated = self.post(reverse('rating-bulk'), [{'content_type': 'book', 'object_id': self.books[0].pk, 'score': 8}])
+        self.assertEqual(repeated.data['unchanged'], 1)
+
+    @override_settings(JOBS_BACKEND='db')
+    def test_bulk_rate_aggregates_do_not_wait_for_workers(self):
+        # Varsayılan 'db' kuyruğunda worker çalışmadan da özetler yanıt döndüğünde günceldir.
+        self.post(reverse('rating-bulk'), [
+            {'content_type': 'book', 'object_id': self.books[0].pk, 'score': 8},
+            {'content_type': 'movie', 'object_id': self.movie.pk, 'score': 5},
+        ])
+        self.post(reverse('rating-bulk'), [{'content_type': 'book', 'object_id': self.books[0].pk, 'score': 4}])
+
+        self.books[0].refresh_from_db()
+        self.movie.refresh_from_db()
+        self.assertEqual((self.books[0].rating_count, self.books[0].rating_sum, self.books[0].avg_score), (1, 4, 4.0))
+        self.assertEqual((self.movie.rating_count, self.movie.avg_score), (1, 5.0))
+        self.assertFalse(Job.objects.filter(name__startswith='content.').exists())
+
+    def test_bulk_list_items_only_into_own_lists(self):
+        own_list = UserList.objects.filter(user=self.user).first()
+        other_list = UserList.objects.filter(user=self.other).first()
+        response = self.post(reverse('listitem-bulk'), [
+            {'list': own_list.pk, 'content_type': 'book', 'object_id': self.books[0].pk},
+            {'list': other_list.pk, 'content_type': 'book', 'object_id': self.books[0].pk},
+            {'list': own_list.pk, 'content_type': 'movie', 'object_id': self.movie.pk},
+        ])
+
+        self.assertEqual((response.data['created'], response.data['failed']), (2, 1))
+        self.assertEqual(response.data['errors'][0], {'index': 1, 'errors': {'list': ["Liste bulunamadı."]}})
+        self.assertFalse(ListItem.objects.filter(list=other_list).exists())
+
+        repeated = self.post(reverse('listitem-bulk'), [
+            {'list': own_list.pk, 'content_type': 'book', 'object_id': self.books[0].pk},
+        ])
+        self.assertEqual(repeated.data['unchanged'], 1)
+        self.assertEqual(ListItem.objects.filter(list=own_list).count(), 2)
+
+    def test_bulk_follow_counts_match_rows(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Follow.objects.create(follower=self.user, following=self.targets[0])
+        response = self.post(reverse('follow-bulk'), [
+            {'following': self.targets[0].pk},
+            {'following': self.targets[1].pk},
+            {'following': self.user.pk},
+            {'following': 999},
+        ])
+
+        self.assertEqual((response.data['created'], response.data['unchanged'], response.data['failed']), (1, 1, 2))
+        self.assertEqual([error['index'] for error in response.data['errors']], [2, 3])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.following_count, 2)
+
+    def test_bulk_follow_does_not_double_count_concurrent_follow(self):
+        # Önceden okunan durumdan sonra eşzamanlı bir istek aynı takibi ekleyip sayaçları artırırsa
+        # toplu yazma o satırı atlar; sayaçlar yine gerçek satır sayısına eşit olmalı.
+        original = Follow.objects.bulk_create
+        target = self.targets[2]
+
+        def concurrent_bulk_create(objects, **kwargs):
+            Follow.objects.create(follower=self.user, following=target)
+            return original(objects, **kwargs)
+
+        with mock.patch.object(Follow.objects, 'bulk_create', side_effect=concurrent_bulk_create):
+            response = self.post(reverse('follow-bulk'), [{'following': target.pk}])
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        target.refresh_from_db()
+        self.assertEqual(self.user.following_count, Follow.objects.filter(follower=self.user).count())
+        self.assertEqual(target.followers_count, 1)
+
+
+class LikeTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = CustomUser.objects.create_user('author', 'author@example.com', 'parola-123')
+        cls.likers = [CustomUser.objects.create_user(f'liker{index}', f'liker{index}@example.com', 'parola-123') for index in range(3)]
+        book = Book.objects.create(google_books_id='g1', title="Dune")
+        cls.review = Review.objects.create(user=cls.author, content_object=book, text="Güzel")
+        cls.rating = Rating.objects.create(user=cls.author, content_object=book, score=8)
+
+    def toggle(self, user, content_type='review', pk=None):
+        self.client.force_authenticate(user)
+        url = reverse('like-toggle', args=[content_type, pk or self.review.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(url)
+
+    def assertLikes(self, instance, count):
+        instance.refresh_from_db()
+        self.assertEqual(instance.likes_count, count)
+        self.assertEqual(instance.likes.count(), count)
+
+    def test_like_unlike_and_like_again(self):
+        first, second = self.likers[:2]
+        self.assertEqual(self.toggle(first).data, {'status': 'liked', 'likes_count': 1})
+        self.assertEqual(self.toggle(second).data, {'status': 'liked', 'likes_count': 2})
+        self.assertEqual(self.toggle(first).data, {'status': 'unliked', 'likes_count': 1})
+        self.assertEqual(self.toggle(first).data, {'status': 'liked', 'likes_count': 2})
+        self.assertLikes(self.review, 2)
+
+        self.assertEqual(self.toggle(first, 'rating', self.rating.pk).data, {'status': 'liked', 'likes_count': 1})
+        self.assertLikes(self.rating, 1)
+        self.assertEqual(self.toggle(first, 'user').status_code, 400)
+        self.assertEqual(self.toggle(first, 'review', 999).status_code, 404)
+
+    def test_repeated_like_is_counted_once(self):
+        liker = self.likers[0]
+        self.review.likes.add(liker)
+        self.review.likes.add(liker)
+        liker.liked_reviews.add(self.review)
+        self.assertLikes(self.review, 1)
+        # Var olan beğeni toggle ile kaldırılır; sayaç negatife düşmez.
+        self.assertEqual(self.toggle(liker).data, {'status': 'unliked', 'likes_count': 0})
+
+    def test_m2m_changes_update_counter(self):
+        self.review.likes.add(*self.likers)
+        self.assertLikes(self.review, 3)
+        self.review.likes.remove(self.likers[0])
+        self.assertLikes(self.review, 2)
+        self.likers[1].liked_reviews.remove(self.review)
+        self.assertLikes(self.review, 1)
+
+        self.likers[0].liked_reviews.add(self.review)
+        self.likers[0].liked_ratings.add(self.rating)
+        self.likers[0].liked_reviews.clear()
+        self.assertLikes(self.review, 1)
+        self.review.likes.clear()
+        self.assertLikes(self.review, 0)
+        self.assertLikes(self.rating, 1)
+
+    def test_deleting_user_releases_likes(self):
+        self.review.likes.add(*self.likers)
+        self.rating.likes.add(self.likers[0])
+        self.likers[0].delete()
+        self.assertLikes(self.review, 2)
+        self.assertLikes(self.rating, 0)
+
+    def test_legacy_review_action_delegates(self):
+        self.client.force_authenticate(self.likers[0])
+        url = reverse('review-like', args=[self.review.pk])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(self.client.post(url).data, {'status': 'liked', 'likes_count': 1})
+        self.assertEqual(self.toggle(self.likers[0]).data, {'status': 'unliked', 'likes_count': 0})
+        self.assertEqual(self.client.post(reverse('review-like', args=[999])).status_code, 404)
+
+
+class ConditionalResponseTests(SocialFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.viewer)
+        self.book = self.books[0]
+        self.detail_url = reverse('content-detail', args=['book', self.book.pk])
+
+    def etag(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response['ETag']
+
+    def test_not_modified_has_empty_body_and_private_headers(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Authorization', response['Vary'])
+        self.assertIn('private', response['Cache-Control'])
+
+        for headers in ({'HTTP_IF_NONE_MATCH': response['ETag']}, {'HTTP_IF_MODIFIED_SINCE': response['Last-Modified']}):
+            with CaptureQueriesContext(connection) as context:
+                cached = self.client.get(self.detail_url, **headers)
+            self.assertEqual(cached.status_code, 304)
+            self.assertEqual(cached.content, b'')
+            self.assertEqual(cached['ETag'], response['ETag'])
+            self.assertIn('private', cached['Cache-Control'])
+            self.assertEqual(len(context.captured_queries), 0)
+
+    def test_rating_changes_detail_etag(self):
+        before = self.etag(self.detail_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            Rating.objects.create(user=self.viewer, content_object=self.book, score=9)
+        self.assertNotEqual(self.etag(self.detail_url), before)
+        self.assertEqual(self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=before).status_code, 200)
+
+    def test_like_changes_review_list_etag(self):
+        url = reverse('content-reviews', args=['movie', self.movies[0].pk])
+        before = self.etag(url)
+        review = Review.objects.filter(object_id=self.movies[0].pk).first()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('like-toggle', args=['review', review.pk]))
+        self.assertNotEqual(self.etag(url), before)
+
+    def test_list_item_add_changes_list_etags(self):
+        user_list = UserList.objects.filter(user=self.viewer).first()
+        urls = [reverse('list-list'), reverse('list-detail', args=[user_list.pk])]
+        before = [self.etag(url) for url in urls]
+        with self.captureOnCommitCallbacks(execute=True):
+            ListItem.objects.create(list=user_list, content_object=self.books[1])
+        self.assertEqual([self.etag(url) == etag for url, etag in zip(urls, before)], [False, False])
+
+    def test_review_author_profile_change_refreshes_detail(self):
+        url = reverse('content-detail', args=['movie', self.movies[0].pk])
+        before = self.etag(url)
+        author = self.authors[0]
+        with self.captureOnCommitCallbacks(execute=True):
+            author.last_login = author.date_joined
+            author.save(update_fields=['last_login'])
+        self.assertEqual(self.etag(url), before)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            author.username = 'yeni-ad'
+            author.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=before)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('yeni-ad', [review['user']['username'] for review in response.data['reviews']])
+
+
+class LibraryTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('reader', 'reader@example.com', 'parola-123')
+        cls.lists = list(UserList.objects.filter(user=cls.user).order_by('pk'))
+        cls.books = Book.objects.bulk_create([Book(google_books_id=f'g{index}', title=f"Kitap {index}") for index in range(55)])
+        cls.movie = Movie.objects.create(tmdb_id=1, title="Matrix")
+        ListItem.objects.bulk_create([ListItem(list=cls.lists[0], content_object=book) for book in cls.books])
+        cls.movie_item = ListItem.objects.create(list=cls.lists[1], content_object=cls.movie)
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('library')
+
+    def test_query_count_constant_as_lists_grow(self):
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(assert_query_budget(self.client, self.url).status_code, 200)
+        baseline = len(context.captured_queries)
+
+        for index in range(5):
+            user_list = UserList.objects.create(user=self.user, name=f"Liste {index}")
+            ListItem.objects.create(list=user_list, content_object=self.books[index])
+            ListItem.objects.create(list=user_list, content_object=self.movie)
+        # İlk istekle aynı (soğuk önbellek) koşullarda ölçülür.
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+
+        with self.assertNumQueries(baseline):
+            response = assert_query_budget(self.client, self.url)
+        self.assertEqual(len(response.data['lists']), len(self.lists) + 5)
+
+    def test_items_next_cursor_pages_the_list(self):
+        lists = {data['id']: data for data in self.client.get(self.url).data['lists']}
+        first = lists[self.lists[0].pk]
+        self.assertEqual((first['items_count'], len(first['items'])), (55, 50))
+        self.assertIsNone(lists[self.lists[1].pk]['items_next'])
+        self.assertNotIn('contains_item_id', first)
+
+        rest = self.client.get(first['items_next']).data
+        self.assertEqual(len(rest['results']), 5)
+        self.assertIsNone(rest['next'])
+        seen = [item['object_id'] for item in first['items'] + rest['results']]
+        self.assertEqual(sorted(seen), sorted(book.pk for book in self.books))
+
+    def test_contains_item_id(self):
+        response = self.client.get(self.url, {'content_type': 'movie', 'object_id': self.movie.pk})
+        contained = {data['id']: data['contains_item_id'] for data in response.data['lists']}
+        self.assertEqual(contained, {self.lists[0].pk: None, self.lists[1].pk: self.movie_item.pk, self.lists[2].pk: None})
+
+        response = self.client.get(self.url, {'content_type': 'book', 'object_id': self.books[0].pk})
+        self.assertIsNotNone(response.data['lists'][0]['contains_item_id'])
+
+    def test_invalid_content_filter(self):
+        self.assertEqual(self.client.get(self.url, {'content_type': 'user', 'object_id': 1}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'content_type': 'book', 'object_id': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'object_id': 1}).status_code, 400)
+
+
+class UserExportTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('exporter', 'exporter@example.com', 'parola-123')
+        cls.other = CustomUser.objects.create_user('other', 'other@example.com', 'parola-123')
+        cls.books = [Book.objects.create(google_books_id=f'g{index}', title=f"Kitap {index}") for index in range(5)]
+        for index, book in enumerate(cls.books):
+            Rating.objects.create(user=cls.user, content_object=book, score=index + 1)
+        Rating.objects.create(user=cls.other, content_object=cls.books[0], score=9)
+        # Aynı zaman damgası: parça sınırı zamana değil birincil anahtara göre belirlenir.
+        Rating.objects.filter(user=cls.user).update(created_at=timezone.now())
+        Review.objects.create(user=cls.user, content_object=cls.books[0], text="Uzun, \"alıntılı\"\nyorum")
+        Follow.objects.create(follower=cls.user, following=cls.other)
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('user-export')
+
+    def download(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, b''.join(response.streaming_content).decode('utf-8')
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_ndjson_crosses_chunk_boundaries(self):
+        response, body = self.download()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="exporter-export.ndjson"')
+        self.assertEqual(response['Cache-Control'], 'no-store')
+
+        records = [json.loads(line) for line in body.splitlines()]
+        ratings = [record for record in records if record['type'] == 'rating']
+        self.assertEqual(sorted(record['score'] for record in ratings), [1, 2, 3, 4, 5])
+        self.assertEqual(len({record['id'] for record in ratings}), 5)
+        self.assertEqual(ratings[0]['content_type'], 'book')
+        self.assertEqual(ratings[0]['title'], "Kitap 0")
+        self.assertEqual({record['type'] for record in records}, {'rating', 'review', 'list', 'follow'})
+        self.assertEqual(next(record for record in records if record['type'] == 'follow')['following_username'], 'other')
+
+    def test_csv_with_type_filter(self):
+        response, body = self.download(output='csv', types='review,rating')
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        self.assertTrue(response['Content-Disposition'].endswith('.csv"'))
+
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(tuple(rows[0]), CSV_FIELDS)
+        # Türler istek sırasından bağımsız olarak EXPORT_TYPES sırasıyla yazılır.
+        self.assertEqual([row['type'] for row in rows], ['rating'] * 5 + ['review'])
+        self.assertEqual(rows[-1]['text'], "Uzun, \"alıntılı\"\nyorum")
+
+    def test_rejects_unknown_output_or_types(self):
+        self.assertEqual(self.client.get(self.url, {'output': 'xml'}).status_code, 400)
+        response = self.client.get(self.url, {'types': 'rating,password'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('password', response.data['detail'])
+
+    def test_keyset_chunks_with_duplicate_timestamps(self):
+        chunks = list(export_user_data(self.user, ('rating',), chunk_size=2))
+        self.assertEqual([len(rows) for rows in chunks], [2, 2, 1])
+        ids = [row['id'] for rows in chunks for row in rows]
+        self.assertEqual(ids, sorted(set(ids)))
+
+    def test_management_command(self):
+        out = io.StringIO()
+        call_command('export_user_data', 'exporter', '--format', 'csv', '--types', 'follow', '--chunk-size', '1', stdout=out)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual([(row['type'], row['following_username']) for row in rows], [('follow', 'other')])
+
+        with self.assertRaises(CommandError):
+            call_command('export_user_data', 'exporter', '--types', 'bilinmeyen', stdout=io.StringIO())
+        with self.assertRaises(CommandError):
+            call_command('export_user_data', 'yok', stdout=io.StringIO())
+
+
+class ContentFilterTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user('reader', 'reader@example.com', 'parola-123')
+        books = Book.objects.bulk_create([
+            Book(google_books_id=f'g{index}', title=f"Kitap {index:02}", avg_score=index) for index in range(10)
+        ])
+        movies = Movie.objects.bulk_create([
+            Movie(tmdb_id=index, title=f"Film {index:02}", avg_score=index + 0.5) for index in range(10)
+        ])
+        # Ortalamalar iki tip arasında sırayla dağılır; sayfa sınırı iki tipin ortasına düşer.
+        cls.expected = [
+            (item.title, type(item).__name__)
+            for item in sorted(books + movies, key=lambda item: -item.avg_score)
+        ]
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.user)
+        self.url = reverse('content-filter')
+
+    def test_pages_merge_both_content_types(self):
+        first = self.assertQueryBudget(self.url).data
+        second = self.client.get(first['next']).data
+        self.assertEqual(first['count'], 20)
+        self.assertIsNone(first['previous'])
+        self.assertIsNone(second['next'])
+        self.assertEqual((len(first['results']), len(second['results'])), (15, 5))
+        self.assertEqual(
+            [(item['title'], item['content_type']) for item in first['results'] + second['results']],
+            self.expected,
+        )
+        self.assertEqual(self.client.get(self.url, {'page': 3}).status_code, 404)
+        self.assertEqual(self.client.get(self.url, {'page': 'x'}).status_code, 404)
+
+    def test_rejects_invalid_year_or_score(self):
+        for year in ('0', '-5', '99999', 'abc'):
+            self.assertEqual(self.client.get(self.url, {'year': year}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'year': '9998'}).status_code, 200)
+        self.assertEqual(self.client.get(self.url, {'min_score': 'yüksek'}).status_code, 400)
@@ -3,7 +3,7 @@ from rest_framework.routers import DefaultRouter
 from .views import (RatingViewSet, ReviewViewSet, FollowViewSet, RegisterAPIView, LoginAPIView, LogoutAPIView,
     FeedListView, PasswordResetRequestView, PasswordResetConfirmView, UserListViewSet, ListItemViewSet,
     UserDetailOrUpdateView, SearchAPIView, ContentDetailView, DiscoveryListView , ReplyViewSet, ContentFilterView,
-    UserActivityListView)
+    UserActivityListView, LikeToggleView, MetricsView, ContentReviewListView, LibraryView, UserExportView)
 
 router = DefaultRouter()
 router.register(r'ratings', RatingViewSet, basename='rating')
@@ -24,7 +24,12 @@ urlpatterns = [
     path('search/', SearchAPIView.as_view(), name='search-api'),
     path('discover/', DiscoveryListView.as_view(), name='discovery-list'),
     path('filter/', ContentFilterView.as_view(), name='content-filter'),
+    path('library/', LibraryView.as_view(), name='library'),
+    path('export/', UserExportView.as_view(), name='user-export'),
     path('content/<str:content_type>/<int:pk>/', ContentDetailView.as_view(), name='content-detail'),
+    path('content/<str:content_type>/<int:pk>/reviews/', ContentReviewListView.as_view(), name='content-reviews'),
+    path('likes/<str:content_type>/<int:pk>/', LikeToggleView.as_view(), name='like-toggle'),
     path('profile/user/<int:pk>/', UserDetailOrUpdateView.as_view(), name='user_profile_detail_update'), 
     path('profile/user/<int:pk>/activities/', UserActivityListView.as_view(), name='user_activities'), 
+    path('internal/metrics/', MetricsView.as_view(), name='api-metrics'),
 ]
\ No newline at end of file
@@ -5,21 +5,54 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from content.models import Rating, Review, Book, Movie, UserList, ListItem, Reply
 from feed.models import Follow, Activity
+from content.types import content_types
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.urls import reverse
+from django.db.models import Count, Prefetch
+from collections import defaultdict
+from urllib.parse import urlencode
 from .serializers import (
     RatingSerializer, ReviewSerializer, FollowSerializer, UserSerializer, 
     ActivitySerializer, RegisterSerializer, LoginSerializer, 
     PasswordResetRequestSerializer, PasswordResetConfirmSerializer, 
     BookSerializer, MovieSerializer, BookDetailSerializer, 
     MovieDetailSerializer, UserListDetailSerializer, ListItemSerializer, 
-    UserProfileSerializer, ReplySerializer
+    UserProfileSerializer, ReplySerializer, NestedReviewSerializer, ContentReviewSerializer,
+    LibraryListSerializer
 )
+from .prefetch import activity_content_prefetch, with_like_stats, with_list_item_content, first_items_per_list
+from .pagination import (ActivityCursorPagination, TimelineCursorPagination, MergedContentPagination, ReviewCursorPagination,
+    ListItemCursorPagination, SearchCursorPagination)
+from feed.timeline import timeline_sources
+from content.search import MAX_QUERY_TERMS, ranked_matches, load_matches
+from content.rankings import get_ranking, ranking_entities
+from content.facets import FACET_MODELS, MIN_YEAR, MAX_YEAR, filter_content, facet_counts
+from content.likes import LIKEABLE_MODELS, toggle_like
+from caching.decorators import cache_response, conditional_response
+from caching.tiered import stats as cache_stats
+from .metrics import registry
+from .bulk import bulk_rate, bulk_add_list_items, bulk_follow
+from .export import EXPORT_FORMATS, export_user_data, parse_export_types
+from django.http import StreamingHttpResponse
 from rest_framework.authtoken.models import Token
-from django.db.models import Q, Avg, Count
-from rest_framework.exceptions import NotFound
+from rest_framework.exceptions import NotFound, ParseError
 from users.models import CustomUser
 
 
+def _bulk_write(request, write):
+    # Gövde {"items": [...]} biçimindedir; geçerli satırlar yazılır, hatalı satırlar index ile raporlanır.
+    items = request.data.get('items') if isinstance(request.data, dict) else None
+    if not isinstance(items, list) or not items:
+        return Response({"detail": "'items' alanı boş olmayan bir liste olmalıdır."}, status=status.HTTP_400_BAD_REQUEST)
+    if len(items) > settings.BULK_WRITE_MAX_ITEMS:
+        return Response(
+            {"detail": f"Tek istekte en fazla {settings.BULK_WRITE_MAX_ITEMS} kayıt gönderilebilir."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return Response(write(request.user, items), status=status.HTTP_200_OK)
+
+
 class RatingViewSet(viewsets.ModelViewSet):
     serializer_class = RatingSerializer
     permission_classes = [permissions.IsAuthenticated] 
@@ -28,18 +61,11 @@ class RatingViewSet(viewsets.ModelViewSet):
         return Rating.objects.filter(user=self.request.user)
 
     def perform_create(self, serializer):
-        rating = serializer.save(user=self.request.user)
-
-        if not Activity.objects.filter(
-            user=self.request.user,
-            activity_type=1, 
-            object_id=rating.pk
-        ).exists():
-            Activity.objects.create(
-                user=self.request.user,
-                activity_type=1,
-                content_object=rating
-            )
+        serializer.save(user=self.request.user)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        return _bulk_write(request, bulk_rate)
 
 
 class ReviewViewSet(viewsets.ModelViewSet):
@@ -58,50 +84,38 @@ class ReviewViewSet(viewsets.ModelViewSet):
         return Review.objects.all() 
 
     def perform_create(self, serializer):
-        review = serializer.save(user=self.request.user)
-        
-        if not Activity.objects.filter(
-            user=self.request.user,
-            activity_type=2, 
-            object_id=review.pk
-        ).exists():
-            Activity.objects.create(
-                user=self.request.user,
-                activity_type=2, 
-                content_object=review
-            )
+        serializer.save(user=self.request.user)
         
     @action(detail=True, methods=['post'])
     def like(self, request, pk=None):
         if pk is None:
             return Response({"detail": "ID is missing."}, status=status.HTTP_400_BAD_REQUEST)
         
-        target_object = None
+        # Eski istemciler için: ID önce Review, bulunamazsa Rating olarak yorumlanır.
+        # Yeni istemciler tip belirten likes/<content_type>/<pk>/ uç noktasını kullanmalıdır.
+        for model in (Review, Rating):
+            if model.objects.filter(pk=pk).exists():
+                liked, likes_count = toggle_like(model, int(pk), request.user)
+                return Response({'status': 'liked' if liked else 'unliked', 'likes_count': likes_count}, status=status.HTTP_200_OK)
 
-        try:
-            target_object = Review.objects.get(pk=pk)
-        except Review.DoesNotExist:
-            pass
-            
-        if target_object is None:
-            try:
-                target_object = Rating.objects.get(pk=pk) 
-            except Rating.DoesNotExist:
-                pass
-
-        if target_object is None:
-            return Response({"detail": "No Review or Rating found for this ID."}, status=status.HTTP_404_NOT_FOUND)
-    
-        user = request.user
-        
-        if user in target_object.likes.all():
-            target_object.likes.remove(user)
-            return Response({'status': 'unliked'}, status=status.HTTP_200_OK)
-        else:
-            target_object.likes.add(user)
-            return Response({'status': 'liked'}, status=status.HTTP_200_OK)
+        return Response({"detail": "No Review or Rating found for this ID."}, status=status.HTTP_404_NOT_FOUND)
         
 
+class LikeToggleView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, content_type, pk):
+        model = LIKEABLE_MODELS.get(content_type.lower())
+        if model is None:
+            return Response({"detail": "Geçersiz içerik tipi."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not model.objects.filter(pk=pk).exists():
+            raise NotFound(f"Belirtilen {content_type} bulunamadı.")
+
+        liked, likes_count = toggle_like(model, pk, request.user)
+        return Response({'status': 'liked' if liked else 'unliked', 'likes_count': likes_count}, status=status.HTTP_200_OK)
+
+
 class FollowViewSet(viewsets.ModelViewSet):
     serializer_class = FollowSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -110,18 +124,11 @@ class FollowViewSet(viewsets.ModelViewSet):
         return Follow.objects.filter(follower=self.request.user)
 
     def perform_create(self, serializer):
-        follow = serializer.save(follower=self.request.user)
-        
-        if not Activity.objects.filter(
-            user=self.request.user, 
-            activity_type=4, 
-            object_id=follow.pk, 
-        ).exists():
-            Activity.objects.create(
-                user=self.request.user, 
-                activity_type=4,
-                content_object=follow
-            )
+        serializer.save(follower=self.request.user)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        return _bulk_write(request, bulk_follow)
 
 
 class RegisterAPIView(APIView):
@@ -177,14 +184,23 @@ class LogoutAPIView(APIView):
 class FeedListView(generics.ListAPIView):
     serializer_class = ActivitySerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 16
+    pagination_class = TimelineCursorPagination
 
     def get_queryset(self):
         user = self.request.user
-        following_ids = Follow.objects.filter(follower=user).values_list('following_id', flat=True)
-        feed_user_ids = list(following_ids) + [user.id]
-        queryset = Activity.objects.filter(user_id__in=feed_user_ids).select_related('user').order_by('-created_at')
-        
-        return queryset
+        return Activity.objects.select_related('user').prefetch_related(activity_content_prefetch(user))
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+
+        def load(activity_ids):
+            activities = queryset.order_by().in_bulk(activity_ids)
+            return [activities[pk] for pk in activity_ids if pk in activities]
+
+        page = self.paginator.paginate_timeline(timeline_sources(request.user), request, load)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
 
 class PasswordResetRequestView(APIView):
@@ -217,126 +233,160 @@ class PasswordResetConfirmView(APIView):
     
 class SearchAPIView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated] 
+    pagination_class = SearchCursorPagination
+    # Kelime başına bir aday sorgusu, bir puanlama sorgusu ve içerik tipi başına bir yükleme sorgusu.
+    query_budget = MAX_QUERY_TERMS + 3
 
+    @cache_response('search', settings.SEARCH_CACHE_TTL, vary_on=('q', 'cursor'), entities=lambda request: [('catalog',)])
     def list(self, request, *args, **kwargs):
         query = request.query_params.get('q', None)
         
         if not query:
             return Response({"detail": "Lütfen bir arama kelimesi girin."}, status=status.HTTP_400_BAD_REQUEST)
 
-        book_results = Book.objects.filter(
-            Q(title__icontains=query) | Q(authors__icontains=query) | Q(description__icontains=query)
-        ).distinct()
-        
-        movie_results = Movie.objects.filter(
-            Q(title__icontains=query) | Q(overview__icontains=query)
-        ).distinct()
-        
-        book_data = BookSerializer(book_results, many=True).data
-        for item in book_data:
-            item['content_type'] = 'Book'
+        page = self.paginate_queryset(ranked_matches(query))
 
-        movie_data = MovieSerializer(movie_results, many=True).data
-        for item in movie_data:
-            item['content_type'] = 'Movie'
-
-        results = book_data + movie_data
-        results.sort(key=lambda x: x['title'])
+        results = []
+        for content_obj in load_matches(page):
+            if isinstance(content_obj, Book):
+                item = BookSerializer(content_obj).data
+                item['content_type'] = 'Book'
+            else:
+                item = MovieSerializer(content_obj).data
+                item['content_type'] = 'Movie'
+            results.append(item)
 
-        return Response(results, status=status.HTTP_200_OK)
+        return self.get_paginated_response(results)
     
 
-class DiscoveryListView(generics.ListAPIView):
-    permission_classes = [permissions.IsAuthenticated] 
+DETAIL_TYPES = {
+    'book': (Book, BookDetailSerializer),
+    'movie': (Movie, MovieDetailSerializer),
+}
+
+
+def _detail_model(content_type):
+    entry = DETAIL_TYPES.get(content_type.lower())
+    if entry is None:
+        raise ParseError("Geçersiz içerik tipi.")
+    return entry
+
+
+def _content_entities(request, content_type, pk):
+    model, _ = _detail_model(content_type)
+    return [('content', content_types.id_for(model), pk)]
+
+
+def _viewer_content_entities(request, content_type, pk):
+    # Yorumların beğeni durumu ve izleyicinin puanı 'interactions' nesliyle izlenir.
+    return _content_entities(request, content_type, pk) + [('interactions', request.user.pk)]
 
-    def list(self, request, *args, **kwargs):
-        list_type = request.query_params.get('type', 'popular')
-        
-        top_books = Book.objects.annotate(
-            avg_score=Avg('rating__score')
-        ).filter(
-            avg_score__isnull=False
-        ).order_by('-avg_score')[:10]
-        
-        if list_type == 'popular':
-            top_movies = Movie.objects.order_by('-id')[:10] 
-        else: 
-            top_movies = Movie.objects.annotate(
-                avg_score=Avg('rating__score')
-            ).filter(
-                avg_score__isnull=False
-            ).order_by('-avg_score')[:10]
-        
-        response_data = []
-        
-        if list_type == 'top_rated':
-            book_data = BookSerializer(top_books, many=True).data
-            for item in book_data:
-                item['content_type'] = 'Book'
-                response_data.append(item)
-        
-        return Response(response_data, status=status.HTTP_200_OK)
-    
 
 class ContentDetailView(APIView):
     permission_classes = [permissions.IsAuthenticated] 
+    query_budget = 6
 
+    @conditional_response(_viewer_content_entities)
+    @cache_response('content_detail', settings.CONTENT_DETAIL_CACHE_TTL, entities=_content_entities, personalize='add_viewer_state')
     def get(self, request, content_type, pk):
-        try:
-            if content_type.lower() == 'book':
-                model = Book
-                serializer_class = BookDetailSerializer
-            elif content_type.lower() == 'movie':
-                model = Movie
-                serializer_class = MovieDetailSerializer 
-            else:
-                return Response({"detail": "Geçersiz içerik tipi."}, status=status.HTTP_400_BAD_REQUEST)
-                
-            content_obj = model.objects.get(pk=pk)
-            
-        except model.DoesNotExist:
+        # Yalnızca herkese açık kısım: içerik, ortalama puan ve yorumların ilk sayfası.
+        model, serializer_class = _detail_model(content_type)
+        content_obj = model.objects.filter(pk=pk).first()
+        if content_obj is None:
             raise NotFound(f"Belirtilen {content_type} bulunamadı.")
-            
-        serializer = serializer_class(content_obj, context={'request': request})
-        return Response(serializer.data)
+
+        page_size = ReviewCursorPagination.page_size
+        reviews = list(
+            Review.objects.filter(content_type=content_types.for_model(model), object_id=pk)
+            .select_related('user').order_by('-created_at', '-id')[:page_size + 1]
+        )
+        data = serializer_class(content_obj).data
+        data['reviews'] = NestedReviewSerializer(reviews[:page_size], many=True).data
+        data['reviews_cursor'] = ReviewCursorPagination.next_cursor(reviews, page_size)
+        return Response(data)
+
+    def add_viewer_state(self, request, data, content_type, pk):
+        model, _ = _detail_model(content_type)
+        content_type_id = content_types.id_for(model)
+
+        cursor = data.pop('reviews_cursor')
+        data['reviews_next'] = None
+        if cursor:
+            reviews_url = reverse('content-reviews', args=[content_type.lower(), pk])
+            data['reviews_next'] = request.build_absolute_uri(f"{reviews_url}?{urlencode({'cursor': cursor})}")
+
+        # İzleyiciye özel kısım: kendi puanı ve ilk sayfadaki yorumları beğenip beğenmediği.
+        data['user_score'] = Rating.objects.filter(
+            user=request.user, content_type_id=content_type_id, object_id=pk
+        ).values_list('score', flat=True).first()
+
+        review_ids = [review['id'] for review in data['reviews']]
+        liked_ids = set()
+        if review_ids:
+            liked_ids = set(Review.objects.filter(pk__in=review_ids, likes=request.user).values_list('pk', flat=True))
+        data['reviews'] = [{**review, 'is_liked': review['id'] in liked_ids} for review in data['reviews']]
+        return data
+
+
+class ContentReviewListView(generics.ListAPIView):
+    serializer_class = ContentReviewSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ReviewCursorPagination
+    query_budget = 4
+
+    def get_queryset(self):
+        model, _ = _detail_model(self.kwargs['content_type'])
+        queryset = Review.objects.filter(
+            content_type=content_types.for_model(model),
+            object_id=self.kwargs['pk'],
+        ).select_related('user')
+        return with_like_stats(queryset, self.request.user)
+
+    @conditional_response(_viewer_content_entities)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
     
 
 class UserDetailOrUpdateView(generics.RetrieveUpdateAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = UserProfileSerializer 
     permission_classes = [permissions.IsAuthenticated] 
+    query_budget = 3
     lookup_field = 'pk' 
 
+    @conditional_response(lambda request, pk: [('user', pk), ('user', request.user.pk)])
+    @cache_response('profile', settings.PROFILE_CACHE_TTL, entities=lambda request, pk: [('user', pk)], personalize='add_profile_status')
     def retrieve(self, request, *args, **kwargs):
         try:
             profile_user = self.get_object()
         except NotFound:
             raise NotFound("Kullanıcı bulunamadı.")
 
-        followers_count = Follow.objects.filter(following=profile_user).count()
-        following_count = Follow.objects.filter(follower=profile_user).count()
-
         serializer = self.get_serializer(profile_user).data 
-        
-        is_owner = (request.user.pk == profile_user.pk)
-        is_following = False
-        if not is_owner:
-            is_following = Follow.objects.filter(follower=request.user, following=profile_user).exists()
 
         response_data = {
             "user_details": serializer,
             "stats": {
-                "followers": followers_count,
-                "following": following_count,
+                "followers": profile_user.followers_count,
+                "following": profile_user.following_count,
             },
-            "profile_status": {
-                "is_owner": is_owner,
-                "is_following": is_following,
-            }
         }
         
         return Response(response_data, status=status.HTTP_200_OK)
 
+    def add_profile_status(self, request, data, *args, **kwargs):
+        profile_user_id = data['user_details']['id']
+        is_owner = (request.user.pk == profile_user_id)
+        is_following = False
+        if not is_owner:
+            is_following = Follow.objects.filter(follower=request.user, following_id=profile_user_id).exists()
+
+        data["profile_status"] = {
+            "is_owner": is_owner,
+            "is_following": is_following,
+        }
+        return data
+
     def get_object(self):
         if self.request.method in ['PUT', 'PATCH']:
              return self.request.user 
@@ -344,16 +394,87 @@ class UserDetailOrUpdateView(generics.RetrieveUpdateAPIView):
         return super().get_object() 
 
 
+def _user_list_entities(request):
+    # Liste öğelerindeki içerik özetleri katalog değişince eskir; 'catalog' nesli de izlenir.
+    list_ids = UserList.objects.filter(user=request.user).order_by('pk').values_list('pk', flat=True)
+    return [('lists', request.user.pk), ('catalog',)] + [('list', list_id) for list_id in list_ids]
+
+
 class UserListViewSet(viewsets.ModelViewSet):
     serializer_class = UserListDetailSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return UserList.objects.filter(user=self.request.user)
+        queryset = UserList.objects.filter(user=self.request.user)
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.prefetch_related(Prefetch('items', queryset=with_list_item_content(ListItem.objects.all())))
+        return queryset
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @conditional_response(_user_list_entities)
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @conditional_response(lambda request, pk: [('list', pk), ('catalog',)])
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    @action(detail=True, methods=['get'], pagination_class=ListItemCursorPagination)
+    @conditional_response(lambda request, pk: [('list', pk), ('catalog',)])
+    def items(self, request, pk=None):
+        user_list = self.get_object()
+        page = self.paginate_queryset(with_list_item_content(ListItem.objects.filter(list=user_list)))
+        return self.get_paginated_response(ListItemSerializer(page, many=True).data)
+
+
+class LibraryView(APIView):
+    # Kullanıcının tüm listeleri, her listenin ilk öğe sayfası ve içerik özetleriyle tek istekte.
+    # Sorgu sayısı liste ve öğe sayısından bağımsızdır.
+    permission_classes = [permissions.IsAuthenticated]
+    query_budget = 6
+
+    @conditional_response(_user_list_entities)
+    def get(self, request):
+        # İsteğe bağlı: verilen içeriğin hangi listelerde olduğu (liste ekleme/çıkarma penceresi için).
+        content_type = request.query_params.get('content_type')
+        object_id = request.query_params.get('object_id')
+        contained = None
+        if content_type or object_id:
+            model, _ = _detail_model(content_type or '')
+            try:
+                object_id = int(object_id)
+            except (TypeError, ValueError):
+                return Response({"detail": "object_id geçerli bir sayı olmalıdır."}, status=status.HTTP_400_BAD_REQUEST)
+            contained = dict(ListItem.objects.filter(
+                list__user=request.user, content_type=content_types.for_model(model), object_id=object_id,
+            ).values_list('list_id', 'pk'))
+
+        user_lists = list(
+            UserList.objects.filter(user=request.user).annotate(items_count=Count('items')).order_by('pk')
+        )
+        page_size = ListItemCursorPagination.page_size
+
+        items_by_list = defaultdict(list)
+        for item in first_items_per_list([user_list.pk for user_list in user_lists], page_size):
+            items_by_list[item.list_id].append(item)
+
+        results = []
+        for user_list, data in zip(user_lists, LibraryListSerializer(user_lists, many=True).data):
+            items = items_by_list[user_list.pk]
+            data['items'] = ListItemSerializer(items[:page_size], many=True).data
+            data['items_next'] = None
+            cursor = ListItemCursorPagination.next_cursor(items, page_size)
+            if cursor:
+                items_url = reverse('list-items', args=[user_list.pk])
+                data['items_next'] = request.build_absolute_uri(f"{items_url}?{urlencode({'cursor': cursor})}")
+            if contained is not None:
+                data['contains_item_id'] = contained.get(user_list.pk)
+            results.append(data)
+
+        return Response({'lists': results}, status=status.HTTP_200_OK)
+
 
 class ListItemViewSet(viewsets.ModelViewSet):
     serializer_class = ListItemSerializer
@@ -363,18 +484,11 @@ class ListItemViewSet(viewsets.ModelViewSet):
         return ListItem.objects.filter(list__user=self.request.user)
     
     def perform_create(self, serializer):
-        list_item = serializer.save()
-        
-        if not Activity.objects.filter(
-            user=self.request.user,
-            activity_type=3,
-            object_id=list_item.pk
-        ).exists():
-            Activity.objects.create(
-                user=self.request.user,
-                activity_type=3, 
-                content_object=list_item 
-            )
+        serializer.save()
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        return _bulk_write(request, bulk_add_list_items)
 
 
 class ReplyViewSet(viewsets.ModelViewSet):
@@ -391,44 +505,23 @@ class ReplyViewSet(viewsets.ModelViewSet):
 class DiscoveryListView(generics.ListAPIView):
     serializer_class = BookSerializer 
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 9
 
+    @cache_response('discovery', settings.DISCOVERY_CACHE_TTL, vary_on=('type',),
+                    entities=lambda request: ranking_entities(request.query_params.get('type', 'popular')))
     def list(self, request, *args, **kwargs):
         list_type = request.query_params.get('type', 'popular')
+        ranking = get_ranking(list_type)
         response_data = []
 
-        book_queryset = Book.objects.annotate(
-            avg_score=Avg('ratings__score'), 
-            review_count=Count('reviews'),
-            list_item_count=Count('list_items'),
-            
-            popularity_score=Count('reviews') + Count('list_items') 
-        )
-        movie_queryset = Movie.objects.annotate(
-            avg_score=Avg('ratings__score'),
-            review_count=Count('reviews'),
-            list_item_count=Count('list_items'),
-            
-            popularity_score=Count('reviews') + Count('list_items')
-        )
-        
-        if list_type == 'top_rated':
-            top_books = book_queryset.filter(avg_score__isnull=False).order_by('-avg_score', '-review_count')[:10]
-            top_movies = movie_queryset.filter(avg_score__isnull=False).order_by('-avg_score', '-review_count')[:10]
-            
-        elif list_type == 'popular':
-            top_books = book_queryset.order_by('-popularity_score', '-avg_score')[:10]
-            top_movies = movie_queryset.order_by('-popularity_score', '-avg_score')[:10]
-            
-        else:
-            top_books = book_queryset.order_by('-popularity_score', '-avg_score')[:10]
-            top_movies = movie_queryset.order_by('-popularity_score', '-avg_score')[:10]
-        
-        book_data = BookSerializer(top_books, many=True).data
+        books = Book.objects.in_bulk(ranking['book'])
+        book_data = BookSerializer([books[pk] for pk in ranking['book'] if pk in books], many=True).data
         for item in book_data:
             item['content_type'] = 'Book'
             response_data.append(item)
             
-        movie_data = MovieSerializer(top_movies, many=True).data
+        movies = Movie.objects.in_bulk(ranking['movie'])
+        movie_data = MovieSerializer([movies[pk] for pk in ranking['movie'] if pk in movies], many=True).data
         for item in movie_data:
             item['content_type'] = 'Movie'
             response_data.append(item)
@@ -438,67 +531,57 @@ class DiscoveryListView(generics.ListAPIView):
 
 class ContentFilterView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 10
+    pagination_class = MergedContentPagination
     
     def list(self, request, *args, **kwargs):
         genre = request.query_params.get('genre')
         min_score = request.query_params.get('min_score')
         year = request.query_params.get('year')
 
-        book_results = Book.objects.all()
-        movie_results = Movie.objects.all()
-
         if min_score:
             try:
-                min_score_float = float(min_score)
-                
-                book_results = book_results.annotate(
-                    avg_score=Avg('ratings__score')
-                ).filter(avg_score__gte=min_score_float, avg_score__isnull=False)
-                
-                movie_results = movie_results.annotate(
-                    avg_score=Avg('ratings__score')
-                ).filter(avg_score__gte=min_score_float, avg_score__isnull=False)
-                
+                min_score = float(min_score)
             except ValueError:
                 return Response({"detail": "min_score geçerli bir sayı olmalıdır."}, status=status.HTTP_400_BAD_REQUEST)
-        
-        if genre:
-            book_results = book_results.filter(genres_list__icontains=genre)
-            
-            movie_results = movie_results.filter(genres_list__icontains=genre)
+        else:
+            min_score = None
 
         if year:
             try:
-                int(year) 
-                book_results = book_results.filter(publication_year=year) 
+                year = int(year)
             except ValueError:
-                 pass 
-            
-            movie_results = movie_results.filter(release_date__year=year) 
-        
-        response_data = []
-        
-        book_data = BookSerializer(book_results, many=True).data
-        for item in book_data:
-            item['content_type'] = 'Book'
-            item['avg_score'] = getattr(item, 'avg_score', None)
-            response_data.append(item)
+                year = None
+            if year is None or not MIN_YEAR <= year <= MAX_YEAR:
+                return Response({"detail": "year geçerli bir yıl olmalıdır."}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            year = None
 
-        movie_data = MovieSerializer(movie_results, many=True).data
-        for item in movie_data:
-            item['content_type'] = 'Movie'
-            item['avg_score'] = getattr(item, 'avg_score', None)
+        querysets_by_model = {
+            model: filter_content(model, genre=genre, year=year, min_score=min_score)
+            for model in FACET_MODELS
+        }
+        page = self.paginator.paginate_querysets(list(querysets_by_model.values()), request)
+
+        response_data = []
+        for content_obj in page:
+            if isinstance(content_obj, Book):
+                item = BookSerializer(content_obj).data
+                item['content_type'] = 'Book'
+            else:
+                item = MovieSerializer(content_obj).data
+                item['content_type'] = 'Movie'
+            item['avg_score'] = content_obj.avg_score
             response_data.append(item)
 
-        if min_score:
-            response_data.sort(key=lambda x: x.get('avg_score', 0) or 0, reverse=True)
-            
-        return Response(response_data, status=status.HTTP_200_OK)
+        return self.paginator.get_paginated_response(response_data, facets=facet_counts(querysets_by_model))
     
 
 class UserActivityListView(generics.ListAPIView):
     serializer_class = ActivitySerializer
     permission_classes = [permissions.IsAuthenticated]
+    query_budget = 16
+    pagination_class = ActivityCursorPagination
 
     def get_queryset(self):
         user_pk = self.kwargs.get('pk')
@@ -508,6 +591,47 @@ class UserActivityListView(generics.ListAPIView):
         except CustomUser.DoesNotExist:
             raise NotFound("Bu ID'ye sahip kullanıcı bulunamadı.")
 
-        queryset = Activity.objects.filter(user=target_user).select_related('user').order_by('-created_at')
+        queryset = Activity.objects.filter(user=target_user).select_related('user').prefetch_related(
+            activity_content_prefetch(self.request.user)
+        ).order_by('-created_at')
         
-        return queryset
\ No newline at end of file
+        return queryset
+
+
+class UserExportView(APIView):
+    # Kullanıcının puan, yorum, yanıt, liste ve takiplerini NDJSON ya da CSV olarak akıtır.
+    # DRF'nin ?format= parametresiyle çakışmaması için biçim ?output= ile seçilir.
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        output = request.query_params.get('output', 'ndjson')
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"Geçersiz çıktı biçimi. Geçerli biçimler: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            types = parse_export_types(request.query_params.get('types'))
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        render, content_type = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(
+            render(export_user_data(request.user, types, chunk_size=settings.EXPORT_CHUNK_SIZE)),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{request.user.username}-export.{output}"'
+        response['Cache-Control'] = 'no-store'
+        return response
+
+
+class MetricsView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({'views': registry.snapshot(), 'cache': cache_stats.snapshot()}, status=status.HTTP_200_OK)
+
+    def delete(self, request):
+        registry.reset()
+        cache_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
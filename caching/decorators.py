@@ -0,0 +1,104 @@
+import hashlib
+import math
+from functools import wraps
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
+from .tiered import generations, tiered_cache
+
+
+class UncacheableResponse(Exception):
+    def __init__(self, response):
+        self.response = response
+
+
+class CachePolicy:
+    def __init__(self, namespace, ttl, vary_on=(), entities=None, personalize=None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.vary_on = tuple(vary_on)
+        self.entities = entities
+        self.personalize = personalize
+
+    def key_parts(self, request, kwargs):
+        # Yanıttaki mutlak bağlantılar (sayfalama) host'a bağlı olduğu için host da anahtara girer.
+        return (
+            request.get_host(),
+            tuple(sorted(kwargs.items())),
+            tuple((name, request.query_params.get(name)) for name in self.vary_on),
+        )
+
+    def entities_for(self, request, kwargs):
+        return self.entities(request, **kwargs) if self.entities else ()
+
+
+def cache_response(namespace, ttl, vary_on=(), entities=None, personalize=None):
+    # View metodunun ürettiği (herkese açık) yanıt verisi katmanlı önbelleğe yazılır.
+    # entities: isteğe göre (varlık, ...) demetleri döner; bu varlıklardan birinin nesli artınca anahtar değişir.
+    # personalize: önbellekten gelen veriye izleyiciye özel alanları ekleyen view metodunun adı.
+    policy = CachePolicy(namespace, ttl, vary_on, entities, personalize)
+
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            def build():
+                response = handler(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    raise UncacheableResponse(response)
+                return response.data
+
+            try:
+                if settings.CACHE_VIEWS_ENABLED:
+                    data = tiered_cache.fetch(
+                        policy.namespace,
+                        policy.key_parts(request, kwargs),
+                        build,
+                        policy.ttl,
+                        policy.entities_for(request, kwargs),
+                    )
+                else:
+                    data = build()
+            except UncacheableResponse as exc:
+                return exc.response
+
+            if policy.personalize:
+                data = getattr(view, policy.personalize)(request, data, *args, **kwargs)
+            return Response(data)
+
+        wrapper.cache_policy = policy
+        return wrapper
+    return decorator
+
+
+def conditional_response(entities):
+    # ETag ve Last-Modified yalnızca varlık nesillerinden (tek bir önbellek okuması) hesaplanır;
+    # istemcinin sürümü güncelse view hiç çalışmaz, sorgu ve serileştirme yapılmadan 304 dönülür.
+    # entities: isteğe göre (varlık, ...) demetleri döner; yanıtı etkileyen her varlık listede olmalıdır.
+    def decorator(handler):
+        @wraps(handler)
+        def wrapper(view, request, *args, **kwargs):
+            tracked = list(entities(request, **kwargs))
+            stamps = generations(tracked)
+            digest = hashlib.sha256(repr((
+                tracked, stamps, request.user.pk, request.build_absolute_uri(), request.accepted_renderer.format,
+            )).encode('utf-8')).hexdigest()
+            etag = quote_etag(digest[:32])
+            # Last-Modified saniye hassasiyetindedir; aynı saniyedeki değişiklikleri yalnızca ETag ayırt eder.
+            last_modified = math.ceil(max(stamps) / 1e9) if stamps else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = handler(view, request, *args, **kwargs)
+
+            if response.status_code in (200, 304):
+                response.headers['ETag'] = etag
+                if last_modified is not None:
+                    response.headers['Last-Modified'] = http_date(last_modified)
+                # Tarayıcı yanıtı saklar ama her seferinde doğrular; yanıt izleyiciye özeldir.
+                patch_cache_control(response, private=True, no_cache=True)
+                patch_vary_headers(response, ('Authorization',))
+            return response
+
+        return wrapper
+    return decorator
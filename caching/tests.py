@@ -0,0 +1,111 @@
+import threading
+import time
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+from .tiered import TieredCache, stats
+
+
+TEST_CACHES = {
+    'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'caching-default'},
+    'local': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'caching-local'},
+}
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return not any(thread.is_alive() for thread in threads)
+
+
+@override_settings(CACHES=TEST_CACHES, CACHE_BACKGROUND_REFRESH=False)
+class TieredCacheTests(SimpleTestCase):
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        stats.reset()
+        self.cache = TieredCache()
+        self.builds = 0
+
+    def counting_build(self, delay=0):
+        def build():
+            time.sleep(delay)
+            self.builds += 1
+            return self.builds
+        return build
+
+    def test_concurrent_misses_build_once(self):
+        build = self.counting_build(delay=0.2)
+        results = []
+
+        def fetch():
+            results.append(self.cache.fetch('test', ('key',), build, 60))
+
+        self.assertTrue(run_threads(fetch, 8))
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(results, [1] * 8)
+        self.assertEqual(stats.snapshot()['test']['misses'], 8)
+
+    def test_failed_build_lets_waiters_build(self):
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            time.sleep(0.1)
+            raise ValueError("bozuk")
+
+        results = []
+        owner = threading.Thread(target=lambda: self.assertRaises(ValueError, self.cache.fetch, 'test', ('key',), failing, 60))
+        owner.start()
+        started.wait(5)
+        waiter = threading.Thread(target=lambda: results.append(self.cache.fetch('test', ('key',), self.counting_build(), 60)))
+        waiter.start()
+        owner.join(5)
+        waiter.join(5)
+        self.assertEqual(results, [1])
+
+    def test_stale_value_is_served_while_refreshing(self):
+        build = self.counting_build()
+        # ttl=0: kayıt yazıldığı anda bayatlar ama CACHE_STALE_TTL boyunca okunabilir.
+        self.assertEqual(self.cache.fetch('test', ('key',), build, 0), 1)
+        self.assertEqual(self.cache.fetch('test', ('key',), build, 0), 1)
+        self.assertEqual(self.cache.fetch('test', ('key',), build, 0), 2)
+        counts = stats.snapshot()['test']
+        self.assertEqual((counts['misses'], counts['stale_hits'], counts['refreshes']), (1, 2, 2))
+
+    @override_settings(CACHE_BACKGROUND_REFRESH=True)
+    def test_background_refresh_does_not_block_readers(self):
+        release = threading.Event()
+
+        def slow_build():
+            release.wait(5)
+            return 'yeni'
+
+        self.cache.fetch('test', ('key',), lambda: 'eski', 0)
+        self.assertEqual(self.cache.fetch('test', ('key',), slow_build, 0), 'eski')
+        # Yenileme sürerken gelen okuma ikinci bir yenileme başlatmaz.
+        self.assertEqual(self.cache.fetch('test', ('key',), self.counting_build(), 0), 'eski')
+        release.set()
+        self.cache._executor.shutdown(wait=True)
+
+        self.assertEqual(self.builds, 0)
+        self.assertEqual(stats.snapshot()['test']['refreshes'], 1)
+        envelope, _ = self.cache._read(self.cache.make_key('test', ('key',)))
+        self.assertEqual(envelope[0], 'yeni')
+
+    def test_nested_fetch_inside_build(self):
+        # Sıralamalar keşif yanıtının build()'i içinden okunur; iç içe doldurma kilitlenmemelidir.
+        results = []
+
+        def outer():
+            inner = self.cache.fetch('rankings', ('top_rated',), lambda: [1, 2], 60)
+            same = self.cache.fetch('discovery', ('top_rated',), lambda: 'iç', 60)
+            return {'ids': inner, 'same': same}
+
+        def fetch():
+            results.append(self.cache.fetch('discovery', ('top_rated',), outer, 60))
+
+        self.assertTrue(run_threads(fetch, 4))
+        self.assertEqual(results, [{'ids': [1, 2], 'same': 'iç'}] * 4)
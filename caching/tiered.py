@@ -0,0 +1,254 @@
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import caches
+from django.db import close_old_connections
+
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._namespaces = {}
+
+    def record(self, namespace, event):
+        with self._lock:
+            self._namespaces.setdefault(namespace, Counter())[event] += 1
+
+    def snapshot(self):
+        with self._lock:
+            namespaces = {name: dict(counter) for name, counter in self._namespaces.items()}
+
+        for counter in namespaces.values():
+            hits = counter.get('local_hits', 0) + counter.get('shared_hits', 0) + counter.get('stale_hits', 0)
+            total = hits + counter.get('misses', 0)
+            counter['hit_rate'] = round(hits / total, 3) if total else None
+        return namespaces
+
+    def reset(self):
+        with self._lock:
+            self._namespaces.clear()
+
+
+stats = CacheStats()
+
+
+def _generation_key(entity):
+    return 'generation:' + ':'.join(str(part) for part in entity)
+
+
+def generations(entities):
+    # Nesil anahtarları yalnızca paylaşılan katmanda tutulur; böylece bir süreçteki geçersiz kılma tüm süreçlerde görünür.
+    shared = caches['default']
+    keys = [_generation_key(entity) for entity in entities]
+    found = shared.get_many(keys) if keys else {}
+    for key in keys:
+        if key not in found:
+            # Anahtar hiç yoksa ya da önbellekten düştüyse daha önce kullanılmamış bir nesil seçilir.
+            candidate = time.time_ns()
+            shared.add(key, candidate, None)
+            found[key] = shared.get(key, candidate)
+    return [found[key] for key in keys]
+
+
+def bump_generation(*entity):
+    # Eski nesle ait kayıtlar silinmez; yeni anahtarla artık okunmazlar ve TTL ile düşerler.
+    caches['default'].set(_generation_key(entity), time.time_ns(), None)
+
+
+def bump_generations(entities):
+    stamp = time.time_ns()
+    caches['default'].set_many({_generation_key(entity): stamp for entity in entities}, None)
+
+
+class _Fill:
+    # Süreç içinde bir anahtar için devam eden üretim; bekleyenler done olayını bekler.
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+        self.done = threading.Event()
+
+
+class TieredCache:
+    # Süreç içi LRU katmanı ('local') önde, süreçler arası paylaşılan katman ('default') arkada.
+    # shared_alias=None ile yalnızca süreç içi katman kullanılır; nesiller yine paylaşılan katmandadır.
+    # Kayıtlar (değer, taze_bitiş, son_kullanma) zarfıyla saklanır: taze süre (soft TTL) geçince
+    # eski değer dönülür ve arka planda yenilenir; son kullanma (hard TTL) geçince kayıt düşer.
+    def __init__(self, local_alias='local', shared_alias='default'):
+        self.local_alias = local_alias
+        self.shared_alias = shared_alias
+        self._fills = {}
+        self._fills_lock = threading.Lock()
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+        self._executor = None
+
+    @property
+    def local(self):
+        return caches[self.local_alias]
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    def make_key(self, namespace, parts, entities=()):
+        digest = hashlib.sha256(repr((tuple(parts), generations(entities))).encode('utf-8')).hexdigest()
+        return f"{namespace}:{digest[:40]}"
+
+    def fetch(self, namespace, parts, build, ttl, entities=()):
+        key = self.make_key(namespace, parts, entities)
+        envelope, tier = self._read(key)
+        if envelope is not None:
+            value, fresh_until, _ = envelope
+            if time.time() < fresh_until:
+                stats.record(namespace, f"{tier}_hits")
+                return value
+
+            stats.record(namespace, 'stale_hits')
+            self._refresh(namespace, key, build, ttl)
+            return value
+
+        stats.record(namespace, 'misses')
+        return self._fill(namespace, key, build, ttl)
+
+    def set(self, namespace, parts, value, ttl, entities=()):
+        self._write(self.make_key(namespace, parts, entities), value, ttl)
+
+    def _read(self, key):
+        envelope = self.local.get(key)
+        if (envelope is not None and time.time() < envelope[1]) or self.shared is None:
+            return envelope, 'local'
+
+        shared_envelope = self.shared.get(key)
+        if shared_envelope is not None and (envelope is None or shared_envelope[1] > envelope[1]):
+            self.local.set(key, shared_envelope, max(1, int(shared_envelope[2] - time.time())))
+            return shared_envelope, 'shared'
+        return envelope, 'local'
+
+    def _write(self, key, value, ttl):
+        now = time.time()
+        timeout = ttl + settings.CACHE_STALE_TTL
+        envelope = (value, now + ttl, now + timeout)
+        self.local.set(key, envelope, timeout)
+        if self.shared is not None:
+            self.shared.set(key, envelope, timeout)
+
+    def _acquire(self, key):
+        token = uuid.uuid4().hex
+        if self.shared is None or self.shared.add(f"{key}:lock", token, settings.CACHE_LOCK_TIMEOUT):
+            return token
+        return None
+
+    def _release(self, key, token):
+        if self.shared is not None and self.shared.get(f"{key}:lock") == token:
+            self.shared.delete(f"{key}:lock")
+
+    def _fill(self, namespace, key, build, ttl):
+        # Aynı süreçteki eşzamanlı ıskalardan yalnızca ilki değeri üretir; diğerleri onun bitmesini bekleyip
+        # yazdığı değeri okur. Üretim sırasında hiçbir süreç içi kilit tutulmaz: build() içinde başka bir
+        # anahtar için fetch çağrılabilir ve farklı anahtarlar birbirini beklemez.
+        with self._fills_lock:
+            fill = self._fills.get(key)
+            if fill is None:
+                fill = self._fills[key] = _Fill()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            if fill.thread_id == threading.get_ident():
+                # Aynı anahtar kendi build()'i içinden istendi; beklemek kilitlenme olurdu.
+                return build()
+            fill.done.wait(settings.CACHE_LOCK_TIMEOUT)
+            envelope, _ = self._read(key)
+            if envelope is not None:
+                stats.record(namespace, 'waits')
+                return envelope[0]
+            # Üreten istek hata verdi ya da süre aştı; istek değeri kendisi üretir.
+            return self._build(namespace, key, build, ttl)
+
+        try:
+            return self._build(namespace, key, build, ttl)
+        finally:
+            with self._fills_lock:
+                del self._fills[key]
+            fill.done.set()
+
+    def _build(self, namespace, key, build, ttl):
+        # Süreçler arası tekillik paylaşılan katmandaki kilit anahtarıyla sağlanır.
+        envelope, _ = self._read(key)
+        if envelope is not None:
+            return envelope[0]
+
+        token = self._acquire(key)
+        if token is None:
+            envelope = self._wait(key)
+            if envelope is not None:
+                stats.record(namespace, 'waits')
+                return envelope[0]
+
+        try:
+            value = build()
+            self._write(key, value, ttl)
+        finally:
+            if token is not None:
+                self._release(key, token)
+        return value
+
+    def _wait(self, key):
+        # Değeri başka bir süreç üretiyor; kilit süresi dolana kadar beklenir, sonra istek kendisi üretir.
+        deadline = time.monotonic() + settings.CACHE_LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            envelope = self.shared.get(key)
+            if envelope is not None:
+                return envelope
+        return None
+
+    def _refresh(self, namespace, key, build, ttl):
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        token = self._acquire(key)
+        if token is None:
+            with self._refreshing_lock:
+                self._refreshing.discard(key)
+            return
+
+        def refresh():
+            try:
+                self._write(key, build(), ttl)
+                stats.record(namespace, 'refreshes')
+            except Exception:
+                stats.record(namespace, 'refresh_errors')
+                logger.exception("Önbellek kaydı yenilenemedi: %s", key)
+            finally:
+                self._release(key, token)
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+                if settings.CACHE_BACKGROUND_REFRESH:
+                    close_old_connections()
+
+        if settings.CACHE_BACKGROUND_REFRESH:
+            self._get_executor().submit(refresh)
+        else:
+            refresh()
+
+    def _get_executor(self):
+        with self._refreshing_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=settings.CACHE_REFRESH_WORKERS, thread_name_prefix='cache-refresh'
+                )
+        return self._executor
+
+
+tiered_cache = TieredCache()
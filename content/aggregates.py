@@ -0,0 +1,98 @@
+from django.db.models import Avg, Case, Count, F, FloatField, IntegerField, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Cast, Coalesce
+from .models import Book, Movie, Rating
+from .types import content_types
+
+
+RATED_MODELS = (Book, Movie)
+
+
+def apply_rating_change(content_type_id, object_id, count_delta, sum_delta):
+    model = content_types.model_for_id(content_type_id)
+    if model not in RATED_MODELS or (count_delta == 0 and sum_delta == 0):
+        return
+
+    new_count = F('rating_count') + count_delta
+    new_sum = F('rating_sum') + sum_delta
+
+    # Tek bir UPDATE ile artımlı güncelleme; eşzamanlı puanlamalar birbirini ezmez.
+    # avg_score ilk sırada yazılmalı: MySQL SET ifadelerini soldan sağa değerlendirir ve sonraki ifadeler
+    # önceki atamaların yeni değerini görür. Diğer veritabanlarında tüm ifadeler eski değeri okur.
+    model.objects.filter(pk=object_id).update(
+        avg_score=Case(
+            When(rating_count__lte=-count_delta, then=Value(None)),
+            default=Cast(new_sum, FloatField()) / new_count,
+            output_field=FloatField(),
+        ),
+        rating_count=new_count,
+        rating_sum=new_sum,
+    )
+
+
+def refresh_rating_aggregate(content_type_id, object_id):
+    refresh_rating_aggregates(content_type_id, [object_id])
+
+
+def refresh_rating_aggregates(content_type_id, object_ids):
+    # Özet, Rating tablosundan tek bir UPDATE ile yeniden hesaplanır; aynı iş tekrar çalışsa da sonuç değişmez.
+    model = content_types.model_for_id(content_type_id)
+    if model not in RATED_MODELS:
+        return
+
+    ratings = Rating.objects.filter(content_type_id=content_type_id, object_id=OuterRef('pk')).order_by().values('object_id')
+
+    def rating_stat(aggregate, output_field):
+        return Subquery(ratings.annotate(value=aggregate).values('value'), output_field=output_field)
+
+    model.objects.filter(pk__in=object_ids).update(
+        rating_count=Coalesce(rating_stat(Count('id'), IntegerField()), Value(0)),
+        rating_sum=Coalesce(rating_stat(Sum('score'), IntegerField()), Value(0)),
+        avg_score=rating_stat(Avg('score'), FloatField()),
+    )
+
+
+def compute_aggregates(model):
+    content_type = content_types.for_model(model)
+    rows = Rating.objects.filter(content_type=content_type).order_by().values('object_id').annotate(
+        total_count=Count('id'),
+        total_sum=Sum('score'),
+    )
+    return {row['object_id']: (row['total_count'], row['total_sum']) for row in rows}
+
+
+def _matches(instance, rating_count, rating_sum, avg_score):
+    if (instance.rating_count, instance.rating_sum) != (rating_count, rating_sum):
+        return False
+    if instance.avg_score is None or avg_score is None:
+        return instance.avg_score is avg_score
+    return abs(instance.avg_score - avg_score) < 1e-9
+
+
+def rebuild_aggregates(model, verify_only=False, batch_size=1000):
+    expected = compute_aggregates(model)
+    mismatched = []
+    pending = []
+
+    for instance in model.objects.only('pk', 'rating_count', 'rating_sum', 'avg_score').iterator(chunk_size=batch_size):
+        rating_count, rating_sum = expected.get(instance.pk, (0, 0))
+        avg_score = rating_sum / rating_count if rating_count else None
+
+        if _matches(instance, rating_count, rating_sum, avg_score):
+            continue
+
+        mismatched.append(instance.pk)
+        if verify_only:
+            continue
+
+        instance.rating_count = rating_count
+        instance.rating_sum = rating_sum
+        instance.avg_score = avg_score
+        pending.append(instance)
+        if len(pending) >= batch_size:
+            model.objects.bulk_update(pending, ['rating_count', 'rating_sum', 'avg_score'])
+            pending = []
+
+    if pending:
+        model.objects.bulk_update(pending, ['rating_count', 'rating_sum', 'avg_score'])
+
+    return mismatched
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class ContentConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'content'
+
+    def ready(self):
+        import content.signals
+        from .models import Book, Movie, Rating, Review, Reply, UserList, ListItem
+        from .types import content_types
+
+        for model in (Book, Movie, Rating, Review, Reply, UserList, ListItem):
+            content_types.register(model._meta.model_name, model)
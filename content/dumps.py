@@ -0,0 +1,196 @@
+import csv
+import gzip
+import json
+import time
+from collections import Counter
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from caching.tiered import bump_generations
+from social_media_project.db import batches, keyset_chunks, upsert_options
+from .models import Book, Movie, SearchTerm, ContentGenre
+from .types import content_types
+from .search import index_new_content
+from .genres import link_new_content
+from .rankings import invalidate_rankings
+
+
+# Puan özetleri dökümlere yazılmaz; Rating tablosundan türetilir (rebuild_rating_aggregates).
+CATALOG_FIELDS = {
+    Book: ('google_books_id', 'title', 'authors', 'description', 'page_count', 'cover_url', 'publication_year', 'genres_list'),
+    Movie: ('tmdb_id', 'title', 'overview', 'release_date', 'poster_path', 'director_name', 'actors_list', 'genres_list'),
+}
+
+CATALOG_KEYS = {Book: 'google_books_id', Movie: 'tmdb_id'}
+
+DUMP_FORMATS = ('jsonl', 'csv')
+
+MAX_REPORTED_ERRORS = 20
+
+
+def dump_format(path, explicit=None):
+    if explicit:
+        return explicit
+    name = path[:-3] if path.endswith('.gz') else path
+    if name.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name.endswith('.csv'):
+        return 'csv'
+    raise ValueError(f"Dosya biçimi uzantıdan anlaşılamadı: {path}")
+
+
+def open_dump(path, mode='r'):
+    # .gz uzantılı dosyalar akış halinde açılır/sıkıştırılır; dosya belleğe okunmaz.
+    opener = gzip.open if path.endswith('.gz') else open
+    return opener(path, mode + 't', encoding='utf-8', newline='')
+
+
+def read_dump(stream, fmt):
+    # (satır numarası, kayıt) çiftleri üretir; çözümlenemeyen satırlar için kayıt None'dır.
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        yield line_number, record if isinstance(record, dict) else None
+
+
+def clean_record(model, raw):
+    # CSV hücreleri metin gelir; değerler model alanlarının to_python'ı ile dönüştürülür.
+    record = {}
+    key_field = CATALOG_KEYS[model]
+    for name in CATALOG_FIELDS[model]:
+        field = model._meta.get_field(name)
+        value = raw.get(name)
+        if name == key_field and isinstance(value, str):
+            value = value.strip()
+        if value == '' and (field.null or name == key_field):
+            value = None
+        if value is None:
+            if name == key_field:
+                raise ValidationError(f"'{name}' alanı zorunludur.")
+            record[name] = None if field.null else ''
+            continue
+
+        try:
+            value = field.to_python(value)
+        except (TypeError, ValueError):
+            # JSON'da beklenmeyen tipte değer (ör. release_date: 2020) satır hatası olarak raporlanır.
+            raise ValidationError(f"'{name}' alanı için geçersiz değer: {value!r}")
+        if isinstance(value, str) and field.max_length:
+            value = value[:field.max_length]
+        record[name] = value
+    return record
+
+
+def _changed(record, row):
+    return row is None or any(row[name] != value for name, value in record.items())
+
+
+def _upsert_batch(model, records, update_existing):
+    key_field = CATALOG_KEYS[model]
+    content_type = content_types.for_model(model)
+
+    with transaction.atomic():
+        keys = [record[key_field] for record in records]
+        existing = {
+            row[key_field]: row
+            for row in model.objects.filter(**{f"{key_field}__in": keys}).values('pk', *CATALOG_FIELDS[model])
+        }
+        if update_existing:
+            # Değişmemiş kayıtlar yeniden yazılmaz ve yeniden indekslenmez; aynı dökümü tekrar yüklemek ucuzdur.
+            written = [record for record in records if _changed(record, existing.get(record[key_field]))]
+            options = upsert_options([key_field], [name for name in CATALOG_FIELDS[model] if name != key_field])
+        else:
+            written = [record for record in records if record[key_field] not in existing]
+            options = {'ignore_conflicts': True}
+        model.objects.bulk_create([model(**record) for record in written], **options)
+
+        # bulk_create sinyal göndermez; arama terimleri ve tür bağlantıları parti başına toplu yenilenir.
+        stale_ids = [existing[record[key_field]]['pk'] for record in written if record[key_field] in existing]
+        if stale_ids:
+            SearchTerm.objects.filter(content_type=content_type, object_id__in=stale_ids).delete()
+            ContentGenre.objects.filter(content_type=content_type, object_id__in=stale_ids).delete()
+            transaction.on_commit(
+                lambda: bump_generations(('content', content_type.pk, object_id) for object_id in stale_ids)
+            )
+
+        instances = list(model.objects.filter(**{f"{key_field}__in": [record[key_field] for record in written]}))
+        index_new_content(instances)
+        link_new_content(instances)
+
+    return len(written) - len(stale_ids), len(stale_ids)
+
+
+def import_catalog(model, rows, batch_size=5000, update_existing=True, progress=None):
+    # rows: read_dump'ın ürettiği (konum, kayıt) çiftleri. Aynı anahtar bir partide birden fazla kez
+    # geçerse son kayıt kullanılır; partiler arası tekrarlar upsert ile zararsızdır.
+    key_field = CATALOG_KEYS[model]
+    stats = Counter()
+    errors = []
+    started_at = time.monotonic()
+
+    def valid_records():
+        for position, raw in rows:
+            stats['read'] += 1
+            try:
+                if raw is None:
+                    raise ValidationError("Kayıt çözümlenemedi.")
+                yield clean_record(model, raw)
+            except ValidationError as exc:
+                stats['invalid'] += 1
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append({'position': position, 'errors': exc.messages})
+
+    for batch in batches(valid_records(), batch_size):
+        unique = {record[key_field]: record for record in batch}
+        stats['duplicates'] += len(batch) - len(unique)
+        created, updated = _upsert_batch(model, list(unique.values()), update_existing)
+        stats['created'] += created
+        stats['updated'] += updated
+        stats['unchanged'] += len(unique) - created - updated
+        if progress:
+            progress(stats, time.monotonic() - started_at)
+
+    if stats['created'] or stats['updated']:
+        transaction.on_commit(invalidate_rankings)
+
+    elapsed = time.monotonic() - started_at
+    return {
+        **stats,
+        'errors': errors,
+        'seconds': round(elapsed, 2),
+        'records_per_second': round(stats['read'] / elapsed) if elapsed else None,
+    }
+
+
+def export_catalog(model, chunk_size=5000):
+    fields = CATALOG_FIELDS[model]
+    for rows in keyset_chunks(model.objects.all(), chunk_size, *fields):
+        yield [{name: row[name] for name in fields} for row in rows]
+
+
+def write_dump(stream, fmt, model, chunks):
+    written = 0
+    if fmt == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=CATALOG_FIELDS[model])
+        writer.writeheader()
+        for rows in chunks:
+            writer.writerows(rows)
+            written += len(rows)
+        return written
+
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for rows in chunks:
+        stream.write(''.join(encoder.encode(row) + '\n' for row in rows))
+        written += len(rows)
+    return written
@@ -0,0 +1,80 @@
+from datetime import date
+from collections import Counter
+from django.db.models import Count, F
+from django.db.models.functions import ExtractYear
+from .models import Book, Movie, ContentGenre
+from .types import content_types
+from .genres import genre_slug
+
+
+FACET_MODELS = (Book, Movie)
+MAX_GENRE_FACETS = 20
+
+# Film yılı date(year + 1, 1, 1) ile aralığa çevrildiğinden üst sınır 9998'dir.
+MIN_YEAR = 1
+MAX_YEAR = 9998
+
+
+def filter_content(model, genre=None, year=None, min_score=None):
+    queryset = model.objects.all()
+
+    if genre:
+        queryset = queryset.filter(pk__in=ContentGenre.objects.filter(
+            content_type=content_types.for_model(model),
+            genre__slug=genre_slug(genre),
+        ).values('object_id'))
+
+    if year is not None:
+        if model is Book:
+            queryset = queryset.filter(publication_year=year)
+        else:
+            queryset = queryset.filter(release_date__gte=date(year, 1, 1), release_date__lt=date(year + 1, 1, 1))
+
+    if min_score is not None:
+        queryset = queryset.filter(avg_score__gte=min_score)
+
+    return queryset
+
+
+def ordered_content(queryset):
+    return queryset.order_by(F('avg_score').desc(nulls_last=True), 'title', 'pk')
+
+
+def sort_key(content_obj):
+    avg_score = content_obj.avg_score
+    return (avg_score is None, -(avg_score or 0), content_obj.title, content_obj.__class__.__name__, content_obj.pk)
+
+
+def merged_page(querysets, offset, limit):
+    # Her tipten en fazla offset + limit kayıt alınıp aynı sıralama anahtarıyla birleştirilir.
+    candidates = []
+    for queryset in querysets:
+        candidates.extend(ordered_content(queryset)[:offset + limit])
+    candidates.sort(key=sort_key)
+    return candidates[offset:offset + limit]
+
+
+def facet_counts(querysets_by_model):
+    genres = Counter()
+    years = Counter()
+
+    for model, queryset in querysets_by_model.items():
+        content_type = content_types.for_model(model)
+        genre_rows = ContentGenre.objects.filter(
+            content_type=content_type,
+            object_id__in=queryset.values('pk'),
+        ).values('genre__name').annotate(total=Count('id')).order_by()
+        for row in genre_rows:
+            genres[row['genre__name']] += row['total']
+
+        if model is Book:
+            year_rows = queryset.exclude(publication_year__isnull=True).values(year=F('publication_year'))
+        else:
+            year_rows = queryset.exclude(release_date__isnull=True).values(year=ExtractYear('release_date'))
+        for row in year_rows.annotate(total=Count('id')).order_by():
+            years[row['year']] += row['total']
+
+    return {
+        'genres': [{'name': name, 'count': count} for name, count in genres.most_common(MAX_GENRE_FACETS)],
+        'years': [{'year': year, 'count': years[year]} for year in sorted(years, reverse=True)],
+    }
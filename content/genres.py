@@ -0,0 +1,69 @@
+from .models import Genre, ContentGenre
+from .types import content_types
+from .search import normalize
+
+
+def split_genres(genres_list):
+    names = {}
+    for name in (genres_list or '').split(','):
+        name = name.strip()
+        if name:
+            names.setdefault(genre_slug(name), name[:100])
+    return names
+
+
+def genre_slug(name):
+    return ' '.join(normalize(name).split())[:100]
+
+
+def resolve_genres(names_by_slug):
+    if not names_by_slug:
+        return {}
+
+    existing = dict(Genre.objects.filter(slug__in=names_by_slug).values_list('slug', 'id'))
+    missing = [Genre(slug=slug, name=name) for slug, name in names_by_slug.items() if slug not in existing]
+    if missing:
+        Genre.objects.bulk_create(missing, ignore_conflicts=True)
+        existing = dict(Genre.objects.filter(slug__in=names_by_slug).values_list('slug', 'id'))
+    return existing
+
+
+def sync_genres(instance):
+    content_type = content_types.for_model(instance.__class__)
+    genre_ids = set(resolve_genres(split_genres(instance.genres_list)).values())
+
+    links = ContentGenre.objects.filter(content_type=content_type, object_id=instance.pk)
+    current_ids = set(links.values_list('genre_id', flat=True))
+
+    if current_ids - genre_ids:
+        links.filter(genre_id__in=current_ids - genre_ids).delete()
+    ContentGenre.objects.bulk_create(
+        [
+            ContentGenre(genre_id=genre_id, content_type=content_type, object_id=instance.pk)
+            for genre_id in genre_ids - current_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def link_new_content(instances, batch_size=1000):
+    names_by_instance = [(instance, split_genres(instance.genres_list)) for instance in instances]
+
+    all_names = {}
+    for _, names in names_by_instance:
+        all_names.update(names)
+    genre_ids = resolve_genres(all_names)
+
+    ContentGenre.objects.bulk_create(
+        [
+            ContentGenre(
+                genre_id=genre_ids[slug],
+                content_type=content_types.for_model(instance.__class__),
+                object_id=instance.pk,
+            )
+            for instance, names in names_by_instance
+            for slug in names
+        ],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
@@ -0,0 +1,97 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+
+IGNORED_PARAMS = ('api_key',)
+
+
+def cache_key(url, params=None):
+    # Parametre sırası ve API anahtarı anahtarı değiştirmez.
+    normalized = sorted(
+        (str(key), str(value)) for key, value in (params or {}).items() if key not in IGNORED_PARAMS
+    )
+    return hashlib.sha256(f"{url}?{urlencode(normalized)}".encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    # Harici API yanıtları için disk üzerinde (sqlite) LRU önbellek; iş parçacıkları arasında paylaşılır.
+
+    def __init__(self, path, ttl, max_bytes):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = Counter()
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, body TEXT, etag TEXT, last_modified TEXT, "
+            "stored_at REAL, used_at REAL, size INTEGER)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)")
+        self.total_bytes = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def record(self, name):
+        with self.lock:
+            self.stats[name] += 1
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute("UPDATE responses SET used_at = ? WHERE key = ?", (time.time(), key))
+
+        body, etag, last_modified, stored_at = row
+        return {
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fresh': time.time() - stored_at < self.ttl,
+        }
+
+    def set(self, key, url, body, etag=None, last_modified=None):
+        now = time.time()
+        with self.lock:
+            previous = self.connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.total_bytes += len(body) - (previous[0] if previous else 0)
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses (key, url, body, etag, last_modified, stored_at, used_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body, etag, last_modified, now, now, len(body)),
+            )
+            self._evict()
+
+    def touch(self, key):
+        now = time.time()
+        with self.lock:
+            self.connection.execute("UPDATE responses SET stored_at = ?, used_at = ? WHERE key = ?", (now, now, key))
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes:
+            rows = self.connection.execute(
+                "SELECT key, size FROM responses ORDER BY used_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            for key, size in rows:
+                self.connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.stats['evicted'] += 1
+                self.total_bytes -= size
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self):
+        with self.lock:
+            self.connection.execute("DELETE FROM responses")
+            self.total_bytes = 0
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,249 @@
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from django.conf import settings
+from django.db import transaction
+from .models import Book, Movie
+from .search import index_new_content
+from .genres import link_new_content
+from .http_cache import ResponseCache, cache_key
+
+
+logger = logging.getLogger(__name__)
+
+TMDB_IMAGE_URL = "https://image.tmdb.org/t/p/w500"
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1, rate))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def build_session(pool_size, retries):
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET',),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def build_response_cache():
+    if not settings.CATALOG_CACHE_PATH:
+        return None
+    return ResponseCache(settings.CATALOG_CACHE_PATH, settings.CATALOG_CACHE_TTL, settings.CATALOG_CACHE_MAX_BYTES)
+
+
+class CatalogClient:
+    def __init__(self, rate=None, workers=None, retries=3, timeout=10, cache=None, use_cache=True):
+        self.workers = workers or settings.CATALOG_IMPORT_WORKERS
+        self.bucket = TokenBucket(rate or settings.CATALOG_IMPORT_RATE)
+        self.session = build_session(self.workers, retries)
+        self.timeout = timeout
+        self.cache = cache or (build_response_cache() if use_cache else None)
+
+    def get_json(self, url, params=None):
+        if self.cache is None:
+            return self._fetch(url, params).json()
+
+        key = cache_key(url, params)
+        entry = self.cache.get(key)
+        if entry and entry['fresh']:
+            self.cache.record('hits')
+            return json.loads(entry['body'])
+
+        headers = {}
+        if entry and entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry and entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self._fetch(url, params, headers)
+        if response.status_code == 304 and entry:
+            self.cache.record('revalidated')
+            self.cache.touch(key)
+            return json.loads(entry['body'])
+
+        self.cache.record('misses')
+        self.cache.set(
+            key, url, response.text,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+        return response.json()
+
+    def _fetch(self, url, params=None, headers=None):
+        self.bucket.acquire()
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    def map(self, func, items):
+        # HTTP istekleri iş parçacıklarında yapılır; veritabanı yazımları çağıran iş parçacığında kalır.
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(func, items))
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+def _safe(func):
+    def wrapper(*args):
+        try:
+            return func(*args)
+        except (requests.RequestException, ValueError) as exc:
+            logger.warning("Katalog isteği başarısız oldu: %s", exc)
+            return None
+    return wrapper
+
+
+def parse_google_book(item):
+    volume_info = item.get("volumeInfo", {})
+
+    published_date = volume_info.get("publishedDate", "")
+    publication_year = None
+    if published_date and len(published_date) >= 4:
+        try:
+            publication_year = int(published_date[:4])
+        except ValueError:
+            pass
+
+    return {
+        "google_books_id": item.get("id"),
+        "title": (volume_info.get("title") or "Başlık Yok")[:255],
+        "authors": ", ".join(volume_info.get("authors", [])),
+        "description": volume_info.get("description", ""),
+        "page_count": volume_info.get("pageCount"),
+        "cover_url": volume_info.get("imageLinks", {}).get("thumbnail", ""),
+        "publication_year": publication_year,
+        "genres_list": ", ".join(volume_info.get("categories", [])),
+    }
+
+
+def parse_tmdb_movie(movie, detail_data):
+    credits = detail_data.get("credits", {})
+
+    director_name = None
+    for crew_member in credits.get("crew", []):
+        if crew_member.get("job") == "Director":
+            director_name = crew_member.get("name")
+            break
+
+    return {
+        "tmdb_id": movie["id"],
+        "title": (movie.get("title") or "")[:255],
+        "overview": movie.get("overview"),
+        "release_date": movie.get("release_date") or None,
+        "poster_path": f"{TMDB_IMAGE_URL}{movie['poster_path']}" if movie.get("poster_path") else None,
+        "director_name": director_name,
+        "actors_list": ", ".join(actor.get("name") for actor in credits.get("cast", [])[:5]),
+        "genres_list": ", ".join(genre.get("name") for genre in detail_data.get("genres", [])),
+    }
+
+
+def save_records(model, key_field, records, batch_size=500):
+    records = list({record[key_field]: record for record in records if record.get(key_field)}.values())
+    created = 0
+
+    for start in range(0, len(records), batch_size):
+        batch = records[start:start + batch_size]
+        keys = [record[key_field] for record in batch]
+
+        with transaction.atomic():
+            existing = set(model.objects.filter(**{f"{key_field}__in": keys}).values_list(key_field, flat=True))
+            model.objects.bulk_create(
+                [model(**record) for record in batch if record[key_field] not in existing],
+                ignore_conflicts=True,
+            )
+
+            # bulk_create sinyal göndermez; yeni kayıtların arama indeksi ve türleri burada toplu yazılır.
+            new_instances = list(model.objects.filter(**{f"{key_field}__in": [key for key in keys if key not in existing]}))
+            index_new_content(new_instances)
+            link_new_content(new_instances)
+        created += len(new_instances)
+
+    return created
+
+
+def import_google_books(queries, pages=1, start_page=1, page_size=40, client=None):
+    client = client or CatalogClient()
+    url = settings.GOOGLE_BOOKS_API_URL
+
+    @_safe
+    def fetch_page(job):
+        query, page = job
+        params = {"q": query, "maxResults": page_size, "startIndex": (page - 1) * page_size}
+        return client.get_json(url, params=params).get("items", [])
+
+    jobs = [(query, page) for query in queries for page in range(start_page, start_page + pages)]
+    records = [parse_google_book(item) for items in client.map(fetch_page, jobs) if items for item in items]
+
+    return {"fetched": len(records), "created": save_records(Book, "google_books_id", records)}
+
+
+def import_tmdb_movies(queries, pages=1, start_page=1, client=None):
+    client = client or CatalogClient()
+    base_url = settings.TMDB_API_URL
+
+    @_safe
+    def fetch_page(job):
+        query, page = job
+        params = {
+            "api_key": settings.TMDB_API_KEY,
+            "query": query,
+            "page": page,
+            "include_adult": False,
+            "language": "tr-TR",
+        }
+        return client.get_json(f"{base_url}/search/movie", params=params).get("results", [])
+
+    @_safe
+    def fetch_detail(movie):
+        params = {"api_key": settings.TMDB_API_KEY, "append_to_response": "credits", "language": "tr-TR"}
+        return parse_tmdb_movie(movie, client.get_json(f"{base_url}/movie/{movie['id']}", params=params))
+
+    jobs = [(query, page) for query in queries for page in range(start_page, start_page + pages)]
+    movies = {movie["id"]: movie for results in client.map(fetch_page, jobs) if results for movie in results}
+
+    # Zaten kayıtlı filmlerin detayları ağa hiç gidilmeden atlanır.
+    known_ids = set(Movie.objects.filter(tmdb_id__in=list(movies)).values_list('tmdb_id', flat=True))
+    new_movies = [movie for tmdb_id, movie in movies.items() if tmdb_id not in known_ids]
+    records = [record for record in client.map(fetch_detail, new_movies) if record]
+
+    return {
+        "fetched": len(movies),
+        "skipped": len(known_ids),
+        "created": save_records(Movie, "tmdb_id", records),
+    }
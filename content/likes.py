@@ -0,0 +1,54 @@
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value, IntegerField
+from django.db.models.functions import Coalesce
+from caching.tiered import bump_generation
+from .models import Rating, Review
+
+
+LIKEABLE_MODELS = {
+    'rating': Rating,
+    'review': Review,
+}
+
+
+def _through_fields(model):
+    field = model._meta.get_field('likes')
+    return field.remote_field.through, field.m2m_column_name(), field.m2m_reverse_name()
+
+
+def adjust_likes_count(model, object_ids, delta):
+    if object_ids and delta:
+        model.objects.filter(pk__in=object_ids).update(likes_count=F('likes_count') + delta)
+
+
+def toggle_like(model, object_id, user):
+    # Önce silmeyi dener; silinecek satır yoksa ekler. Sayaç aynı işlem içinde güncellenir.
+    through, source_column, target_column = _through_fields(model)
+    lookup = {source_column: object_id, target_column: user.pk}
+
+    with transaction.atomic():
+        deleted, _ = through.objects.filter(**lookup).delete()
+        if deleted:
+            adjust_likes_count(model, [object_id], -deleted)
+            liked = False
+        else:
+            try:
+                with transaction.atomic():
+                    through.objects.create(**lookup)
+                adjust_likes_count(model, [object_id], 1)
+            except IntegrityError:
+                pass
+            liked = True
+
+        likes_count = model.objects.filter(pk=object_id).values_list('likes_count', flat=True).first()
+        transaction.on_commit(lambda: bump_generation('interactions', user.pk))
+
+    return liked, likes_count
+
+
+def rebuild_likes_counts(model):
+    through, source_column, _ = _through_fields(model)
+    counts = through.objects.filter(**{source_column: OuterRef('pk')}).order_by().values(source_column).annotate(
+        total=Count('pk')
+    ).values('total')
+    return model.objects.update(likes_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0)))
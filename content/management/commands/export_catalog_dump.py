@@ -0,0 +1,34 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from content.dumps import DUMP_FORMATS, dump_format, export_catalog, open_dump, write_dump
+from content.models import Book, Movie
+
+
+MODELS = {'book': Book, 'movie': Movie}
+
+
+class Command(BaseCommand):
+    help = "Book/Movie kataloğunu sabit bellekle JSONL/CSV dökümüne (.gz ile sıkıştırılmış olabilir) yazar."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="Yazılacak döküm dosyası.")
+        parser.add_argument('--model', choices=list(MODELS), required=True)
+        parser.add_argument('--format', choices=DUMP_FORMATS, help="Verilmezse dosya uzantısından anlaşılır.")
+        parser.add_argument('--chunk-size', type=int, default=5000, help="Tek sorguda okunan kayıt sayısı.")
+
+    def handle(self, *args, **options):
+        model = MODELS[options['model']]
+        started_at = time.monotonic()
+
+        try:
+            fmt = dump_format(options['path'], options['format'])
+            with open_dump(options['path'], 'w') as stream:
+                written = write_dump(stream, fmt, model, export_catalog(model, chunk_size=options['chunk_size']))
+        except (OSError, ValueError) as exc:
+            raise CommandError(f"{options['path']} yazılamadı: {exc}")
+
+        elapsed = time.monotonic() - started_at
+        self.stdout.write(self.style.SUCCESS(
+            f"{written} kayıt {options['path']} dosyasına yazıldı; {elapsed:.2f} sn "
+            f"({written / elapsed if elapsed else 0:.0f} kayıt/sn)."
+        ))
@@ -0,0 +1,46 @@
+import time
+from django.core.management.base import BaseCommand
+from content.ingest import CatalogClient, import_google_books, import_tmdb_movies
+
+
+class Command(BaseCommand):
+    help = "TMDB ve Google Books'tan birden fazla sorgu ve sayfa için toplu içerik aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('queries', nargs='+', help="Aranacak sorgular.")
+        parser.add_argument('--source', choices=['tmdb', 'books', 'all'], default='all')
+        parser.add_argument('--pages', type=int, default=1, help="Her sorgu için çekilecek sayfa sayısı.")
+        parser.add_argument('--start-page', type=int, default=1)
+        parser.add_argument('--workers', type=int, default=None, help="Eşzamanlı HTTP isteği sayısı.")
+        parser.add_argument('--rate', type=float, default=None, help="Saniye başına en fazla istek.")
+        parser.add_argument('--no-cache', action='store_true', help="Yerel yanıt önbelleğini kullanma.")
+
+    def handle(self, *args, **options):
+        client = CatalogClient(rate=options['rate'], workers=options['workers'], use_cache=not options['no_cache'])
+        started_at = time.monotonic()
+
+        try:
+            if options['source'] in ('books', 'all'):
+                stats = import_google_books(
+                    options['queries'], pages=options['pages'], start_page=options['start_page'], client=client
+                )
+                self.stdout.write(f"Kitaplar: {stats['fetched']} çekildi, {stats['created']} yeni kayıt.")
+
+            if options['source'] in ('tmdb', 'all'):
+                stats = import_tmdb_movies(
+                    options['queries'], pages=options['pages'], start_page=options['start_page'], client=client
+                )
+                self.stdout.write(
+                    f"Filmler: {stats['fetched']} bulundu, {stats['skipped']} zaten kayıtlı, {stats['created']} yeni kayıt."
+                )
+
+            if client.cache is not None:
+                cache_stats = client.cache.stats
+                self.stdout.write(
+                    f"Önbellek: {cache_stats['hits']} isabet, {cache_stats['revalidated']} yeniden doğrulama, "
+                    f"{cache_stats['misses']} ıska, {cache_stats['evicted']} çıkarma."
+                )
+        finally:
+            client.close()
+
+        self.stdout.write(self.style.SUCCESS(f"Aktarım {time.monotonic() - started_at:.1f} sn'de tamamlandı."))
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+from content.dumps import DUMP_FORMATS, dump_format, import_catalog, open_dump, read_dump
+from content.models import Book, Movie
+
+
+MODELS = {'book': Book, 'movie': Movie}
+
+
+class Command(BaseCommand):
+    help = "Yerel Book/Movie dökümlerini (JSONL/CSV, .gz olabilir) akış halinde okuyup büyük partilerle upsert eder."
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+', help="Döküm dosyaları.")
+        parser.add_argument('--model', choices=list(MODELS), required=True)
+        parser.add_argument('--format', choices=DUMP_FORMATS, help="Verilmezse dosya uzantısından anlaşılır.")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Tek işlemde yazılan kayıt sayısı.")
+        parser.add_argument('--skip-existing', action='store_true', help="Kayıtlı içerikleri güncelleme, yalnızca yenileri ekle.")
+
+    def handle(self, *args, **options):
+        model = MODELS[options['model']]
+
+        def progress(stats, elapsed):
+            self.stdout.write(
+                f"  {stats['read']} kayıt okundu, {stats['created']} yeni, {stats['updated']} güncellendi "
+                f"({stats['read'] / elapsed if elapsed else 0:.0f} kayıt/sn)"
+            )
+
+        for path in options['paths']:
+            try:
+                fmt = dump_format(path, options['format'])
+                with open_dump(path) as stream:
+                    self.stdout.write(f"{path}:")
+                    stats = import_catalog(
+                        model,
+                        read_dump(stream, fmt),
+                        batch_size=options['batch_size'],
+                        update_existing=not options['skip_existing'],
+                        progress=progress,
+                    )
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"{path} okunamadı: {exc}")
+
+            for error in stats['errors']:
+                self.stderr.write(f"  Satır {error['position']}: {' '.join(error['errors'])}")
+            self.stdout.write(self.style.SUCCESS(
+                f"{path}: {stats['read']} kayıt, {stats['created']} yeni, {stats['updated']} güncellendi, "
+                f"{stats['unchanged']} değişmeden atlandı, {stats['duplicates']} tekrar, {stats['invalid']} geçersiz; "
+                f"{stats['seconds']} sn ({stats['records_per_second']} kayıt/sn)."
+            ))
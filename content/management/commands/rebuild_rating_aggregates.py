@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+from content.aggregates import RATED_MODELS, rebuild_aggregates
+
+
+class Command(BaseCommand):
+    help = "Kitap ve filmlerin puan özetlerini (rating_count, rating_sum, avg_score) Rating tablosundan yeniden hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help="Hiçbir şey yazmadan yalnızca tutarsızlıkları raporla.")
+
+    def handle(self, *args, **options):
+        verify_only = options['verify']
+        total_mismatched = 0
+
+        for model in RATED_MODELS:
+            mismatched = rebuild_aggregates(model, verify_only=verify_only)
+            total_mismatched += len(mismatched)
+            self.stdout.write(f"{model.__name__}: {len(mismatched)} tutarsız kayıt.")
+
+        if verify_only and total_mismatched:
+            raise CommandError(f"{total_mismatched} kayıtta puan özeti tutarsız.")
+
+        self.stdout.write(self.style.SUCCESS("Puan özetleri güncel."))
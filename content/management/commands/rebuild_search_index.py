@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from content.models import Book, Movie
+from content.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Kitap ve film arama indeksini (SearchTerm) baştan oluşturur."
+
+    def handle(self, *args, **options):
+        for model in (Book, Movie):
+            total = rebuild_index(model)
+            self.stdout.write(f"{model.__name__}: {total} kayıt indekslendi.")
+
+        self.stdout.write(self.style.SUCCESS("Arama indeksi yeniden oluşturuldu."))
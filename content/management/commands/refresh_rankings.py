@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from content.rankings import RANKING_TYPES, refresh_ranking
+
+
+class Command(BaseCommand):
+    help = "Keşfet sayfası sıralamalarını (popular, top_rated, trending) hesaplayıp önbelleğe yazar. Zamanlanmış görev olarak çalıştırılabilir."
+
+    def handle(self, *args, **options):
+        for list_type in RANKING_TYPES:
+            ranking = refresh_ranking(list_type)
+            summary = ", ".join(f"{name}: {len(ids)}" for name, ids in ranking.items())
+            self.stdout.write(f"{list_type} -> {summary}")
+
+        self.stdout.write(self.style.SUCCESS("Sıralamalar güncellendi."))
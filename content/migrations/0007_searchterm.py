@@ -0,0 +1,54 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_search_index(apps, schema_editor):
+    from content.search import build_terms
+
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    SearchTerm = apps.get_model('content', 'SearchTerm')
+
+    for model_name in ('book', 'movie'):
+        model = apps.get_model('content', model_name)
+        if not model.objects.exists():
+            continue
+
+        content_type, _ = ContentType.objects.get_or_create(app_label='content', model=model_name)
+        terms = []
+        for instance in model.objects.iterator(chunk_size=1000):
+            terms.extend(
+                SearchTerm(term=term, weight=weight, content_type_id=content_type.pk, object_id=instance.pk)
+                for term, weight in build_terms(instance).items()
+            )
+            if len(terms) >= 1000:
+                SearchTerm.objects.bulk_create(terms, ignore_conflicts=True)
+                terms = []
+        SearchTerm.objects.bulk_create(terms, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0006_book_genres_list_book_publication_year'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveSmallIntegerField(default=1)),
+                ('object_id', models.PositiveIntegerField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['content_type', 'object_id'], name='content_searchterm_target')],
+                'unique_together': {('term', 'content_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
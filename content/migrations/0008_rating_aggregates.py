@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:07
+
+from django.db import migrations, models
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Rating = apps.get_model('content', 'Rating')
+
+    for model_name in ('book', 'movie'):
+        model = apps.get_model('content', model_name)
+        content_type = ContentType.objects.filter(app_label='content', model=model_name).first()
+        if content_type is None:
+            continue
+
+        rows = Rating.objects.filter(content_type=content_type).order_by().values('object_id').annotate(
+            total_count=models.Count('id'),
+            total_sum=models.Sum('score'),
+        )
+        for row in rows.iterator():
+            model.objects.filter(pk=row['object_id']).update(
+                rating_count=row['total_count'],
+                rating_sum=row['total_sum'],
+                avg_score=row['total_sum'] / row['total_count'],
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0007_searchterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='avg_score',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='avg_score',
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
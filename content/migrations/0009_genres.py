@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:09
+
+import unicodedata
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+# content.genres.split_genres'in bu migration yazıldığı andaki kopyası; uygulama kodu sonradan değişse de
+# backfill aynı slug'ları üretir.
+def split_genres(genres_list):
+    names = {}
+    for name in (genres_list or '').split(','):
+        name = name.strip()
+        if name:
+            text = unicodedata.normalize('NFKD', name.casefold().replace('ı', 'i'))
+            slug = ' '.join(''.join(char for char in text if not unicodedata.combining(char)).split())[:100]
+            names.setdefault(slug, name[:100])
+    return names
+
+
+def backfill_genres(apps, schema_editor):
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    Genre = apps.get_model('content', 'Genre')
+    ContentGenre = apps.get_model('content', 'ContentGenre')
+
+    genre_ids = {}
+    for model_name in ('book', 'movie'):
+        model = apps.get_model('content', model_name)
+        if not model.objects.exists():
+            continue
+
+        content_type, _ = ContentType.objects.get_or_create(app_label='content', model=model_name)
+        links = []
+        for object_id, genres_list in model.objects.values_list('id', 'genres_list').iterator():
+            for slug, name in split_genres(genres_list).items():
+                if slug not in genre_ids:
+                    genre_ids[slug] = Genre.objects.get_or_create(slug=slug, defaults={'name': name})[0].pk
+                links.append(ContentGenre(genre_id=genre_ids[slug], content_type_id=content_type.pk, object_id=object_id))
+            if len(links) >= 1000:
+                ContentGenre.objects.bulk_create(links, ignore_conflicts=True)
+                links = []
+        ContentGenre.objects.bulk_create(links, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0008_rating_aggregates'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Genre',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('slug', models.CharField(max_length=100, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='publication_year',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='movie',
+            name='release_date',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='ContentGenre',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.PositiveIntegerField()),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+                ('genre', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='content_links', to='content.genre')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['content_type', 'object_id'], name='content_contentgenre_target')],
+                'unique_together': {('genre', 'content_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(backfill_genres, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:13
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_likes_count(apps, schema_editor):
+    for model_name in ('rating', 'review'):
+        model = apps.get_model('content', model_name)
+        field = model._meta.get_field('likes')
+        counts = field.remote_field.through.objects.filter(
+            **{field.m2m_column_name(): models.OuterRef('pk')}
+        ).order_by().values(field.m2m_column_name()).annotate(total=models.Count('pk')).values('total')
+
+        model.objects.update(likes_count=Coalesce(
+            models.Subquery(counts, output_field=models.IntegerField()), models.Value(0)
+        ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0009_genres'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rating',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='likes_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_likes_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_likes_count'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='listitem',
+            index=models.Index(fields=['content_type', 'object_id'], name='content_listitem_target'),
+        ),
+        migrations.AddIndex(
+            model_name='listitem',
+            index=models.Index(fields=['added_at'], name='content_listitem_added'),
+        ),
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['content_type', 'object_id', 'score'], name='content_rating_target_score'),
+        ),
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['user', '-created_at'], name='content_rating_user_created'),
+        ),
+        migrations.AddIndex(
+            model_name='rating',
+            index=models.Index(fields=['created_at'], name='content_rating_created'),
+        ),
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['content_type', 'object_id', 'created_at'], name='content_reply_target_created'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['content_type', 'object_id', '-created_at'], name='content_review_target_created'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['user', '-created_at'], name='content_review_user_created'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['created_at'], name='content_review_created'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0011_hot_path_indexes'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='listitem',
+            index=models.Index(fields=['list', '-added_at'], name='content_listitem_list_added'),
+        ),
+    ]
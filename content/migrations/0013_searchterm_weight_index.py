@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0012_listitem_list_added_index'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='searchterm',
+            index=models.Index(fields=['term', '-weight', 'content_type', 'object_id'], name='content_searchterm_weight'),
+        ),
+    ]
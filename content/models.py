@@ -12,12 +12,17 @@ class Book(models.Model):
     page_count = models.IntegerField(null=True, blank=True)
     cover_url = models.URLField(blank=True)
 
-    publication_year = models.IntegerField(null=True, blank=True) 
+    publication_year = models.IntegerField(null=True, blank=True, db_index=True) 
     genres_list = models.TextField(blank=True, help_text="Virgülle ayrılmış tür listesi") 
+
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    avg_score = models.FloatField(null=True, blank=True, db_index=True)
     
     ratings = GenericRelation('Rating')
     reviews = GenericRelation('Review')
     list_items = GenericRelation('ListItem')
+    genre_links = GenericRelation('ContentGenre')
 
     def __str__(self):
         return self.title
@@ -27,23 +32,58 @@ class Movie(models.Model):
     tmdb_id = models.IntegerField(unique=True)
     title = models.CharField(max_length=255)
     overview = models.TextField(blank=True, null=True) 
-    release_date = models.DateField(blank=True, null=True)
+    release_date = models.DateField(blank=True, null=True, db_index=True)
     poster_path = models.URLField(blank=True, null=True)
     director_name = models.CharField(max_length=255, blank=True, null=True)
     actors_list = models.TextField(blank=True,)
     genres_list = models.TextField(blank=True, help_text="Virgülle ayrılmış tür listesi")
+
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+    avg_score = models.FloatField(null=True, blank=True, db_index=True)
+
     ratings = GenericRelation('Rating')
     reviews = GenericRelation('Review')
     list_items = GenericRelation('ListItem')
+    genre_links = GenericRelation('ContentGenre')
 
     def __str__(self):
         return self.title
     
 
+class Genre(models.Model):
+    name = models.CharField(max_length=100)
+    slug = models.CharField(max_length=100, unique=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+
+class ContentGenre(models.Model):
+    genre = models.ForeignKey(Genre, on_delete=models.CASCADE, related_name='content_links')
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey('content_type', 'object_id')
+
+    class Meta:
+        unique_together = ('genre', 'content_type', 'object_id')
+        indexes = [
+            models.Index(fields=['content_type', 'object_id'], name='content_contentgenre_target'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_object} - {self.genre.name}"
+
+
 class Rating(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='ratings')
     
     likes = models.ManyToManyField(CustomUser, related_name='liked_ratings', blank=True)
+    likes_count = models.PositiveIntegerField(default=0)
     
     replies = GenericRelation('Reply')
     
@@ -57,6 +97,19 @@ class Rating(models.Model):
     class Meta:
         unique_together = ('user', 'content_type', 'object_id') 
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', 'score'], name='content_rating_target_score'),
+            models.Index(fields=['user', '-created_at'], name='content_rating_user_created'),
+            models.Index(fields=['created_at'], name='content_rating_created'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        # Puan güncellenince özetlere yalnızca fark uygulanabilsin diye yüklenen puan saklanır.
+        instance = super().from_db(db, field_names, values)
+        if 'score' in field_names:
+            instance._loaded_score = instance.score
+        return instance
 
     def __str__(self):
         return f"{self.user.username} rated {self.content_object} with {self.score}/10"
@@ -69,6 +122,7 @@ class Review(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     likes = models.ManyToManyField(CustomUser, related_name='liked_reviews', blank=True)
+    likes_count = models.PositiveIntegerField(default=0)
     
     replies = GenericRelation('Reply')
 
@@ -78,6 +132,11 @@ class Review(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', '-created_at'], name='content_review_target_created'),
+            models.Index(fields=['user', '-created_at'], name='content_review_user_created'),
+            models.Index(fields=['created_at'], name='content_review_created'),
+        ]
 
     def __str__(self):
         return f"Review by {self.user.username} on {self.content_object}"
@@ -107,6 +166,11 @@ class ListItem(models.Model):
     class Meta:
         unique_together = ('list', 'content_type', 'object_id') 
         ordering = ['-added_at']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id'], name='content_listitem_target'),
+            models.Index(fields=['added_at'], name='content_listitem_added'),
+            models.Index(fields=['list', '-added_at'], name='content_listitem_list_added'),
+        ]
 
     def __str__(self):
         return f"{self.content_object} in {self.list.name}"
@@ -124,6 +188,28 @@ class Reply(models.Model):
     class Meta:
         ordering = ['created_at']
         verbose_name_plural = "Replies"
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', 'created_at'], name='content_reply_target_created'),
+        ]
         
     def __str__(self):
-        return f"Reply by {self.user.username} on {self.content_object}"
\ No newline at end of file
+        return f"Reply by {self.user.username} on {self.content_object}"
+
+class SearchTerm(models.Model):
+    term = models.CharField(max_length=64)
+    weight = models.PositiveSmallIntegerField(default=1)
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    content_object = GenericForeignKey('content_type', 'object_id')
+
+    class Meta:
+        unique_together = ('term', 'content_type', 'object_id')
+        indexes = [
+            models.Index(fields=['content_type', 'object_id'], name='content_searchterm_target'),
+            # ranked_matches her kelimenin en yüksek ağırlıklı eşleşmelerini sıralama yapmadan okur.
+            models.Index(fields=['term', '-weight', 'content_type', 'object_id'], name='content_searchterm_weight'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} -> {self.content_type.model}:{self.object_id}"
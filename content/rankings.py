@@ -0,0 +1,107 @@
+from datetime import timedelta
+from collections import defaultdict
+from django.conf import settings
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from caching.tiered import bump_generation, tiered_cache
+from .models import Book, Movie, Rating, Review, ListItem
+from .types import content_types
+
+
+RANKED_MODELS = (Book, Movie)
+RANKING_TYPES = ('popular', 'top_rated', 'trending')
+RANKING_SIZE = 10
+
+
+def _related_count(model, content_type):
+    # Her ilişki ayrı alt sorguyla sayılır; JOIN'li Count'ların birbirini çoğaltması önlenir.
+    counts = model.objects.filter(
+        content_type=content_type, object_id=OuterRef('pk')
+    ).order_by().values('object_id').annotate(total=Count('id')).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def _popular_ids(model):
+    content_type = content_types.for_model(model)
+    queryset = model.objects.annotate(
+        review_count=_related_count(Review, content_type),
+        list_item_count=_related_count(ListItem, content_type),
+    ).order_by((F('review_count') + F('list_item_count')).desc(), '-avg_score', 'pk')
+    return list(queryset.values_list('pk', flat=True)[:RANKING_SIZE])
+
+
+def _top_rated_ids(model):
+    # Eşit ortalamada yorum sayısı öne geçer.
+    content_type = content_types.for_model(model)
+    queryset = model.objects.filter(avg_score__isnull=False).annotate(
+        review_count=_related_count(Review, content_type),
+    ).order_by('-avg_score', '-review_count', 'pk')
+    return list(queryset.values_list('pk', flat=True)[:RANKING_SIZE])
+
+
+def _trending_scores():
+    now = timezone.now()
+    since = now - timedelta(days=settings.DISCOVERY_TRENDING_WINDOW_DAYS)
+    half_life = timedelta(hours=settings.DISCOVERY_TRENDING_HALF_LIFE_HOURS)
+
+    events = [
+        Rating.objects.filter(created_at__gte=since).values_list('content_type_id', 'object_id', 'created_at'),
+        Review.objects.filter(created_at__gte=since).values_list('content_type_id', 'object_id', 'created_at'),
+        ListItem.objects.filter(added_at__gte=since).values_list('content_type_id', 'object_id', 'added_at'),
+    ]
+
+    scores = defaultdict(float)
+    for queryset in events:
+        for content_type_id, object_id, happened_at in queryset.order_by().iterator():
+            scores[(content_type_id, object_id)] += 0.5 ** ((now - happened_at) / half_life)
+    return scores
+
+
+def _trending_ids(model, scores):
+    content_type_id = content_types.id_for(model)
+    ranked = sorted(
+        ((score, object_id) for (type_id, object_id), score in scores.items() if type_id == content_type_id),
+        key=lambda pair: (-pair[0], pair[1]),
+    )
+    candidate_ids = [object_id for _, object_id in ranked[:RANKING_SIZE * 2]]
+    existing_ids = set(model.objects.filter(pk__in=candidate_ids).values_list('pk', flat=True))
+    return [object_id for object_id in candidate_ids if object_id in existing_ids][:RANKING_SIZE]
+
+
+def compute_ranking(list_type):
+    if list_type == 'top_rated':
+        return {model._meta.model_name: _top_rated_ids(model) for model in RANKED_MODELS}
+    if list_type == 'trending':
+        scores = _trending_scores()
+        return {model._meta.model_name: _trending_ids(model, scores) for model in RANKED_MODELS}
+    return {model._meta.model_name: _popular_ids(model) for model in RANKED_MODELS}
+
+
+def ranking_entities(list_type):
+    if list_type not in RANKING_TYPES:
+        list_type = 'popular'
+    return [('rankings', list_type)]
+
+
+def refresh_ranking(list_type):
+    ranking = compute_ranking(list_type)
+    # Yeni nesil, bu sıralamaya dayanan önbellekteki keşif yanıtlarını da geçersiz kılar.
+    bump_generation('rankings', list_type)
+    tiered_cache.set('rankings', (list_type,), ranking, settings.DISCOVERY_CACHE_TTL, ranking_entities(list_type))
+    return ranking
+
+
+def get_ranking(list_type):
+    if list_type not in RANKING_TYPES:
+        list_type = 'popular'
+
+    return tiered_cache.fetch(
+        'rankings', (list_type,), lambda: compute_ranking(list_type),
+        settings.DISCOVERY_CACHE_TTL, ranking_entities(list_type),
+    )
+
+
+def invalidate_rankings():
+    for list_type in RANKING_TYPES:
+        bump_generation('rankings', list_type)
@@ -0,0 +1,173 @@
+import re
+import unicodedata
+from collections import Counter
+from functools import reduce
+from operator import or_
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from caching.tiered import bump_generation
+from .models import SearchTerm
+from .types import content_types
+
+
+SEARCH_FIELDS = {
+    'book': {'title': 5, 'authors': 3, 'genres_list': 2, 'description': 1},
+    'movie': {'title': 5, 'director_name': 3, 'actors_list': 3, 'genres_list': 2, 'overview': 1},
+}
+
+# Tek karakterli kelimeler ("Rocky 3", "Malcolm X") de indekslenir; yalnızca önek olarak aranmazlar.
+MIN_PREFIX_LENGTH = 2
+MAX_TERM_LENGTH = 64
+MAX_QUERY_TERMS = 8
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKD', text.casefold().replace('ı', 'i'))
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+def tokenize(text):
+    if not text:
+        return []
+    return [token[:MAX_TERM_LENGTH] for token in re.findall(r'\w+', normalize(text))]
+
+
+def build_terms(instance):
+    weights = Counter()
+    for field_name, weight in SEARCH_FIELDS[instance._meta.model_name].items():
+        for token in set(tokenize(getattr(instance, field_name))):
+            weights[token] += weight
+    return weights
+
+
+def _index_changed():
+    # İndeks değişince önbellekteki arama sonuçları yeni nesille geçersiz olur.
+    transaction.on_commit(lambda: bump_generation('catalog'))
+
+
+def index_content(instance):
+    content_type = content_types.for_model(instance.__class__)
+    with transaction.atomic():
+        SearchTerm.objects.filter(content_type=content_type, object_id=instance.pk).delete()
+        SearchTerm.objects.bulk_create([
+            SearchTerm(term=term, weight=weight, content_type=content_type, object_id=instance.pk)
+            for term, weight in build_terms(instance).items()
+        ])
+    _index_changed()
+
+
+def index_new_content(instances, batch_size=1000):
+    terms = []
+    for instance in instances:
+        content_type = content_types.for_model(instance.__class__)
+        terms.extend(
+            SearchTerm(term=term, weight=weight, content_type=content_type, object_id=instance.pk)
+            for term, weight in build_terms(instance).items()
+        )
+    SearchTerm.objects.bulk_create(terms, batch_size=batch_size, ignore_conflicts=True)
+    _index_changed()
+
+
+def unindex_content(instance):
+    content_type = content_types.for_model(instance.__class__)
+    SearchTerm.objects.filter(content_type=content_type, object_id=instance.pk).delete()
+    _index_changed()
+
+
+def rebuild_index(model, batch_size=1000):
+    content_type = content_types.for_model(model)
+    SearchTerm.objects.filter(content_type=content_type).delete()
+
+    total = 0
+    pending = []
+    for instance in model.objects.order_by('pk').iterator(chunk_size=batch_size):
+        pending.extend(
+            SearchTerm(term=term, weight=weight, content_type=content_type, object_id=instance.pk)
+            for term, weight in build_terms(instance).items()
+        )
+        total += 1
+        if len(pending) >= batch_size:
+            SearchTerm.objects.bulk_create(pending, batch_size=batch_size)
+            pending = []
+    SearchTerm.objects.bulk_create(pending, batch_size=batch_size)
+    _index_changed()
+    return total
+
+
+def ranked_matches(query, limit=None):
+    # Son kelime dışındaki sorgu kelimeleri indekste birebir, yazılmakta olan son kelime önek olarak aranır.
+    # Aday kümesi kelime başına sınırlıdır: her kelime için (term, -weight) indeksinden en yüksek ağırlıklı
+    # eşleşmeler okunur, böylece sık geçen bir kelime diğer kelimelerin payını tüketmez. Birden fazla kelime
+    # varsa adaylar ikinci bir sorguyla tüm kelimeler üzerinden puanlanır; sonuçlar match_key sırasıyla döner.
+    tokens = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not tokens:
+        return []
+
+    *exact, last = tokens
+    exact = set(exact)
+    prefix = last if len(last) >= MIN_PREFIX_LENGTH else None
+    filters = [Q(term=token) for token in exact]
+    filters.append(Q(term__startswith=prefix) if prefix else Q(term=last))
+    per_term = max(1, (limit or settings.SEARCH_MAX_CANDIDATES) // len(filters))
+
+    postings = []
+    for term_filter in filters:
+        postings.extend(
+            SearchTerm.objects.filter(term_filter)
+            .order_by('-weight', 'content_type_id', 'object_id')
+            .values_list('content_type_id', 'object_id', 'term', 'weight')[:per_term]
+        )
+
+    if len(filters) > 1 and postings:
+        object_ids = {}
+        for content_type_id, object_id, _, _ in postings:
+            object_ids.setdefault(content_type_id, set()).add(object_id)
+        candidates = Q()
+        for content_type_id, ids in object_ids.items():
+            candidates |= Q(content_type_id=content_type_id, object_id__in=ids)
+        postings = SearchTerm.objects.filter(reduce(or_, filters), candidates).values_list(
+            'content_type_id', 'object_id', 'term', 'weight',
+        )
+
+    # İçerik başına her sorgu kelimesinin en yüksek ağırlıklı eşleşmesi sayılır.
+    best = {}
+    for content_type_id, object_id, term, weight in postings:
+        token = term if term in exact or not prefix else last
+        weights = best.setdefault((content_type_id, object_id), {})
+        weights[token] = max(weights.get(token, 0), weight)
+
+    matches = [
+        {
+            'content_type_id': content_type_id,
+            'object_id': object_id,
+            'matched': len(weights),
+            'score': sum(weights.values()),
+        }
+        for (content_type_id, object_id), weights in best.items()
+    ]
+    matches.sort(key=match_key)
+    return matches
+
+
+def match_key(match):
+    # Önce eşleşen kelime sayısı, sonra ağırlık toplamı; eşitlikte içerik kimliği sırayı sabitler.
+    return (-match['matched'], -match['score'], match['content_type_id'], match['object_id'])
+
+
+def load_matches(matches):
+    ids_by_type = {}
+    for match in matches:
+        ids_by_type.setdefault(match['content_type_id'], []).append(match['object_id'])
+
+    objects = {}
+    for content_type_id, object_ids in ids_by_type.items():
+        model = content_types.model_for_id(content_type_id)
+        for instance in model.objects.filter(pk__in=object_ids):
+            objects[(content_type_id, instance.pk)] = instance
+
+    return [
+        objects[(match['content_type_id'], match['object_id'])]
+        for match in matches
+        if (match['content_type_id'], match['object_id']) in objects
+    ]
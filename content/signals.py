@@ -0,0 +1,141 @@
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from django.db import transaction
+from django.db.models import F
+from caching.tiered import bump_generation, bump_generations
+from users.models import CustomUser
+from .models import Book, Movie, Rating, Review, UserList, ListItem
+from .types import content_types
+from .search import index_content, unindex_content
+from .rankings import invalidate_rankings
+from .genres import sync_genres
+from .likes import adjust_likes_count
+from .aggregates import apply_rating_change, refresh_rating_aggregate
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=Movie)
+def update_search_index(sender, instance, **kwargs):
+    index_content(instance)
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=Movie)
+def update_genre_links(sender, instance, **kwargs):
+    sync_genres(instance)
+
+
+@receiver(post_delete, sender=Book)
+@receiver(post_delete, sender=Movie)
+def remove_from_search_index(sender, instance, **kwargs):
+    unindex_content(instance)
+    invalidate_rankings()
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Book)
+@receiver(post_delete, sender=Movie)
+def invalidate_content_detail(sender, instance, **kwargs):
+    content_type_id = content_types.id_for(sender)
+    transaction.on_commit(lambda: bump_generation('content', content_type_id, instance.pk))
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_reviewed_detail(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_generation('content', instance.content_type_id, instance.object_id))
+
+
+REVIEW_AUTHOR_FIELDS = {'username', 'avatar_url'}
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_authored_reviews(sender, instance, created, update_fields=None, **kwargs):
+    # Yorumlarda yazarın kullanıcı adı ve avatarı gösterilir; bunlar değişebilecekse yazarın yorum yaptığı
+    # içeriklerin nesli artar, önbellekteki detay yanıtı ve ETag birlikte eskir. Yalnızca last_login gibi
+    # alanları yazan kayıtlar (update_fields) atlanır.
+    if created or (update_fields is not None and not REVIEW_AUTHOR_FIELDS & set(update_fields)):
+        return
+    reviewed = Review.objects.filter(user=instance).order_by().values_list('content_type_id', 'object_id').distinct()
+    transaction.on_commit(lambda: bump_generations(('content',) + tuple(target) for target in reviewed))
+
+
+@receiver(post_save, sender=Rating)
+@receiver(post_delete, sender=Rating)
+def invalidate_viewer_interactions(sender, instance, **kwargs):
+    # İçerik detayındaki izleyiciye özel kısım (kendi puanı) bu nesille doğrulanır.
+    transaction.on_commit(lambda: bump_generation('interactions', instance.user_id))
+
+
+@receiver(post_save, sender=UserList)
+@receiver(post_delete, sender=UserList)
+def invalidate_user_lists(sender, instance, **kwargs):
+    def invalidate():
+        bump_generation('list', instance.pk)
+        bump_generation('lists', instance.user_id)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=ListItem)
+@receiver(post_delete, sender=ListItem)
+def invalidate_list_items(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_generation('list', instance.list_id))
+
+
+@receiver(post_save, sender=Rating)
+def update_rating_aggregates(sender, instance, created, **kwargs):
+    # Özet puan yazımıyla aynı transaction'da artımlı güncellenir; iş kuyruğundan geçmediği için tekrar uygulanmaz.
+    content_type_id, object_id = instance.content_type_id, instance.object_id
+    if created:
+        apply_rating_change(content_type_id, object_id, 1, instance.score)
+    elif hasattr(instance, '_loaded_score'):
+        apply_rating_change(content_type_id, object_id, 0, instance.score - instance._loaded_score)
+    else:
+        # Önceki puanı bilinmeyen örnek (veritabanından yüklenmemiş): özet satırlardan yeniden hesaplanır.
+        refresh_rating_aggregate(content_type_id, object_id)
+    instance._loaded_score = instance.score
+    transaction.on_commit(lambda: bump_generation('content', content_type_id, object_id))
+
+
+@receiver(post_delete, sender=Rating)
+def remove_rating_from_aggregates(sender, instance, **kwargs):
+    content_type_id, object_id = instance.content_type_id, instance.object_id
+    apply_rating_change(content_type_id, object_id, -1, -getattr(instance, '_loaded_score', instance.score))
+    transaction.on_commit(lambda: bump_generation('content', content_type_id, object_id))
+
+
+@receiver(m2m_changed, sender=Rating.likes.through)
+@receiver(m2m_changed, sender=Review.likes.through)
+def update_likes_count(sender, instance, action, reverse, model, pk_set, **kwargs):
+    # likes.add()/remove()/clear() ile yapılan değişiklikler de sayaçlara yansır.
+    if action == 'pre_clear' and reverse:
+        model.objects.filter(likes=instance).update(likes_count=F('likes_count') - 1)
+        return
+    if action == 'post_clear' and not reverse:
+        instance.__class__.objects.filter(pk=instance.pk).update(likes_count=0)
+        return
+    if action not in ('post_add', 'post_remove') or not pk_set:
+        return
+
+    user_ids = [instance.pk] if reverse else list(pk_set)
+
+    def invalidate():
+        for user_id in user_ids:
+            bump_generation('interactions', user_id)
+
+    transaction.on_commit(invalidate)
+
+    delta = 1 if action == 'post_add' else -1
+    if reverse:
+        adjust_likes_count(model, pk_set, delta)
+    else:
+        adjust_likes_count(instance.__class__, [instance.pk], delta * len(pk_set))
+
+
+@receiver(pre_delete, sender=CustomUser)
+def release_user_likes(sender, instance, **kwargs):
+    # Kullanıcı silinirken beğeni satırları cascade ile sinyalsiz silinir; sayaçlar önceden düşülür.
+    for model in (Rating, Review):
+        model.objects.filter(likes=instance).update(likes_count=F('likes_count') - 1)
@@ -0,0 +1,17 @@
+from jobs.dispatch import handler
+from caching.tiered import bump_generation, bump_generations
+from .aggregates import refresh_rating_aggregate, refresh_rating_aggregates
+
+
+# Tekil ve toplu puanlamalar özetleri artık yazım anındaki transaction içinde günceller;
+# bu işler yalnızca kuyrukta kalmış eski kayıtlar için tutulur.
+@handler('content.refresh_rating_aggregate')
+def refresh_rating_aggregate_job(content_type_id, object_id):
+    refresh_rating_aggregate(content_type_id, object_id)
+    bump_generation('content', content_type_id, object_id)
+
+
+@handler('content.refresh_rating_aggregates')
+def refresh_rating_aggregates_job(content_type_id, object_ids):
+    refresh_rating_aggregates(content_type_id, object_ids)
+    bump_generations(('content', content_type_id, object_id) for object_id in object_ids)
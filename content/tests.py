@@ -1,3 +1,380 @@
-from django.test import TestCase
+import io
+from datetime import date
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from api.testing import TEST_CACHES
+from users.models import CustomUser
+from .aggregates import compute_aggregates
+from .dumps import import_catalog, read_dump
+from .facets import facet_counts, filter_content
+from .ingest import CatalogClient, import_google_books, import_tmdb_movies
+from .models import Book, ListItem, Movie, Rating, Review, SearchTerm, UserList
+from .rankings import compute_ranking, get_ranking
+from .search import ranked_matches
+from .types import content_types
 
-# Create your tests here.
+
+class ContentTypeRegistryTests(TestCase):
+    def test_resolves_names_and_ids(self):
+        content_type = content_types.get('book')
+        self.assertEqual(content_type, ContentType.objects.get_for_model(Book))
+        self.assertEqual(content_types.name_for_id(content_type.pk), 'book')
+        self.assertIs(content_types.model_for_id(content_type.pk), Book)
+        self.assertIsNone(content_types.get('user'))
+        self.assertIsNone(content_types.model_for_id(ContentType.objects.get_for_model(ContentType).pk))
+
+    def test_follows_recreated_content_types(self):
+        # flush/TransactionTestCase ContentType tablosunu yeniden oluşturduğunda eski kimlik kullanılmamalı.
+        old_id = content_types.id_for(Book)
+        ContentType.objects.filter(pk=old_id).delete()
+        ContentType.objects.clear_cache()
+        # Test transaction'ı geri alındığında yeni kimlik de geçersizdir.
+        self.addCleanup(ContentType.objects.clear_cache)
+
+        book = Book.objects.create(google_books_id='g-registry', title="Dune")
+
+        new_id = content_types.id_for(Book)
+        self.assertNotEqual(new_id, old_id)
+        self.assertIsNone(content_types.name_for_id(old_id))
+        self.assertTrue(SearchTerm.objects.filter(content_type_id=new_id, object_id=book.pk).exists())
+
+
+class CatalogDumpImportTests(TestCase):
+    def load(self, model, text, fmt='jsonl'):
+        return import_catalog(model, read_dump(io.StringIO(text), fmt), batch_size=2)
+
+    def test_invalid_records_are_reported_per_line(self):
+        dump = "\n".join([
+            '{"tmdb_id": 1, "title": "Matrix", "release_date": "1999-03-31"}',
+            '{"tmdb_id": 2, "title": "Heat", "release_date": 1995}',
+            '{"tmdb_id": "", "title": "Adsız"}',
+            'çözümlenemeyen satır',
+            '{"tmdb_id": 3, "title": "Alien", "release_date": "1979-05-25"}',
+        ])
+        result = self.load(Movie, dump)
+
+        self.assertEqual((result['read'], result['invalid'], result['created']), (5, 3, 2))
+        self.assertEqual([error['position'] for error in result['errors']], [2, 3, 4])
+        self.assertEqual(set(Movie.objects.values_list('tmdb_id', flat=True)), {1, 3})
+
+    def test_blank_csv_key_is_rejected(self):
+        result = self.load(Book, "google_books_id,title\n  ,Adsız\ng1,Dune\n", fmt='csv')
+        self.assertEqual((result['invalid'], result['created']), (1, 1))
+        self.assertFalse(Book.objects.filter(google_books_id='').exists())
+
+    def test_reimport_is_idempotent(self):
+        dump = '{"google_books_id": "g1", "title": "Dune"}\n{"google_books_id": "g1", "title": "Dune Messiah"}\n'
+        first = self.load(Book, dump)
+        second = self.load(Book, dump)
+
+        self.assertEqual((first['created'], first['duplicates']), (1, 1))
+        self.assertEqual((second['created'], second['updated'], second['unchanged']), (0, 0, 1))
+        book = Book.objects.get()
+        self.assertEqual(book.title, "Dune Messiah")
+        self.assertTrue(SearchTerm.objects.filter(object_id=book.pk, term='messiah').exists())
+
+
+class RatingAggregateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.book = Book.objects.create(google_books_id='g1', title="Dune")
+        cls.users = [CustomUser.objects.create_user(f'user{index}', f'user{index}@example.com', 'parola-123') for index in range(3)]
+
+    def assertAggregates(self, rating_count, rating_sum):
+        self.book.refresh_from_db()
+        self.assertEqual((self.book.rating_count, self.book.rating_sum), (rating_count, rating_sum))
+        self.assertEqual(self.book.avg_score, rating_sum / rating_count if rating_count else None)
+        self.assertEqual(compute_aggregates(Book).get(self.book.pk, (0, 0)), (rating_count, rating_sum))
+
+    def test_incremental_updates(self):
+        for user, score in zip(self.users, (4, 8, 9)):
+            Rating.objects.create(user=user, content_object=self.book, score=score)
+        self.assertAggregates(3, 21)
+
+        # RatingSerializer.create ile aynı yol: update_or_create yüklenen puanla farkı uygular.
+        Rating.objects.update_or_create(
+            user=self.users[0], content_type=content_types.for_model(Book), object_id=self.book.pk,
+            defaults={'score': 10},
+        )
+        self.assertAggregates(3, 27)
+
+        rating = Rating.objects.get(user=self.users[1])
+        rating.score = 2
+        rating.save()
+        rating.save()
+        self.assertAggregates(3, 21)
+
+        rating.delete()
+        self.assertAggregates(2, 19)
+        Rating.objects.filter(object_id=self.book.pk).delete()
+        self.assertAggregates(0, 0)
+
+    def test_unloaded_instance_is_recounted(self):
+        rating = Rating.objects.create(user=self.users[0], content_object=self.book, score=4)
+        Rating(pk=rating.pk, user=self.users[0], content_object=self.book, score=6, created_at=rating.created_at).save()
+        self.assertAggregates(1, 6)
+
+    def test_average_written_before_counters(self):
+        # MySQL SET atamalarını sırayla uygular; ortalama eski sayaçlardan hesaplanmalı.
+        with CaptureQueriesContext(connection) as context:
+            Rating.objects.create(user=self.users[0], content_object=self.book, score=7)
+        update = next(
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('UPDATE') and Book._meta.db_table in query['sql']
+        )
+        self.assertLess(update.index('avg_score'), update.index('rating_count'))
+        self.assertAggregates(1, 7)
+
+
+class SearchRankingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.rocky = Movie.objects.create(tmdb_id=1, title="Rocky 3")
+        cls.rocky_horror = Movie.objects.create(tmdb_id=2, title="The Rocky Horror Picture Show")
+        cls.dune = Book.objects.create(google_books_id='g1', title="Dune", description="Rocky deserts")
+        cls.dunes = Book.objects.create(google_books_id='g2', title="Dunes of Rockyville")
+
+    def ids(self, query, **kwargs):
+        return [match['object_id'] for match in ranked_matches(query, **kwargs)]
+
+    def test_single_character_tokens_are_searchable(self):
+        self.assertEqual(self.ids("rocky 3")[0], self.rocky.pk)
+        self.assertEqual(self.ids("3"), [self.rocky.pk])
+
+    def test_only_last_token_is_a_prefix(self):
+        # "dune" birebir aranır ("dunes" eşleşmez); yazılmakta olan "rock" ise önektir.
+        matches = ranked_matches("dune rock")
+        self.assertEqual((matches[0]['object_id'], matches[0]['matched']), (self.dune.pk, 2))
+        self.assertNotIn(self.dunes.pk, [match['object_id'] for match in matches if match['matched'] == 2])
+        self.assertEqual(set(self.ids("dune")), {self.dune.pk, self.dunes.pk})
+
+    def test_candidate_set_is_capped(self):
+        self.assertEqual(len(self.ids("rock", limit=2)), 2)
+        self.assertEqual(ranked_matches("  ,"), [])
+
+    def test_frequent_term_does_not_use_up_the_cap(self):
+        # "alpha" alfabede öndedir ve çok geçer; sınır kelime başına paylaştırılmasaydı "zebra" hiç okunmazdı.
+        for index in range(6):
+            Book.objects.create(google_books_id=f'a{index}', title=f"Alpha {index}")
+        Book.objects.create(google_books_id='d1', title="Deserts", description="alpha")
+        zebra = Book.objects.create(google_books_id='z1', title="Alpha Zebra")
+
+        matches = ranked_matches("alpha zebra", limit=4)
+        self.assertEqual((matches[0]['object_id'], matches[0]['matched']), (zebra.pk, 2))
+        self.assertEqual(matches[0]['score'], 10)
+        # Adaylar ağırlığa göre seçilir: açıklamadaki düşük ağırlıklı eşleşme sınıra girmez.
+        self.assertEqual(len(self.ids("alpha", limit=3)), 3)
+        self.assertNotIn(Book.objects.get(google_books_id='d1').pk, self.ids("alpha", limit=3))
+
+
+class FakeCatalogHandler(BaseHTTPRequestHandler):
+    # Yanıtlar sunucudaki yol -> fonksiyon(params) eşlemesinden gelir; fonksiyon (durum, gövde) döndürür.
+    # Gövde metin değilse JSON'a çevrilir.
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        self.server.requests.append((url.path, params))
+
+        route = self.server.routes.get(url.path)
+        status, body = route(params) if route else (404, {'error': 'not found'})
+        body = body if isinstance(body, str) else json.dumps(body)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(body.encode('utf-8'))
+
+    def log_message(self, format, *args):
+        pass
+
+
+def sequence(*responses):
+    # Her istekte sıradaki yanıtı döndürür; son yanıt tekrar eder.
+    responses = list(responses)
+    return lambda params: responses.pop(0) if len(responses) > 1 else responses[0]
+
+
+class CatalogIngestTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), FakeCatalogHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.addClassCleanup(cls.server.server_close)
+        cls.addClassCleanup(cls.server.shutdown)
+        base_url = f'http://127.0.0.1:{cls.server.server_port}'
+        settings_override = override_settings(
+            GOOGLE_BOOKS_API_URL=f'{base_url}/books/v1/volumes',
+            TMDB_API_URL=f'{base_url}/3',
+            TMDB_API_KEY='test-key',
+        )
+        settings_override.enable()
+        cls.addClassCleanup(settings_override.disable)
+
+    def setUp(self):
+        self.server.routes = {}
+        self.server.requests = []
+        self.client = CatalogClient(rate=1000, workers=2, retries=2, use_cache=False)
+        self.addCleanup(self.client.close)
+
+    def requested(self, path):
+        return [params for request_path, params in self.server.requests if request_path == path]
+
+    def serve_books(self, volumes):
+        def page(params):
+            start = int(params['startIndex'])
+            return 200, {'items': volumes[start:start + int(params['maxResults'])]}
+        self.server.routes['/books/v1/volumes'] = page
+
+    def serve_movies(self, movies):
+        self.server.routes['/3/search/movie'] = lambda params: (200, {'results': movies})
+        for movie in movies:
+            self.server.routes[f"/3/movie/{movie['id']}"] = lambda params, movie=movie: (200, {
+                'genres': [{'name': 'Dram'}],
+                'credits': {'crew': [{'job': 'Director', 'name': f"Yönetmen {movie['id']}"}], 'cast': []},
+            })
+
+    def test_google_books_pages_are_fetched_and_reingest_is_idempotent(self):
+        volumes = [{'id': f'g{index}', 'volumeInfo': {'title': f"Kitap {index}", 'publishedDate': '1965'}} for index in range(5)]
+        self.serve_books(volumes)
+
+        result = import_google_books(['dune'], pages=3, page_size=2, client=self.client)
+        self.assertEqual(result, {'fetched': 5, 'created': 5})
+        self.assertEqual(sorted(int(params['startIndex']) for params in self.requested('/books/v1/volumes')), [0, 2, 4])
+        self.assertEqual(Book.objects.get(google_books_id='g3').publication_year, 1965)
+
+        terms = SearchTerm.objects.count()
+        result = import_google_books(['dune'], pages=3, page_size=2, client=self.client)
+        self.assertEqual(result, {'fetched': 5, 'created': 0})
+        self.assertEqual(Book.objects.count(), 5)
+        self.assertEqual(SearchTerm.objects.count(), terms)
+
+    def test_rate_limited_and_failed_requests_are_retried(self):
+        movies = [{'id': 7, 'title': "Alien"}]
+        self.serve_movies(movies)
+        self.server.routes['/3/search/movie'] = sequence((429, {}), (503, {}), (200, {'results': movies}))
+
+        result = import_tmdb_movies(['alien'], client=self.client)
+        self.assertEqual(result, {'fetched': 1, 'skipped': 0, 'created': 1})
+        self.assertEqual(len(self.requested('/3/search/movie')), 3)
+        self.assertEqual(Movie.objects.get(tmdb_id=7).director_name, "Yönetmen 7")
+
+    def test_exhausted_retries_skip_the_page(self):
+        self.server.routes['/books/v1/volumes'] = lambda params: (500, {})
+        result = import_google_books(['dune'], client=self.client)
+        self.assertEqual(result, {'fetched': 0, 'created': 0})
+        # İlk istek ve iki yeniden deneme.
+        self.assertEqual(len(self.requested('/books/v1/volumes')), 3)
+
+    def test_malformed_payloads_are_skipped(self):
+        self.server.routes['/books/v1/volumes'] = lambda params: {
+            'bozuk': (200, '{"items": ['),
+            'eksik': (200, {'items': [{'volumeInfo': {'title': "Kimliksiz"}}, {'id': 'g1'}]}),
+        }[params['q']]
+        result = import_google_books(['bozuk', 'eksik'], client=self.client)
+        self.assertEqual(result, {'fetched': 2, 'created': 1})
+        self.assertEqual(Book.objects.get().title, "Başlık Yok")
+
+        movies = [{'id': 1, 'title': "Heat"}, {'id': 2, 'title': "Ran"}]
+        self.serve_movies(movies)
+        self.server.routes['/3/movie/2'] = lambda params: (200, 'yarım')
+        result = import_tmdb_movies(['film'], client=self.client)
+        self.assertEqual(result, {'fetched': 2, 'skipped': 0, 'created': 1})
+        self.assertEqual(list(Movie.objects.values_list('tmdb_id', flat=True)), [1])
+
+    def test_known_movies_are_not_fetched_again(self):
+        self.serve_movies([{'id': 1, 'title': "Heat"}, {'id': 2, 'title': "Ran"}])
+        import_tmdb_movies(['film'], client=self.client)
+        self.server.requests = []
+
+        result = import_tmdb_movies(['film'], client=self.client)
+        self.assertEqual(result, {'fetched': 2, 'skipped': 2, 'created': 0})
+        self.assertEqual([path for path, params in self.server.requests], ['/3/search/movie'])
+        self.assertEqual(Movie.objects.count(), 2)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class RankingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [CustomUser.objects.create_user(f'user{index}', f'user{index}@example.com', 'parola-123') for index in range(2)]
+        cls.reviewed, cls.listed, cls.tied, cls.idle = [
+            Book.objects.create(google_books_id=f'g{index}', title=f"Kitap {index}") for index in range(4)
+        ]
+        Review.objects.create(user=cls.users[0], content_object=cls.reviewed, text="Güzel")
+        for index in range(3):
+            user_list = UserList.objects.create(user=cls.users[0], name=f"Liste {index}")
+            ListItem.objects.create(list=user_list, content_object=cls.listed)
+
+        # Ortalamalar eşit (8); yorumu olan, daha çok puanı olanın önüne geçer.
+        Rating.objects.create(user=cls.users[0], content_object=cls.reviewed, score=8)
+        for user in cls.users:
+            Rating.objects.create(user=user, content_object=cls.tied, score=8)
+        Rating.objects.create(user=cls.users[0], content_object=cls.listed, score=9)
+
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+
+    def test_popular_orders_by_reviews_plus_list_items(self):
+        # 3 liste ekleme 1 yorumu geçer; eşitlikte ortalama, sonra kimlik.
+        self.assertEqual(
+            compute_ranking('popular')['book'],
+            [self.listed.pk, self.reviewed.pk, self.tied.pk, self.idle.pk],
+        )
+
+    def test_top_rated_breaks_ties_on_review_count(self):
+        self.assertEqual(compute_ranking('top_rated')['book'], [self.listed.pk, self.reviewed.pk, self.tied.pk])
+
+    def test_deleting_content_invalidates_cached_rankings(self):
+        self.assertIn(self.listed.pk, get_ranking('popular')['book'])
+        self.assertIn(self.listed.pk, get_ranking('top_rated')['book'])
+        self.listed.delete()
+        self.assertNotIn(self.listed.pk, get_ranking('popular')['book'])
+        self.assertNotIn(self.listed.pk, get_ranking('top_rated')['book'])
+
+
+class FacetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.drama = Book.objects.create(google_books_id='g1', title="Kitap 1", genres_list="Drama, Komedi", publication_year=2000)
+        cls.melodrama = Book.objects.create(google_books_id='g2', title="Kitap 2", genres_list="Melodrama", publication_year=2000)
+        cls.old_drama = Book.objects.create(google_books_id='g3', title="Kitap 3", genres_list="drama", publication_year=1990)
+        cls.movie = Movie.objects.create(tmdb_id=1, title="Film 1", genres_list=" DRAMA ,Gerilim", release_date=date(2000, 5, 1))
+        Movie.objects.create(tmdb_id=2, title="Film 2", genres_list="Drama", release_date=date(2001, 1, 1))
+        Book.objects.filter(pk__in=[cls.drama.pk, cls.melodrama.pk]).update(avg_score=8)
+        Movie.objects.filter(pk=cls.movie.pk).update(avg_score=6)
+
+    def ids(self, model, **filters):
+        return set(filter_content(model, **filters).values_list('pk', flat=True))
+
+    def test_genre_matches_exact_slug(self):
+        self.assertEqual(self.ids(Book, genre="Drama"), {self.drama.pk, self.old_drama.pk})
+        self.assertEqual(self.ids(Book, genre="  drAma "), {self.drama.pk, self.old_drama.pk})
+        self.assertEqual(self.ids(Book, genre="Melodrama"), {self.melodrama.pk})
+        self.assertEqual(self.ids(Book, genre="dram"), set())
+
+    def test_year_bounds(self):
+        self.assertEqual(self.ids(Movie, year=2000), {self.movie.pk})
+        self.assertEqual(self.ids(Book, year=1990), {self.old_drama.pk})
+        self.assertEqual(self.ids(Movie, year=1), set())
+        self.assertEqual(self.ids(Movie, year=9998), set())
+
+    def test_facet_counts_under_combined_filters(self):
+        facets = facet_counts({
+            model: filter_content(model, genre="drama", year=2000, min_score=5) for model in (Book, Movie)
+        })
+        self.assertEqual(facets['years'], [{'year': 2000, 'count': 2}])
+        self.assertEqual(
+            sorted((facet['name'], facet['count']) for facet in facets['genres']),
+            [("Drama", 2), ("Gerilim", 1), ("Komedi", 1)],
+        )
@@ -0,0 +1,44 @@
+from django.contrib.contenttypes.models import ContentType
+
+
+class ContentTypeRegistry:
+    # Herkese açık tip adları ('book', 'rating', ...) ile ContentType kayıtları arasındaki eşleme.
+    # Modeller AppConfig.ready içinde kaydedilir. Kimlikler burada saklanmaz; ContentType yöneticisinin
+    # kendi önbelleğinden okunur. O önbellek post_migrate ve ContentType.objects.clear_cache() ile
+    # temizlendiği için tablo yeniden oluşturulduğunda (flush, TransactionTestCase) eski kimlikler kullanılmaz.
+    def __init__(self):
+        self._models = {}
+        self._names = {}
+
+    def register(self, name, model):
+        self._models[name] = model
+        self._names[model] = name
+
+    def names(self):
+        return tuple(self._models)
+
+    def get(self, name):
+        model = self._models.get(name)
+        return self.for_model(model) if model else None
+
+    def for_model(self, model):
+        if model not in self._names:
+            raise LookupError(f"{model.__name__} kayıtlı bir içerik tipi değil.")
+        return ContentType.objects.get_for_model(model, for_concrete_model=False)
+
+    def id_for(self, model):
+        return self.for_model(model).pk
+
+    def model_for_id(self, content_type_id):
+        try:
+            content_type = ContentType.objects.get_for_id(content_type_id)
+        except ContentType.DoesNotExist:
+            return None
+        model = content_type.model_class()
+        return model if model in self._names else None
+
+    def name_for_id(self, content_type_id):
+        return self._names.get(self.model_for_id(content_type_id))
+
+
+content_types = ContentTypeRegistry()
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from django.db import IntegrityError, transaction
+from jobs.dispatch import enqueue
+from content.models import Rating, Review, ListItem
+from content.types import content_types
+from .models import Activity, Follow
+from .timeline import fan_out_activity, fan_out_activities
+
+
+ACTIVITY_TYPE_BY_MODEL = {
+    Rating: 1,
+    Review: 2,
+    ListItem: 3,
+    Follow: 4,
+}
+
+
+def _actor_id(instance):
+    if isinstance(instance, ListItem):
+        return instance.list.user_id
+    if isinstance(instance, Follow):
+        return instance.follower_id
+    return instance.user_id
+
+
+def build_activity(instance):
+    return Activity(
+        user_id=_actor_id(instance),
+        activity_type=ACTIVITY_TYPE_BY_MODEL[type(instance)],
+        content_type=content_types.for_model(type(instance)),
+        object_id=instance.pk,
+    )
+
+
+def store_activity(user_id, activity_type, content_type_id, object_id):
+    # Olay silinmişse (geç teslim) aktivite yazılmaz; daha önce yazılmışsa yalnızca dağıtım tekrarlanır.
+    model = content_types.model_for_id(content_type_id)
+    if model is None or not model.objects.filter(pk=object_id).exists():
+        return
+
+    lookup = {'content_type_id': content_type_id, 'object_id': object_id, 'activity_type': activity_type}
+    try:
+        if transaction.get_connection().in_atomic_block:
+            with transaction.atomic():
+                Activity.objects.create(user_id=user_id, **lookup)
+        else:
+            Activity.objects.create(user_id=user_id, **lookup)
+    except IntegrityError:
+        fan_out_activity(Activity.objects.get(**lookup))
+
+
+def record_activity(instance):
+    activity = build_activity(instance)
+    enqueue(
+        'feed.store_activity',
+        user_id=activity.user_id,
+        activity_type=activity.activity_type,
+        content_type_id=activity.content_type_id,
+        object_id=activity.object_id,
+    )
+
+
+def record_activities(instances, batch_size=1000):
+    # Toplu ve tekrar çalıştırılabilir yol: zaten kayıtlı olaylar atlanır.
+    # bulk_create post_save tetiklemediği için akış dağıtımı yazılan kayıtlar geri okunarak yapılır.
+    activities = [build_activity(instance) for instance in instances]
+    Activity.objects.bulk_create(activities, batch_size=batch_size, ignore_conflicts=True)
+
+    object_ids = defaultdict(list)
+    for activity in activities:
+        object_ids[(activity.content_type_id, activity.activity_type)].append(activity.object_id)
+
+    recorded = []
+    for (content_type_id, activity_type), ids in object_ids.items():
+        recorded.extend(Activity.objects.filter(
+            content_type_id=content_type_id,
+            activity_type=activity_type,
+            object_id__in=ids,
+        ))
+
+    fan_out_activities(recorded, batch_size=batch_size)
+    return recorded
@@ -6,4 +6,8 @@ class FeedConfig(AppConfig):
     name = 'feed'
 
     def ready(self):
-        import feed.signals 
\ No newline at end of file
+        import feed.signals
+        from content.types import content_types
+        from .models import Follow
+
+        content_types.register('follow', Follow)
@@ -0,0 +1,44 @@
+from django.db.models import Count, F, OuterRef, Subquery, Value, IntegerField
+from django.db.models.functions import Coalesce
+from users.models import CustomUser
+from .models import Follow
+
+
+def adjust_follow_counts(follow, delta):
+    CustomUser.objects.filter(pk=follow.following_id).update(followers_count=F('followers_count') + delta)
+    CustomUser.objects.filter(pk=follow.follower_id).update(following_count=F('following_count') + delta)
+
+
+def _follow_count(user_field):
+    counts = Follow.objects.filter(**{user_field: OuterRef('pk')}).order_by().values(user_field).annotate(
+        total=Count('pk')
+    ).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def recount_follow_counts(user_ids):
+    # Sayaçlar delta yerine Follow satırlarından yeniden yazılır; eşzamanlı eklenen takipler iki kez sayılmaz.
+    CustomUser.objects.filter(pk__in=user_ids).update(
+        followers_count=_follow_count('following'),
+        following_count=_follow_count('follower'),
+    )
+
+
+def compute_follow_counts():
+    followers = dict(Follow.objects.order_by().values('following_id').annotate(total=Count('id')).values_list('following_id', 'total'))
+    following = dict(Follow.objects.order_by().values('follower_id').annotate(total=Count('id')).values_list('follower_id', 'total'))
+    return followers, following
+
+
+def rebuild_follow_counts(verify_only=False, batch_size=1000):
+    followers, following = compute_follow_counts()
+    mismatched = [
+        pk for pk, followers_count, following_count
+        in CustomUser.objects.values_list('pk', 'followers_count', 'following_count').iterator()
+        if (followers_count, following_count) != (followers.get(pk, 0), following.get(pk, 0))
+    ]
+
+    if not verify_only:
+        for start in range(0, len(mismatched), batch_size):
+            recount_follow_counts(mismatched[start:start + batch_size])
+    return mismatched
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand, CommandError
+from feed.counters import rebuild_follow_counts
+
+
+class Command(BaseCommand):
+    help = "Kullanıcıların takipçi/takip edilen sayaçlarını (followers_count, following_count) Follow tablosundan yeniden hesaplar."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify', action='store_true', help="Hiçbir şey yazmadan yalnızca tutarsızlıkları raporla.")
+
+    def handle(self, *args, **options):
+        verify_only = options['verify']
+        mismatched = rebuild_follow_counts(verify_only=verify_only)
+        self.stdout.write(f"{len(mismatched)} kullanıcının takip sayaçları tutarsız.")
+
+        if verify_only and mismatched:
+            raise CommandError(f"{len(mismatched)} kullanıcıda takip sayaçları tutarsız.")
+
+        self.stdout.write(self.style.SUCCESS("Takip sayaçları güncel."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from users.models import CustomUser
+from feed.timeline import rebuild_timeline
+
+
+class Command(BaseCommand):
+    help = "Kullanıcıların materyalize akış (timeline) kayıtlarını Activity tablosundan yeniden oluşturur."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, help="Sadece bu ID'ye sahip kullanıcının akışını yeniden oluştur.")
+
+    def handle(self, *args, **options):
+        users = CustomUser.objects.all()
+        if options['user']:
+            users = users.filter(pk=options['user'])
+
+        total = 0
+        for user in users.iterator():
+            total += rebuild_timeline(user)
+
+        self.stdout.write(self.style.SUCCESS(f"{total} akış kaydı oluşturuldu."))
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_timelines(apps, schema_editor):
+    Activity = apps.get_model('feed', 'Activity')
+    Follow = apps.get_model('feed', 'Follow')
+    TimelineEntry = apps.get_model('feed', 'TimelineEntry')
+
+    followers_by_author = {}
+    for follower_id, following_id in Follow.objects.values_list('follower_id', 'following_id').iterator():
+        followers_by_author.setdefault(following_id, []).append(follower_id)
+
+    entries = []
+    for activity_id, user_id, created_at in Activity.objects.values_list('id', 'user_id', 'created_at').iterator():
+        for owner_id in [user_id] + followers_by_author.get(user_id, []):
+            entries.append(TimelineEntry(owner_id=owner_id, activity_id=activity_id, created_at=created_at))
+        if len(entries) >= 1000:
+            TimelineEntry.objects.bulk_create(entries, ignore_conflicts=True)
+            entries = []
+    TimelineEntry.objects.bulk_create(entries, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feed', '0003_activity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField()),
+                ('activity', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='feed.activity')),
+                ('owner', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'Timeline Entries',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['owner', '-created_at'], name='feed_timeline_owner_created')],
+                'unique_together': {('owner', 'activity')},
+            },
+        ),
+        migrations.RunPython(backfill_timelines, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def delete_duplicate_activities(apps, schema_editor):
+    # Kısıt eklenmeden önce aynı olay için yazılmış fazladan kayıtlar silinir; en eski kayıt korunur.
+    Activity = apps.get_model('feed', 'Activity')
+    duplicates = Activity.objects.order_by().values('content_type', 'object_id', 'activity_type').annotate(
+        keep_id=models.Min('id'), total=models.Count('id')
+    ).filter(total__gt=1)
+
+    for row in duplicates.iterator():
+        Activity.objects.filter(
+            content_type=row['content_type'],
+            object_id=row['object_id'],
+            activity_type=row['activity_type'],
+        ).exclude(pk=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('feed', '0005_activity_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_activities, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='activity',
+            constraint=models.UniqueConstraint(fields=('content_type', 'object_id', 'activity_type'), name='feed_activity_unique_event'),
+        ),
+    ]
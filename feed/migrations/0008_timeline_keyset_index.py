@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('feed', '0007_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='timelineentry',
+            index=models.Index(fields=['owner', '-created_at', '-activity'], name='feed_timeline_owner_keyset'),
+        ),
+        migrations.RemoveIndex(
+            model_name='timelineentry',
+            name='feed_timeline_owner_created',
+        ),
+    ]
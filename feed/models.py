@@ -21,6 +21,9 @@ class Follow(models.Model):
     class Meta:
         unique_together = ('follower', 'following')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['following', 'follower'], name='feed_follow_following_follower'),
+        ]
 
     def __str__(self):
         return f"{self.follower.username} follows {self.following.username}"
@@ -45,6 +48,32 @@ class Activity(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = "Activities"
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='feed_activity_created_id'),
+            models.Index(fields=['user', '-created_at', '-id'], name='feed_activity_user_created_id'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id', 'activity_type'],
+                name='feed_activity_unique_event',
+            ),
+        ]
         
     def __str__(self):
-        return f"{self.user.username} - {self.get_activity_type_display()} on {self.created_at.strftime('%Y-%m-%d %H:%M')}"
\ No newline at end of file
+        return f"{self.user.username} - {self.get_activity_type_display()} on {self.created_at.strftime('%Y-%m-%d %H:%M')}"
+
+class TimelineEntry(models.Model):
+    owner = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='timeline_entries')
+    activity = models.ForeignKey(Activity, on_delete=models.CASCADE, related_name='timeline_entries')
+    created_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('owner', 'activity')
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['owner', '-created_at', '-activity'], name='feed_timeline_owner_keyset'),
+        ]
+        verbose_name_plural = "Timeline Entries"
+
+    def __str__(self):
+        return f"{self.owner.username} <- {self.activity_id}"
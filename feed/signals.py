@@ -1,53 +1,68 @@
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from content.models import Rating, Review, ListItem, UserList
+from content.types import content_types
 from .models import Activity, Follow 
+from jobs.dispatch import enqueue
+from caching.tiered import bump_generation
+from .timeline import fan_out_activity, remove_follow
+from .counters import adjust_follow_counts
+from .activities import record_activity
 from users.models import CustomUser
 
 
 @receiver(post_save, sender=Rating)
-def record_rating_activity(sender, instance, created, **kwargs):
+@receiver(post_save, sender=Review)
+@receiver(post_save, sender=ListItem)
+@receiver(post_save, sender=Follow)
+def record_content_activity(sender, instance, created, **kwargs):
     if created:
-        Activity.objects.create(
-            user=instance.user,
-            activity_type=1,
-            content_type=ContentType.objects.get_for_model(sender),
-            object_id=instance.id
-        )
+        record_activity(instance)
 
 
-@receiver(post_save, sender=Review)
-def record_review_activity(sender, instance, created, **kwargs):
+@receiver(post_save, sender=Activity)
+def fan_out_to_timelines(sender, instance, created, **kwargs):
     if created:
-        Activity.objects.create(
-            user=instance.user,
-            activity_type=2, 
-            content_type=ContentType.objects.get_for_model(sender),
-            object_id=instance.id
-        )
+        fan_out_activity(instance)
 
 
-@receiver(post_save, sender=ListItem)
-def record_list_item_activity(sender, instance, created, **kwargs):
+@receiver(post_save, sender=Follow)
+def backfill_followed_timeline(sender, instance, created, **kwargs):
     if created:
-        Activity.objects.create(
-            user=instance.list.user, 
-            activity_type=3,
-            content_type=ContentType.objects.get_for_model(sender),
-            object_id=instance.id
-        )
+        enqueue('feed.backfill_follow', follow_id=instance.pk)
 
 
 @receiver(post_save, sender=Follow)
-def record_follow_activity(sender, instance, created, **kwargs):
+def increment_follow_counts(sender, instance, created, **kwargs):
     if created:
-        Activity.objects.create(
-            user=instance.follower, 
-            activity_type=4,
-            content_type=ContentType.objects.get_for_model(sender),
-            object_id=instance.id
-        )
+        adjust_follow_counts(instance, 1)
+
+
+@receiver(post_delete, sender=Follow)
+def decrement_follow_counts(sender, instance, **kwargs):
+    adjust_follow_counts(instance, -1)
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def invalidate_follow_profiles(sender, instance, **kwargs):
+    # Takip sayaçları F() ile güncellendiği için kullanıcı post_save'i tetiklenmez; profiller burada eskir.
+    def invalidate():
+        bump_generation('user', instance.follower_id)
+        bump_generation('user', instance.following_id)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=CustomUser)
+def invalidate_user_profile(sender, instance, **kwargs):
+    transaction.on_commit(lambda: bump_generation('user', instance.pk))
+
+
+@receiver(post_delete, sender=Follow)
+def clear_unfollowed_timeline(sender, instance, **kwargs):
+    remove_follow(instance)
 
 
 @receiver(post_save, sender=CustomUser)
@@ -79,7 +94,7 @@ def create_initial_lists(sender, instance, created, **kwargs):
 @receiver(post_delete, sender=Follow)
 def delete_activity_record(sender, instance, **kwargs):
     try:
-        content_type = ContentType.objects.get_for_model(sender)
+        content_type = content_types.for_model(sender)
         Activity.objects.filter(
             content_type=content_type,
             object_id=instance.id
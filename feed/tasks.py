@@ -0,0 +1,21 @@
+from jobs.dispatch import handler
+from .activities import store_activity
+from .models import Follow
+from .timeline import backfill_follow, backfill_follows
+
+
+@handler('feed.store_activity')
+def store_activity_job(user_id, activity_type, content_type_id, object_id):
+    store_activity(user_id, activity_type, content_type_id, object_id)
+
+
+@handler('feed.backfill_follow')
+def backfill_follow_job(follow_id):
+    follow = Follow.objects.filter(pk=follow_id).first()
+    if follow is not None:
+        backfill_follow(follow)
+
+
+@handler('feed.backfill_follows')
+def backfill_follows_job(follow_ids):
+    backfill_follows(list(Follow.objects.filter(pk__in=follow_ids)))
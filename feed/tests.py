@@ -1,3 +1,92 @@
-from django.test import TestCase
+import io
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from content.models import Book, Rating
+from content.types import content_types
+from users.models import CustomUser
+from .activities import record_activities, store_activity
+from .counters import rebuild_follow_counts
+from .models import Activity, Follow, TimelineEntry
 
-# Create your tests here.
+
+@override_settings(JOBS_BACKEND='sync')
+class ActivityUniqueEventTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.author = CustomUser.objects.create_user('author', 'author@example.com', 'parola-123')
+            cls.follower = CustomUser.objects.create_user('follower', 'follower@example.com', 'parola-123')
+            Follow.objects.create(follower=cls.follower, following=cls.author)
+            book = Book.objects.create(google_books_id='g1', title="Dune")
+            cls.rating = Rating.objects.create(user=cls.author, content_object=book, score=8)
+        cls.event = {
+            'content_type': content_types.for_model(Rating),
+            'object_id': cls.rating.pk,
+            'activity_type': 1,
+        }
+
+    def test_constraint_rejects_duplicate_event(self):
+        self.assertEqual(Activity.objects.filter(**self.event).count(), 1)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Activity.objects.create(user=self.author, **self.event)
+
+    def test_redelivered_event_is_recorded_once(self):
+        # İş kuyruğu en az bir kez teslim eder; aynı olayın tekrar işlenmesi yeni satır ya da akış girişi üretmez.
+        activity = Activity.objects.get(**self.event)
+        store_activity(self.author.pk, 1, self.event['content_type'].pk, self.rating.pk)
+        record_activities([self.rating])
+
+        self.assertEqual(Activity.objects.filter(**self.event).count(), 1)
+        self.assertEqual(
+            set(TimelineEntry.objects.filter(activity=activity).values_list('owner_id', flat=True)),
+            {self.author.pk, self.follower.pk},
+        )
+
+
+
+@override_settings(JOBS_BACKEND='sync')
+class FollowCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [CustomUser.objects.create_user(f'user{index}', f'user{index}@example.com', 'parola-123') for index in range(3)]
+
+    def counts(self):
+        # (takipçi, takip edilen) çiftleri, kullanıcı sırasıyla.
+        return list(CustomUser.objects.order_by('pk').values_list('followers_count', 'following_count'))
+
+    def test_single_follow_and_unfollow(self):
+        first, second, third = self.users
+        follow = Follow.objects.create(follower=first, following=second)
+        Follow.objects.create(follower=third, following=second)
+        self.assertEqual(self.counts(), [(0, 1), (2, 0), (0, 1)])
+
+        follow.delete()
+        self.assertEqual(self.counts(), [(0, 0), (1, 0), (0, 1)])
+
+    def test_deleting_user_releases_counts(self):
+        first, second, third = self.users
+        Follow.objects.create(follower=first, following=second)
+        Follow.objects.create(follower=third, following=second)
+        Follow.objects.create(follower=second, following=first)
+
+        # Cascade ile silinen Follow satırları da karşı taraftaki sayaçları düşürür.
+        second.delete()
+        self.assertEqual(self.counts(), [(0, 0), (0, 0)])
+
+    def test_rebuild_repairs_corrupted_counts(self):
+        first, second, third = self.users
+        Follow.objects.create(follower=first, following=second)
+        Follow.objects.create(follower=third, following=second)
+        CustomUser.objects.filter(pk=second.pk).update(followers_count=7)
+        CustomUser.objects.filter(pk=third.pk).update(following_count=0, followers_count=3)
+
+        with self.assertRaises(CommandError):
+            call_command('rebuild_follow_counts', '--verify', stdout=io.StringIO())
+        self.assertEqual(self.counts(), [(0, 1), (7, 0), (3, 0)])
+
+        out = io.StringIO()
+        call_command('rebuild_follow_counts', stdout=out)
+        self.assertIn("2 kullanıcının", out.getvalue())
+        self.assertEqual(self.counts(), [(0, 1), (2, 0), (0, 1)])
+        self.assertEqual(rebuild_follow_counts(verify_only=True), [])
@@ -0,0 +1,127 @@
+from collections import defaultdict
+from django.conf import settings
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from users.models import CustomUser
+from .models import Activity, Follow, TimelineEntry
+
+
+def is_pull_author(user_id):
+    # Çok takipçisi olan hesapların aktiviteleri yazma anında dağıtılmaz, okuma anında çekilir.
+    followers_count = CustomUser.objects.filter(pk=user_id).values_list('followers_count', flat=True).first()
+    return (followers_count or 0) > settings.FEED_FANOUT_FOLLOWER_LIMIT
+
+
+def pull_author_ids(user):
+    return list(
+        CustomUser.objects.filter(
+            followers__follower=user,
+            followers_count__gt=settings.FEED_FANOUT_FOLLOWER_LIMIT,
+        ).values_list('id', flat=True)
+    )
+
+
+def fan_out_activity(activity):
+    fan_out_activities([activity])
+
+
+def fan_out_activities(activities, batch_size=1000):
+    # Takipçi listesi yazar başına bir kez okunur; tüm zaman akışı girişleri tek bulk_create ile yazılır.
+    by_author = defaultdict(list)
+    for activity in activities:
+        by_author[activity.user_id].append(activity)
+
+    entries = []
+    for author_id, authored in by_author.items():
+        owner_ids = [author_id]
+        if not is_pull_author(author_id):
+            owner_ids.extend(
+                Follow.objects.filter(following_id=author_id).order_by().values_list('follower_id', flat=True)
+            )
+        entries.extend(
+            TimelineEntry(owner_id=owner_id, activity=activity, created_at=activity.created_at)
+            for activity in authored
+            for owner_id in owner_ids
+        )
+
+    TimelineEntry.objects.bulk_create(entries, batch_size=batch_size, ignore_conflicts=True)
+
+
+def backfill_follow(follow):
+    if is_pull_author(follow.following_id):
+        return
+
+    recent_activities = Activity.objects.filter(
+        user_id=follow.following_id
+    ).order_by('-created_at').values_list('id', 'created_at')[:settings.FEED_BACKFILL_LIMIT]
+
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(owner_id=follow.follower_id, activity_id=activity_id, created_at=created_at)
+            for activity_id, created_at in recent_activities
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def backfill_follows(follows, batch_size=1000):
+    # Toplu takiplerde her yazarın son aktiviteleri tek sorguda (ROW_NUMBER penceresi) okunur.
+    pushed_ids = set(
+        CustomUser.objects.filter(
+            pk__in={follow.following_id for follow in follows},
+            followers_count__lte=settings.FEED_FANOUT_FOLLOWER_LIMIT,
+        ).values_list('pk', flat=True)
+    )
+    if not pushed_ids:
+        return
+
+    recent_activities = defaultdict(list)
+    for user_id, activity_id, created_at in Activity.objects.filter(user_id__in=pushed_ids).annotate(
+        position=Window(RowNumber(), partition_by=F('user_id'), order_by=(F('created_at').desc(), F('id').desc()))
+    ).filter(position__lte=settings.FEED_BACKFILL_LIMIT).values_list('user_id', 'id', 'created_at'):
+        recent_activities[user_id].append((activity_id, created_at))
+
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(owner_id=follow.follower_id, activity_id=activity_id, created_at=created_at)
+            for follow in follows
+            for activity_id, created_at in recent_activities.get(follow.following_id, ())
+        ],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+
+def remove_follow(follow):
+    TimelineEntry.objects.filter(
+        owner_id=follow.follower_id,
+        activity__user_id=follow.following_id
+    ).delete()
+
+
+def rebuild_timeline(user):
+    TimelineEntry.objects.filter(owner=user).delete()
+
+    author_ids = [user.pk] + list(
+        Follow.objects.filter(
+            follower=user,
+            following__followers_count__lte=settings.FEED_FANOUT_FOLLOWER_LIMIT,
+        ).values_list('following_id', flat=True)
+    )
+    entries = [
+        TimelineEntry(owner=user, activity_id=activity_id, created_at=created_at)
+        for activity_id, created_at in Activity.objects.filter(user_id__in=author_ids).values_list('id', 'created_at')
+    ]
+    TimelineEntry.objects.bulk_create(entries, batch_size=1000, ignore_conflicts=True)
+    return len(entries)
+
+
+def timeline_sources(user):
+    # Akış iki indeksli sorgudan okunur: kullanıcının zaman akışı girişleri (owner, -created_at, -activity)
+    # ve çok takipçili (pull) yazarların aktiviteleri (user, -created_at, -id). OR + DISTINCT birleşimi
+    # indeksleri devre dışı bıraktığı için sonuçlar uygulamada birleştirilir.
+    sources = [(TimelineEntry.objects.filter(owner=user), 'activity_id')]
+    pulled_ids = pull_author_ids(user)
+    if pulled_ids:
+        sources.append((Activity.objects.filter(user_id__in=pulled_ids), 'id'))
+    return sources
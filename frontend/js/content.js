@@ -33,7 +33,8 @@ export const renderSearchPage = async (query) => {
     const searchResults = document.getElementById('search-results');
 
     try {
-        const results = await fetchData(`search/?q=${encodeURIComponent(query)}`); 
+        const response = await fetchData(`search/?q=${encodeURIComponent(query)}`); 
+        const results = response.results || [];
         
         searchStatus.style.display = 'none';
 
@@ -111,7 +112,7 @@ export const renderContentDetailPage = async (contentType, contentId) => {
         const interactionElement = document.getElementById('user-interaction');
         interactionElement.innerHTML = renderInteractionArea(details, contentType); 
         
-        renderReviews(details.reviews, details.content_type_id, details.id);
+        renderReviews(details.reviews, details.reviews_next);
 
     } catch (error) {
         mainContent.innerHTML = `<h2>Hata</h2><p>İçerik yüklenemedi: API isteği başarısız: ${error.message}</p>`;
@@ -175,7 +176,40 @@ const setupRatingForm = (details, contentType) => {
     });
 };
 
-const renderReviews = (reviews, contentTypeId, objectId) => {
+const createReviewCard = (review, currentUserId) => {
+    const isOwner = currentUserId && (currentUserId === review.user.id);
+    const avatarUrl = review.user.avatar_url || 'https://via.placeholder.com/40/AAAAAA/FFFFFF?text=P'; 
+    
+    return `
+        <div class="review-item content-review-card" data-review-id="${review.id}">
+            
+            <div class="review-user-header">
+                <img src="${avatarUrl}" alt="${review.user.username} Avatar" class="review-user-avatar" />
+                <div>
+                    <strong><a href="#profile/${review.user.id}">${review.user.username}</a></strong>
+                    <small> - ${new Date(review.created_at).toLocaleString()}</small>
+                </div>
+            </div>
+
+            <p id="review-text-${review.id}" class="review-text">${review.text}</p>
+            
+            ${isOwner ? `
+                <div class="review-actions">
+                    <button class="edit-review-btn" data-id="${review.id}">Düzenle</button>
+                    <button class="delete-review-btn" data-id="${review.id}">Sil</button>
+                </div>
+                <form id="edit-form-${review.id}" class="edit-review-form" style="display:none;">
+                    <textarea id="edit-text-${review.id}" required>${review.text}</textarea>
+                    <button type="submit">Kaydet</button>
+                    <button type="button" class="cancel-edit-btn" data-id="${review.id}">İptal</button>
+                    <p id="edit-status-${review.id}" class="status-message"></p>
+                </form>
+            ` : ''}
+        </div>
+    `;
+};
+
+const renderReviews = (reviews, nextReviewsUrl) => {
     const reviewListElement = document.getElementById('review-list');
     
     const currentUserId = getUserId(); 
@@ -192,42 +226,35 @@ const renderReviews = (reviews, contentTypeId, objectId) => {
 
     const safeReviews = reviews || []; 
 
-    const reviewHtml = safeReviews.map(review => {
-        const isOwner = currentUserId && (currentUserId === review.user.id);
-        const avatarUrl = review.user.avatar_url || 'https://via.placeholder.com/40/AAAAAA/FFFFFF?text=P'; 
-        
-        return `
-            <div class="review-item content-review-card" data-review-id="${review.id}">
-                
-                <div class="review-user-header">
-                    <img src="${avatarUrl}" alt="${review.user.username} Avatar" class="review-user-avatar" />
-                    <div>
-                        <strong><a href="#profile/${review.user.id}">${review.user.username}</a></strong>
-                        <small> - ${new Date(review.created_at).toLocaleString()}</small>
-                    </div>
-                </div>
+    const reviewHtml = safeReviews.map(review => createReviewCard(review, currentUserId)).join('')
+        || '<p class="info-message">Bu içerik için henüz yorum yapılmamış.</p>';
 
-                <p id="review-text-${review.id}" class="review-text">${review.text}</p>
-                
-                ${isOwner ? `
-                    <div class="review-actions">
-                        <button class="edit-review-btn" data-id="${review.id}">Düzenle</button>
-                        <button class="delete-review-btn" data-id="${review.id}">Sil</button>
-                    </div>
-                    <form id="edit-form-${review.id}" class="edit-review-form" style="display:none;">
-                        <textarea id="edit-text-${review.id}" required>${review.text}</textarea>
-                        <button type="submit">Kaydet</button>
-                        <button type="button" class="cancel-edit-btn" data-id="${review.id}">İptal</button>
-                        <p id="edit-status-${review.id}" class="status-message"></p>
-                    </form>
-                ` : ''}
-            </div>
-        `;
-    }).join('') || '<p class="info-message">Bu içerik için henüz yorum yapılmamış.</p>';
-
-    reviewListElement.innerHTML = formHtml + reviewHtml;
+    reviewListElement.innerHTML = formHtml + `<div id="review-cards">${reviewHtml}</div>`
+        + `<button id="load-more-reviews-btn" style="display:${nextReviewsUrl ? 'block' : 'none'};">Daha Fazla Yorum</button>`;
     
-    setupReviewActions();
+    setupReviewActions(document.getElementById('review-cards'));
+
+    let nextUrl = nextReviewsUrl;
+    const loadMoreButton = document.getElementById('load-more-reviews-btn');
+    loadMoreButton.addEventListener('click', async () => {
+        loadMoreButton.disabled = true;
+        try {
+            const urlObj = new URL(nextUrl);
+            const response = await fetchData(urlObj.pathname.replace(/^\/api\//, '') + urlObj.search);
+
+            const container = document.createElement('div');
+            container.innerHTML = (response.results || []).map(review => createReviewCard(review, currentUserId)).join('');
+            document.getElementById('review-cards').appendChild(container);
+            setupReviewActions(container);
+
+            nextUrl = response.next;
+            loadMoreButton.style.display = nextUrl ? 'block' : 'none';
+        } catch (error) {
+            console.error("Yorumlar yüklenirken hata:", error);
+        } finally {
+            loadMoreButton.disabled = false;
+        }
+    });
 };
 
 const setupReviewForm = (details, contentType) => { 
@@ -252,8 +279,8 @@ const setupReviewForm = (details, contentType) => {
     });
 };
 
-const setupReviewActions = () => {
-    document.querySelectorAll('.delete-review-btn').forEach(button => {
+const setupReviewActions = (root = document) => {
+    root.querySelectorAll('.delete-review-btn').forEach(button => {
         button.addEventListener('click', async (e) => {
             const reviewId = e.target.dataset.id;
             if (confirm('Bu yorumu silmek istediğinizden emin misiniz?')) {
@@ -268,7 +295,7 @@ const setupReviewActions = () => {
         });
     });
 
-    document.querySelectorAll('.edit-review-btn').forEach(button => {
+    root.querySelectorAll('.edit-review-btn').forEach(button => {
         button.addEventListener('click', (e) => {
             const reviewId = e.target.dataset.id;
             const textElement = document.getElementById(`review-text-${reviewId}`);
@@ -279,7 +306,7 @@ const setupReviewActions = () => {
         });
     });
     
-    document.querySelectorAll('.cancel-edit-btn').forEach(button => {
+    root.querySelectorAll('.cancel-edit-btn').forEach(button => {
         button.addEventListener('click', (e) => {
             const reviewId = e.target.dataset.id;
             const textElement = document.getElementById(`review-text-${reviewId}`);
@@ -291,7 +318,7 @@ const setupReviewActions = () => {
     });
 
 
-    document.querySelectorAll('.edit-review-form').forEach(form => {
+    root.querySelectorAll('.edit-review-form').forEach(form => {
         form.addEventListener('submit', async (e) => {
             e.preventDefault();
             const reviewId = form.id.replace('edit-form-', '');
@@ -405,11 +432,13 @@ export const renderDiscoverPage = async (mode = 'discover', filters = {}) => {
         
         statusElement.style.display = 'none';
 
-        if (response.length === 0) {
+        const items = Array.isArray(response) ? response : (response.results || []);
+
+        if (items.length === 0) {
             resultsElement.innerHTML = '<p class="info-message">Filtrelerinizle eşleşen içerik bulunamadı.</p>';
             
         } else {
-            const html = response.map(item => createContentCard(item, item.content_type)).join('');
+            const html = items.map(item => createContentCard(item, item.content_type)).join('');
             resultsElement.innerHTML = html;
         }
 
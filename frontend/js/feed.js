@@ -172,7 +172,7 @@ const createActivityCard = (activity) => {
         footerHtml = `
             <div class="card-footer">
                 <span class="like-count" data-review-id="${interactionObjectId}">${likesCount} Beğeni</span>
-                <button class="action-btn like-review-btn ${likeButtonClass}" data-id="${interactionObjectId}" data-is-liked="${isLiked}">
+                <button class="action-btn like-review-btn ${likeButtonClass}" data-type="rating" data-id="${interactionObjectId}" data-is-liked="${isLiked}">
                     ${likeButtonText}
                 </button> 
                 <button class="action-btn comment-review-btn" data-review-id="${interactionObjectId}">Yorum Yap</button>
@@ -202,7 +202,7 @@ const createActivityCard = (activity) => {
         footerHtml = `
             <div class="card-footer">
                 <span class="like-count" data-review-id="${interactionObjectId}">${likesCount} Beğeni</span>
-                <button class="action-btn like-review-btn ${likeButtonClass}" data-id="${interactionObjectId}" data-is-liked="${isLiked}">
+                <button class="action-btn like-review-btn ${likeButtonClass}" data-type="review" data-id="${interactionObjectId}" data-is-liked="${isLiked}">
                     ${likeButtonText}
                 </button> 
                 <button class="action-btn comment-review-btn" data-review-id="${interactionObjectId}">Yorum Yap</button>
@@ -249,7 +249,7 @@ const setupFeedInteractions = () => {
     document.querySelectorAll('.like-review-btn').forEach(button => {
         button.addEventListener('click', async (e) => {
             const interactionId = e.target.dataset.id;
-            const isLiked = e.target.dataset.isLiked === 'true'; 
+            const interactionType = e.target.dataset.type;
             const countElement = document.querySelector(`.like-count[data-review-id="${interactionId}"]`);
             
             if (!interactionId || interactionId === 'undefined') {
@@ -258,23 +258,20 @@ const setupFeedInteractions = () => {
             }
             
             try {
-                await fetchData(`reviews/${interactionId}/like/`, 'POST'); 
+                const result = await fetchData(`likes/${interactionType}/${interactionId}/`, 'POST'); 
                 
-                let currentCount = parseInt(countElement.textContent.split(' ')[0]);
-                
-                if (isLiked) {
+                if (result.status === 'unliked') {
                     e.target.textContent = 'Beğen';
                     e.target.classList.remove('btn-liked');
                     e.target.classList.add('btn-default');
                     e.target.dataset.isLiked = 'false';
-                    countElement.textContent = `${currentCount - 1} Beğeni`;
                 } else {
                     e.target.textContent = 'Beğendin';
                     e.target.classList.remove('btn-default');
                     e.target.classList.add('btn-liked');
                     e.target.dataset.isLiked = 'true';
-                    countElement.textContent = `${currentCount + 1} Beğeni`;
                 }
+                countElement.textContent = `${result.likes_count} Beğeni`;
                 
             } catch (error) {
                 alert(`Beğeni işlemi başarısız: ${error.message}`);
@@ -13,8 +13,8 @@ export const renderLibraryPage = async () => {
     const userListsElement = document.getElementById('user-lists');
 
     try {
-        const listsResponse = await fetchData('lists/'); 
-        const lists = listsResponse.results || []; 
+        const libraryResponse = await fetchData('library/'); 
+        const lists = libraryResponse.lists || []; 
         libraryStatus.style.display = 'none';
 
         if (lists.length === 0) {
@@ -24,7 +24,7 @@ export const renderLibraryPage = async () => {
 
         let html = '';
         lists.forEach(list => {
-            const itemCount = list.items ? list.items.length : 0; 
+            const itemCount = list.items_count; 
             
             html += `
                 <div class="list-card" data-list-id="${list.id}">
@@ -98,8 +98,9 @@ export const openListModal = async (contentType, objectId) => {
     const listsContainer = document.getElementById('user-lists-container');
     
     try {
-        const listsResponse = await fetchData('lists/'); 
-        let lists = listsResponse.results || [];
+        // Tüm listeler ve içeriğin hangi listelerde olduğu tek istekte gelir.
+        const libraryResponse = await fetchData(`library/?content_type=${contentType.toLowerCase()}&object_id=${objectId}`); 
+        let lists = libraryResponse.lists || [];
 
         const isBook = contentType.toLocaleLowerCase('tr') === 'book';
 
@@ -125,19 +126,15 @@ export const openListModal = async (contentType, objectId) => {
 
         let listsHtml = '';
         for (const list of lists) {
-            const listDetail = await fetchData(`lists/${list.id}/`);
-            
-            const isListed = listDetail.items.some(item => {
-                return item.content_details && parseInt(item.content_details.id) === parseInt(objectId);
-            });
+            const isListed = list.contains_item_id !== null;
             
             const buttonText = isListed ? 'Listeden Çıkar' : 'Listeye Ekle';
             const buttonClass = isListed ? 'btn-remove' : 'btn-add';
 
             listsHtml += `
                 <div class="list-item-control">
-                    <span>${listDetail.name} (${listDetail.items.length})</span>
-                    <button class="${buttonClass}" data-list-id="${list.id}" data-action="${isListed ? 'remove' : 'add'}">${buttonText}</button>
+                    <span>${list.name} (${list.items_count})</span>
+                    <button class="${buttonClass}" data-list-id="${list.id}" data-item-id="${list.contains_item_id ?? ''}" data-action="${isListed ? 'remove' : 'add'}">${buttonText}</button>
                 </div>
             `;
         }
@@ -167,11 +164,12 @@ const handleListAction = async (button, contentType, objectId) => {
     
     try {
         if (action === 'add') {
-            await fetchData('listitems/', 'POST', {
+            const createdItem = await fetchData('listitems/', 'POST', {
                 list: parseInt(listId),
                 content_type: contentType.toLowerCase(),
                 object_id: parseInt(objectId)
             });
+            button.dataset.itemId = createdItem.id;
             
             statusElement.textContent = 'Listeye başarıyla eklendi!';
             
@@ -186,18 +184,12 @@ const handleListAction = async (button, contentType, objectId) => {
             
         } else { 
             
-            const listDetail = await fetchData(`lists/${listId}/`);
-            const itemToRemove = listDetail.items.find(item => 
-                item.content_details && 
-                parseInt(item.content_details.id) === parseInt(objectId)
-            );
+            const itemId = button.dataset.itemId;
             
-            if (!itemToRemove) {
+            if (!itemId) {
                 throw new Error("Çıkarılacak içerik listede bulunamadı.");
             }
             
-            const itemId = itemToRemove.id;
-            
             await fetchData(`listitems/${itemId}/`, 'DELETE', null);
             
             statusElement.textContent = 'Listeden başarıyla çıkarıldı!';
@@ -208,6 +200,7 @@ const handleListAction = async (button, contentType, objectId) => {
             }
 
             button.textContent = 'Listeye Ekle';
+            button.dataset.itemId = '';
             button.dataset.action = 'add';
             button.className = 'btn-add';
         }
@@ -0,0 +1,123 @@
+import logging
+import queue
+import threading
+import time
+import traceback
+from datetime import timedelta
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from .models import Job
+
+
+logger = logging.getLogger(__name__)
+
+HANDLERS = {}
+
+_local_queue = queue.Queue()
+_local_threads = []
+_local_lock = threading.Lock()
+
+
+def handler(name):
+    # İşleyiciler aynı işi birden fazla kez alabilir (en az bir kez teslim); tekrar çalıştırılabilir olmalıdır.
+    def register(func):
+        HANDLERS[name] = func
+        return func
+    return register
+
+
+def run_handler(name, payload):
+    HANDLERS[name](**payload)
+
+
+def enqueue(name, **payload):
+    if name not in HANDLERS:
+        raise KeyError(f"Kayıtlı olmayan iş: {name}")
+
+    backend = settings.JOBS_BACKEND
+    if backend == 'db':
+        # İş satırı yazma işlemiyle aynı transaction'a girer; commit edilmezse iş de oluşmaz.
+        Job.objects.create(name=name, payload=payload)
+    elif backend == 'thread':
+        transaction.on_commit(lambda: _submit_local(name, payload))
+    else:
+        transaction.on_commit(lambda: run_handler(name, payload))
+
+
+def _submit_local(name, payload):
+    with _local_lock:
+        if not _local_threads:
+            for index in range(settings.JOBS_THREAD_WORKERS):
+                thread = threading.Thread(target=_local_worker, name=f"jobs-{index}", daemon=True)
+                thread.start()
+                _local_threads.append(thread)
+    _local_queue.put((name, payload, 0))
+
+
+def _local_worker():
+    while True:
+        name, payload, attempts = _local_queue.get()
+        try:
+            run_handler(name, payload)
+        except Exception:
+            if attempts + 1 < settings.JOBS_MAX_ATTEMPTS:
+                _local_queue.put((name, payload, attempts + 1))
+            else:
+                logger.exception("İş başarısız oldu: %s %s", name, payload)
+        finally:
+            close_old_connections()
+            _local_queue.task_done()
+
+
+def claim_jobs(batch_size):
+    # Süresi dolmuş RUNNING işler (çöken worker) tekrar alınır.
+    now = timezone.now()
+    with transaction.atomic():
+        job_ids = list(
+            Job.objects.select_for_update(skip_locked=True).filter(
+                Q(status=Job.PENDING, run_after__lte=now) | Q(status=Job.RUNNING, locked_until__lt=now)
+            ).order_by('id').values_list('id', flat=True)[:batch_size]
+        )
+        Job.objects.filter(pk__in=job_ids).update(
+            status=Job.RUNNING,
+            attempts=F('attempts') + 1,
+            locked_until=now + timedelta(seconds=settings.JOBS_LOCK_TIMEOUT),
+        )
+    return list(Job.objects.filter(pk__in=job_ids))
+
+
+def run_job(job):
+    try:
+        run_handler(job.name, job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts >= settings.JOBS_MAX_ATTEMPTS:
+            job.status = Job.FAILED
+            logger.error("İş kalıcı olarak başarısız oldu: %s #%s", job.name, job.pk)
+        else:
+            job.status = Job.PENDING
+            job.run_after = timezone.now() + timedelta(seconds=2 ** job.attempts)
+        job.locked_until = None
+        job.save(update_fields=['status', 'run_after', 'locked_until', 'last_error'])
+        return False
+
+    Job.objects.filter(pk=job.pk).delete()
+    return True
+
+
+def work(batch_size=100, poll_interval=1.0, once=False, stop=None):
+    processed = 0
+    while stop is None or not stop.is_set():
+        jobs = claim_jobs(batch_size)
+        for job in jobs:
+            run_job(job)
+            processed += 1
+        close_old_connections()
+
+        if once and not jobs:
+            break
+        if not jobs:
+            time.sleep(poll_interval)
+    return processed
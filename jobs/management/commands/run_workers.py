@@ -0,0 +1,51 @@
+import multiprocessing
+import signal
+import threading
+from django.core.management.base import BaseCommand
+from django.db import connections
+from jobs.dispatch import work
+
+
+def _run_worker(batch_size, poll_interval, once):
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop.set())
+    work(batch_size=batch_size, poll_interval=poll_interval, once=once, stop=stop)
+
+
+class Command(BaseCommand):
+    help = "Veritabanı iş kuyruğundaki (JOBS_BACKEND='db') işleri çalıştıran worker süreçlerini başlatır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=1, help="Çalıştırılacak worker süreci sayısı.")
+        parser.add_argument('--batch-size', type=int, default=100, help="Her turda alınacak en fazla iş sayısı.")
+        parser.add_argument('--poll-interval', type=float, default=1.0, help="Kuyruk boşken beklenecek süre (saniye).")
+        parser.add_argument('--once', action='store_true', help="Kuyruk boşalınca çık.")
+
+    def handle(self, *args, **options):
+        worker_args = (options['batch_size'], options['poll_interval'], options['once'])
+
+        if options['processes'] <= 1:
+            processed = work(*worker_args)
+            self.stdout.write(self.style.SUCCESS(f"{processed} iş çalıştırıldı."))
+            return
+
+        # Alt süreçler üst sürecin veritabanı bağlantılarını paylaşmamalıdır.
+        connections.close_all()
+        workers = [
+            multiprocessing.Process(target=_run_worker, args=worker_args, name=f"jobs-worker-{index}")
+            for index in range(options['processes'])
+        ]
+        for process in workers:
+            process.start()
+        self.stdout.write(f"{len(workers)} worker başlatıldı.")
+
+        try:
+            for process in workers:
+                process.join()
+        except KeyboardInterrupt:
+            for process in workers:
+                process.terminate()
+            for process in workers:
+                process.join()
+
+        self.stdout.write(self.style.SUCCESS("Worker'lar durdu."))
@@ -0,0 +1,125 @@
+import io
+import threading
+from datetime import timedelta
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
+from .dispatch import claim_jobs, enqueue, handler, run_job, work
+from .models import Job
+
+
+calls = []
+
+
+@handler('jobs.test_record')
+def record(value):
+    calls.append(value)
+
+
+@handler('jobs.test_fail')
+def fail():
+    raise ValueError("bozuk iş")
+
+
+@override_settings(JOBS_BACKEND='db', JOBS_MAX_ATTEMPTS=3, JOBS_LOCK_TIMEOUT=60)
+class JobQueueTests(TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_enqueue_writes_job_row(self):
+        enqueue('jobs.test_record', value=1)
+        job = Job.objects.get()
+        self.assertEqual((job.name, job.payload, job.status, job.attempts), ('jobs.test_record', {'value': 1}, Job.PENDING, 0))
+        self.assertEqual(calls, [])
+        with self.assertRaises(KeyError):
+            enqueue('jobs.missing')
+
+    def test_claimed_jobs_are_not_claimed_again(self):
+        jobs = [Job.objects.create(name='jobs.test_record', payload={'value': index}) for index in range(3)]
+        Job.objects.create(name='jobs.test_record', payload={'value': 9}, run_after=timezone.now() + timedelta(hours=1))
+
+        claimed = claim_jobs(2)
+        self.assertEqual([job.pk for job in claimed], [jobs[0].pk, jobs[1].pk])
+        self.assertTrue(all(job.status == Job.RUNNING and job.attempts == 1 for job in claimed))
+        self.assertGreater(claimed[0].locked_until, timezone.now() + timedelta(seconds=50))
+
+        self.assertEqual([job.pk for job in claim_jobs(10)], [jobs[2].pk])
+        self.assertEqual(claim_jobs(10), [])
+
+    def test_expired_running_job_is_reclaimed(self):
+        # Worker iş ortasında çöktüyse kilit süresi dolunca iş başka bir worker'a geçer.
+        now = timezone.now()
+        crashed = Job.objects.create(name='jobs.test_record', payload={'value': 1}, status=Job.RUNNING,
+                                     attempts=1, locked_until=now - timedelta(seconds=1))
+        Job.objects.create(name='jobs.test_record', payload={'value': 2}, status=Job.RUNNING,
+                           attempts=1, locked_until=now + timedelta(minutes=1))
+
+        claimed = claim_jobs(10)
+        self.assertEqual([(job.pk, job.attempts) for job in claimed], [(crashed.pk, 2)])
+        self.assertTrue(run_job(claimed[0]))
+        self.assertEqual(calls, [1])
+        self.assertFalse(Job.objects.filter(pk=crashed.pk).exists())
+
+    def test_failures_back_off_exponentially_then_fail(self):
+        job = Job.objects.create(name='jobs.test_fail')
+        for attempt in (1, 2):
+            Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+            claimed, = claim_jobs(10)
+            started = timezone.now()
+            self.assertFalse(run_job(claimed))
+
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts, job.locked_until), (Job.PENDING, attempt, None))
+            self.assertIn("bozuk iş", job.last_error)
+            delay = timedelta(seconds=2 ** attempt)
+            self.assertTrue(started + delay <= job.run_after <= timezone.now() + delay)
+            # Bekleme süresi dolmadan iş tekrar alınmaz.
+            self.assertEqual(claim_jobs(10), [])
+
+        Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+        with self.assertLogs('jobs.dispatch', 'ERROR'):
+            self.assertFalse(run_job(claim_jobs(10)[0]))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.FAILED, 3))
+        self.assertEqual(claim_jobs(10), [])
+
+    def test_run_workers_once_drains_queue(self):
+        for value in range(3):
+            enqueue('jobs.test_record', value=value)
+        enqueue('jobs.test_fail')
+
+        out = io.StringIO()
+        call_command('run_workers', '--once', '--batch-size', '2', stdout=out)
+        self.assertIn("4 iş çalıştırıldı.", out.getvalue())
+        self.assertEqual(calls, [0, 1, 2])
+        # Başarısız iş beklemeye alınır; tek geçişlik çalışma onu beklemez.
+        self.assertEqual(list(Job.objects.values_list('name', 'status')), [('jobs.test_fail', Job.PENDING)])
+        self.assertEqual(work(once=True), 0)
+
+
+@override_settings(JOBS_BACKEND='db')
+@skipUnlessDBFeature('has_select_for_update_skip_locked')
+class SkipLockedClaimTests(TransactionTestCase):
+    def test_concurrent_claims_skip_locked_rows(self):
+        jobs = [Job.objects.create(name='jobs.test_record', payload={'value': index}) for index in range(4)]
+        locked = threading.Event()
+        release = threading.Event()
+
+        def hold_first_two():
+            # İkinci worker'ın claim işlemi sürerken ilk iki satır kilitli tutulur.
+            with transaction.atomic():
+                list(Job.objects.select_for_update().filter(pk__in=[jobs[0].pk, jobs[1].pk]))
+                locked.set()
+                release.wait(10)
+            connection.close()
+
+        holder = threading.Thread(target=hold_first_two)
+        holder.start()
+        try:
+            locked.wait(10)
+            claimed = claim_jobs(10)
+        finally:
+            release.set()
+            holder.join(10)
+        self.assertEqual([job.pk for job in claimed], [jobs[2].pk, jobs[3].pk])
@@ -0,0 +1,30 @@
+from itertools import islice
+from django.db import connection
+
+
+def keyset_chunks(queryset, chunk_size, *fields, **expressions):
+    # MySQL sürücüleri iterator() kullanılsa da sonucun tamamını belleğe alır; sabit bellek için
+    # kayıtlar birincil anahtar üzerinden (id > son_id) parça parça okunur.
+    last_pk = 0
+    while True:
+        rows = list(queryset.filter(pk__gt=last_pk).order_by('pk').values('id', *fields, **expressions)[:chunk_size])
+        if not rows:
+            return
+        last_pk = rows[-1]['id']
+        yield rows
+        if len(rows) < chunk_size:
+            return
+
+
+def batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def upsert_options(unique_fields, update_fields):
+    # MySQL/MariaDB çakışma hedefi belirtmeye izin vermez; benzersiz kısıt ON DUPLICATE KEY ile yakalanır.
+    options = {'update_conflicts': True, 'update_fields': update_fields}
+    if connection.features.supports_update_conflicts_with_target:
+        options['unique_fields'] = unique_fields
+    return options
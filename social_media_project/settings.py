@@ -43,6 +43,8 @@ INSTALLED_APPS = [
     'content',
     'feed',
     'api',
+    'jobs',
+    'caching',
     'rest_framework',
     'rest_framework.authtoken',
     'dj_rest_auth',
@@ -62,6 +64,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'allauth.account.middleware.AccountMiddleware', 
+    'api.middleware.QueryMetricsMiddleware',
 ]
 
 ROOT_URLCONF = 'social_media_project.urls'
@@ -98,6 +101,27 @@ DATABASES = {
     }
 }
 
+# Paylaşılan katman: tüm worker süreçleri aynı önbelleği görür. REDIS_URL verilirse Redis kullanılır.
+# 'local' katmanı süreç içi LRU önbellektir (caching.tiered.TieredCache).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'django_cache',
+        'OPTIONS': {'MAX_ENTRIES': 50000},
+    },
+    'local': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tiered-local',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
+if os.environ.get('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['REDIS_URL'],
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -144,7 +168,7 @@ AUTH_USER_MODEL = 'users.CustomUser'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework.authentication.TokenAuthentication', 
+        'api.authentication.CachedTokenAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
@@ -178,4 +202,77 @@ TMDB_API_KEY = "46c62a30b0d26eae4d273eb302ef8cb6"
 
 SITE_ID = 1
 
-PASSWORD_RESET_CONFIRM_URL = 'http://localhost:8080/#reset-password-confirm/{uid}/{token}'
\ No newline at end of file
+PASSWORD_RESET_CONFIRM_URL = 'http://localhost:8080/#reset-password-confirm/{uid}/{token}'
+
+FEED_FANOUT_FOLLOWER_LIMIT = 10000
+
+FEED_BACKFILL_LIMIT = 200
+
+DISCOVERY_CACHE_TTL = 60 * 15
+
+CONTENT_DETAIL_CACHE_TTL = 60 * 10
+
+SEARCH_CACHE_TTL = 60 * 5
+
+# Bir aramada indeksten okunan en fazla aday satırı; sorgu kelimeleri arasında eşit paylaştırılır.
+SEARCH_MAX_CANDIDATES = 5000
+
+PROFILE_CACHE_TTL = 60 * 10
+
+DISCOVERY_TRENDING_WINDOW_DAYS = 7
+
+DISCOVERY_TRENDING_HALF_LIFE_HOURS = 24
+
+GOOGLE_BOOKS_API_URL = "https://www.googleapis.com/books/v1/volumes"
+
+TMDB_API_URL = "https://api.themoviedb.org/3"
+
+CATALOG_IMPORT_WORKERS = 8
+
+CATALOG_IMPORT_RATE = 20
+
+
+CATALOG_CACHE_PATH = BASE_DIR / 'catalog_cache.sqlite3'
+
+CATALOG_CACHE_TTL = 60 * 60 * 24
+
+CATALOG_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# 'db': kalıcı iş tablosu, `manage.py run_workers` ile çalıştırılır; üretimde kullanılması gereken tek seçenektir.
+# 'sync' (yan etkiler commit sonrası istek içinde çalışır) ve 'thread' (süreç içi worker thread'leri) yalnızca
+# geliştirme içindir: süreç çökerse ya da iş hata verirse iş kaybolur, yeniden denenmez.
+JOBS_BACKEND = os.environ.get('JOBS_BACKEND', 'sync' if DEBUG else 'db')
+
+JOBS_THREAD_WORKERS = 2
+
+JOBS_MAX_ATTEMPTS = 5
+
+JOBS_LOCK_TIMEOUT = 60 * 5
+
+API_METRICS_ENABLED = True
+
+API_METRICS_PATH_PREFIX = '/api/'
+
+CACHE_VIEWS_ENABLED = True
+
+# Taze süresi (soft TTL) geçen kayıtlar bu kadar süre daha eski haliyle dönülür ve arka planda yenilenir.
+CACHE_STALE_TTL = 60 * 5
+
+CACHE_BACKGROUND_REFRESH = True
+
+CACHE_REFRESH_WORKERS = 2
+
+CACHE_LOCK_TIMEOUT = 30
+
+CACHE_LOCK_WAIT = 5
+
+AUTH_TOKEN_CACHE_TTL = 60
+
+# Açılırsa token ile eşleşen kullanıcı satırı (parola özeti dahil) paylaşılan önbelleğe de yazılır.
+AUTH_TOKEN_SHARED_CACHE = False
+
+# /api/ratings/bulk/, /api/listitems/bulk/ ve /api/follows/bulk/ için istek başına satır sınırı.
+BULK_WRITE_MAX_ITEMS = 5000
+
+# /api/export/ ve export_user_data komutunda tek sorguda okunan kayıt sayısı.
+EXPORT_CHUNK_SIZE = 1000
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 10:15
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_follow_counts(apps, schema_editor):
+    CustomUser = apps.get_model('users', 'CustomUser')
+    Follow = apps.get_model('feed', 'Follow')
+
+    def follow_count(user_field):
+        counts = Follow.objects.filter(**{user_field: models.OuterRef('pk')}).order_by().values(
+            user_field
+        ).annotate(total=models.Count('pk')).values('total')
+        return Coalesce(models.Subquery(counts, output_field=models.IntegerField()), models.Value(0))
+
+    CustomUser.objects.update(
+        followers_count=follow_count('following'),
+        following_count=follow_count('follower'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_alter_customuser_managers'),
+        ('feed', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='following_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_follow_counts, migrations.RunPython.noop),
+    ]
@@ -15,5 +15,13 @@ class CustomUser(AbstractUser):
     bio = models.TextField(blank=True, null=True)
     avatar_url = models.URLField(max_length=200, blank=True, null=True) 
 
+    followers_count = models.PositiveIntegerField(default=0)
+    following_count = models.PositiveIntegerField(default=0)
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(fields=['email'], name='users_customuser_email'),
+        ]
+
     def __str__(self):
         return self.username
\ No newline at end of file